@@ -39,3 +39,15 @@ SAMPLE_PDF_DIR = os.path.join(BASE_DIR, 'sample_pdf')
 
 # Pfad zum Export-Verzeichnis
 EXPORT_DIR = os.path.join(BASE_DIR, 'export_folder')
+
+# Pfad zum Cache-Verzeichnis für Vorschaubilder (bleibt zwischen Sitzungen erhalten)
+THUMB_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdf_tool', 'thumbs')
+
+# Maximale Größe des Vorschaubild-Caches in Bytes (älteste Einträge werden zuerst gelöscht)
+THUMB_CACHE_LIMIT = 500 * 1024 * 1024
+
+# Pfad zum Cache-Verzeichnis für gerenderte Seiten der PDF-Vorschau
+PAGE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdf_tool', 'pages')
+
+# Maximale Größe des Seiten-Caches in Bytes (älteste Einträge werden zuerst gelöscht)
+PAGE_CACHE_LIMIT = 1024 * 1024 * 1024
@@ -45,7 +45,7 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QGridLayout, QPushButton,
     QStackedWidget, QHBoxLayout, QLabel, QMessageBox, QApplication, QFrame, QFileDialog, QAction
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThreadPool
 from PyQt5.QtGui import QFont
 import os
 
@@ -53,6 +53,8 @@ from pdf_tool.gui_components import (
     HomeWidget, PDFPreviewWidget, PDFSplitWidget, PDFMergeWidget,
     PDFToWordWidget, PDFImageExtractorWidget, EInvoiceReaderWidget
 )
+from pdf_tool.utils import prewarm_pdf_to_word
+from pdf_tool.utils.render_pool import get_render_thread_pool
 
 class MainWindow(QMainWindow):
     """
@@ -75,6 +77,8 @@ class MainWindow(QMainWindow):
         - Anzeige kontextabhängiger Aktionen
         - Styling und Layout-Management
     """
+    pdf_changed = pyqtSignal(str)  # Neuer PDF-Pfad ("" nach dem Schließen)
+
     def __init__(self, parent=None):
         """Initialisiert das Hauptfenster und setzt alle UI-Komponenten auf."""
         super().__init__(parent)
@@ -94,6 +98,9 @@ class MainWindow(QMainWindow):
         # Aktuelle PDF-Datei
         self.current_pdf_path = None
         
+        # Aktuell angezeigte Aktions-Buttons (Button-Text -> QPushButton)
+        self.action_buttons = {}
+        
         # Erstelle das zentrale Widget und Hauptlayout
         central_widget = QWidget()
         main_layout = QHBoxLayout()  # Horizontales Layout für Buttons links, Inhalt rechts
@@ -184,6 +191,9 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(self.page_split_pdf)
         self.stacked_widget.addWidget(self.page_zugferd)
         
+        # Widgets über Wechsel der PDF informieren, statt bei jedem Anzeigen nachzufragen
+        self.pdf_changed.connect(self.page_pdf_to_word.set_current_pdf)
+        
         # Verbinde die Buttons mit ihren jeweiligen Funktionen
         open_file_button.clicked.connect(self.page_pdf_preview.open_file_dialog)
         split_pdf_button.clicked.connect(self.start_pdf_split)
@@ -199,6 +209,9 @@ class MainWindow(QMainWindow):
         
         # Wende das definierte Stylesheet auf das Fenster an
         self.apply_stylesheet()
+        
+        # pdf2docx erst vorladen, wenn das Fenster steht (läuft in eigenem Prozess)
+        QTimer.singleShot(0, self._prewarm_pdf_to_word)
 
         self.create_menu()
 
@@ -249,6 +262,13 @@ class MainWindow(QMainWindow):
         button.setMinimumHeight(40)  # Minimale Höhe
         return button
 
+    def _prewarm_pdf_to_word(self):
+        """Startet das Vorladen von pdf2docx für eine schnellere erste Konvertierung."""
+        try:
+            self.prewarm_process = prewarm_pdf_to_word()
+        except Exception:
+            pass                                # Rein optional
+
     def enable_function_buttons(self):
         """Aktiviert alle Funktions-Buttons nachdem eine Datei geladen wurde."""
         for button in self.function_buttons.values():
@@ -280,7 +300,9 @@ class MainWindow(QMainWindow):
 
     def set_current_pdf(self, pdf_path):
         """Setzt den Pfad zur aktuell geöffneten PDF-Datei."""
-        self.current_pdf_path = pdf_path
+        if pdf_path != self.current_pdf_path:
+            self.current_pdf_path = pdf_path
+            self.pdf_changed.emit(pdf_path)
         # Aktiviere die Funktions-Buttons
         self.enable_function_buttons()
         
@@ -331,10 +353,12 @@ class MainWindow(QMainWindow):
             self.action_buttons_layout.itemAt(i).widget().setParent(None)
         
         # Füge neue Buttons hinzu
+        self.action_buttons = {}
         for text, callback in button_configs:
             button = self.create_tile_button(text)
             button.clicked.connect(callback)
             self.action_buttons_layout.addWidget(button)
+            self.action_buttons[text] = button    # Für direkten Zugriff merken
         
         # Zeige Trennlinie und Container
         self.action_separator.show()
@@ -366,9 +390,27 @@ class MainWindow(QMainWindow):
         self.action_separator.hide()
         self.action_buttons_container.hide()
 
+    def closeEvent(self, event):
+        """
+        Beendet alle Hintergrundarbeiten, bevor das Fenster geschlossen wird:
+        laufende Konvertierungen, Aufteilung, Bildextraktion, Zusammenführen
+        und die Render-Aufträge im globalen und im Render-Thread-Pool.
+        """
+        self.page_pdf_to_word.stop_conversions()
+        self.page_split_pdf.stop_split()
+        self.page_extract_images.stop_workers()
+        self.page_merge_pdf.stop_merge()
+        if hasattr(self, 'pdf_merge_widget'):
+            self.pdf_merge_widget.stop_merge()
+        for pool in (QThreadPool.globalInstance(), get_render_thread_pool()):
+            pool.clear()                            # Noch nicht gestartete Aufträge verwerfen
+            pool.waitForDone()                      # Laufende Aufträge abschließen lassen
+        super().closeEvent(event)
+
     def close_current_pdf(self):
         """Schließt die aktuell geöffnete PDF-Datei."""
         self.current_pdf_path = None
+        self.pdf_changed.emit("")
         # Deaktiviere alle Funktions-Buttons
         for button in self.function_buttons.values():
             button.setEnabled(False)
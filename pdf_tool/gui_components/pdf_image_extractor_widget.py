@@ -43,39 +43,71 @@ Autor: Team A2-2
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox, 
-    QScrollArea, QGridLayout, QFrame, QHBoxLayout, QSizePolicy, QComboBox
+    QScrollArea, QGridLayout, QFrame, QHBoxLayout, QSizePolicy, QComboBox,
+    QProgressDialog
+)
+from PyQt5.QtGui import QPixmap, QImageReader
+from PyQt5.QtCore import Qt, QSize, QThread, QTimer, pyqtSignal
+from ..utils.pdf_functions import (
+    EXPORT_DIR, extract_images_from_pdf_parallel, extract_images_iter,
+    extract_images_to_zip_stream, show_pdf_open_dialog
 )
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QSize
-from ..utils.pdf_functions import extract_images_from_pdf, show_pdf_open_dialog
 import os
-import tempfile
-import zipfile
+import threading
+from collections import deque
+
+# Gemeinsames Stylesheet für den Vorschau-Container und alle Bildkacheln.
+# Wird nur einmal am Container gesetzt, statt pro Kachel neu geparst zu werden.
+THUMB_STYLESHEET = """
+    QWidget {
+        background-color: #e5e5e5;
+    }
+    QLabel#thumb {
+        border: 1px solid #cccccc;
+        background-color: white;
+        padding: 10px;
+    }
+"""
 
 class ImageContainer(QWidget):
-    """Container für ein einzelnes Bild mit fester Größe."""
-    def __init__(self, image_path, parent=None):
+    """
+    Container für ein einzelnes Bild mit fester Größe.
+    
+    Im verzögerten Modus (deferred=True) wird zunächst nur ein Platzhalter
+    angezeigt; das Bild wird erst beim Aufruf von load() dekodiert.
+    """
+    def __init__(self, image_path, parent=None, deferred=False):
         super().__init__(parent)
         self.setFixedSize(200, 200)  # Größere Kacheln für bessere Platznutzung
+        self.image_path = image_path  # Pfad zum Bild
+        self.loaded = False           # Ob das Bild bereits dekodiert wurde
         
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        # Label für das Bild
-        self.image_label = QLabel()
+        # Label für das Bild, direkt über die gesamte Kachel gelegt (ohne eigenes Layout)
+        self.image_label = QLabel(self)
+        self.image_label.setGeometry(0, 0, 200, 200)
         self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #cccccc;
-                background-color: white;
-                padding: 10px;
-            }
-        """)
-        layout.addWidget(self.image_label)
+        self.image_label.setObjectName("thumb")  # Stil kommt aus THUMB_STYLESHEET des Containers
         
-        # Lade das Bild
-        pixmap = QPixmap(image_path)
+        if deferred:
+            self.image_label.setText("Vorschau\nwird geladen...")  # Platzhalter
+        else:
+            self.load()
+
+    def load(self):
+        """Dekodiert das Bild und zeigt es skaliert im Container an."""
+        if self.loaded:
+            return
+        self.loaded = True
+        
+        # Lade das Bild bereits beim Dekodieren verkleinert (z.B. JPEG-DCT-Skalierung),
+        # statt es zunächst in voller Auflösung in den Speicher zu laden
+        reader = QImageReader(self.image_path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid() and max(source_size.width(), source_size.height()) > 2 * 180:
+            source_size.scale(2 * 180, 2 * 180, Qt.KeepAspectRatio)
+            reader.setScaledSize(source_size)
+        pixmap = QPixmap.fromImage(reader.read())
         if not pixmap.isNull():
             # Skaliere das Bild auf 180x180 (200 - 2*10 padding)
             scaled_pixmap = pixmap.scaled(
@@ -87,6 +119,72 @@ class ImageContainer(QWidget):
         else:
             self.image_label.setText("Vorschau\nnicht verfügbar")
 
+class ExtractWorker(QThread):
+    """Thread für die schrittweise Extraktion der Vorschaubilder."""
+    image_ready = pyqtSignal(int, str)  # Signal mit Bildindex und Bildpfad
+    error = pyqtSignal(str)             # Signal mit Fehlermeldung
+
+    def __init__(self, pdf_path, parent=None):
+        """Initialisiert den Extraktions-Thread."""
+        super().__init__(parent)
+        self.pdf_path = pdf_path        # Pfad zur PDF-Datei
+        self.cancel_event = threading.Event()  # Wird beim Abbruch gesetzt
+
+    def stop(self):
+        """Bricht die Extraktion nach dem aktuellen Bild ab."""
+        self.cancel_event.set()
+
+    def run(self):
+        """Extrahiert die Bilder und meldet jedes einzeln per Signal."""
+        try:
+            images = extract_images_iter(self.pdf_path, preview_only=True,
+                                         cancel_event=self.cancel_event)
+            for index, image_path in enumerate(images):
+                if self.cancel_event.is_set():  # Abbruch angefordert
+                    images.close()
+                    break
+                self.image_ready.emit(index, image_path)  # Bild an GUI melden
+        except Exception as e:
+            if not self.cancel_event.is_set():
+                self.error.emit(str(e))         # Fehler an GUI melden
+
+class ExportWorker(QThread):
+    """Thread für den Export der Bilder in ein Verzeichnis oder eine ZIP-Datei."""
+    progress = pyqtSignal(int, int)     # Signal mit aktuellem Bild und Gesamtanzahl
+    done = pyqtSignal(int)              # Signal mit Anzahl der exportierten Bilder
+    error = pyqtSignal(str)             # Signal mit Fehlermeldung
+
+    def __init__(self, pdf_path, output_dir=None, zip_path=None, parent=None):
+        """Initialisiert den Export-Thread."""
+        super().__init__(parent)
+        self.pdf_path = pdf_path        # Pfad zur PDF-Datei
+        self.output_dir = output_dir    # Zielverzeichnis für Einzelbilder
+        self.zip_path = zip_path        # Zielpfad für das ZIP-Archiv
+        self.cancel_event = threading.Event()  # Wird beim Abbruch gesetzt
+
+    def stop(self):
+        """Fordert den Abbruch des Exports an."""
+        self.cancel_event.set()
+
+    def run(self):
+        """Führt den Export durch und meldet das Ergebnis per Signal."""
+        try:
+            if self.zip_path:
+                image_count = extract_images_to_zip_stream(
+                    self.pdf_path, self.zip_path,
+                    progress_cb=self.progress.emit, cancel_event=self.cancel_event
+                )
+            else:
+                image_count = len(extract_images_from_pdf_parallel(
+                    self.pdf_path, self.output_dir,
+                    progress_cb=self.progress.emit, cancel_event=self.cancel_event
+                ))
+            if not self.cancel_event.is_set():
+                self.done.emit(image_count)     # Ergebnis an GUI melden
+        except Exception as e:
+            if not self.cancel_event.is_set():
+                self.error.emit(str(e))         # Fehler an GUI melden
+
 class PDFImageExtractorWidget(QWidget):
     """
     Widget zur Extraktion von Bildern aus PDF-Dateien.
@@ -123,6 +221,14 @@ class PDFImageExtractorWidget(QWidget):
         """
         super().__init__(parent)
         self.stacked_widget = stacked_widget
+        self.extract_worker = None                      # Thread für die Vorschau-Extraktion
+        self.preview_count = 0                          # Anzahl der angezeigten Vorschaubilder
+        self.preview_failed = False                     # Fehler bei der letzten Vorschau
+        self.incoming_thumbs = []                       # Noch nicht eingefügte Vorschaubilder
+        self.pending_thumbs = deque()                   # Noch nicht dekodierte Vorschaubilder
+        self.thumb_load_scheduled = False               # Ob ein Ladeschritt ansteht
+        self.export_worker = None                       # Thread für den Bildexport
+        self.export_dialog = None                       # Fortschrittsdialog des Exports
         
         # Layout erstellen
         layout = QVBoxLayout()                          # Hauptlayout für vertikale Anordnung
@@ -130,80 +236,226 @@ class PDFImageExtractorWidget(QWidget):
         layout.setSpacing(20)                          # Abstand zwischen Elementen: 20px
 
         # Scroll-Bereich für die Bildvorschauen
-        scroll_area = QScrollArea()                    # Scrollbarer Bereich für große Bildmengen
-        scroll_area.setWidgetResizable(True)           # Automatische Größenanpassung
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # Horizontale Scrollbar bei Bedarf
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)    # Vertikale Scrollbar bei Bedarf
+        self.scroll_area = QScrollArea()               # Scrollbarer Bereich für große Bildmengen
+        self.scroll_area.setWidgetResizable(True)      # Automatische Größenanpassung
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # Horizontale Scrollbar bei Bedarf
+        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)    # Vertikale Scrollbar bei Bedarf
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._prioritize_visible_thumbs)  # Sichtbare zuerst laden
         
-        # Container für das Grid
+        # Container mit Grid für die Vorschaubilder
+        self._build_preview_container()
+        
+        # Initial-Label für Statusanzeige
+        self._show_message("Keine Bilder gefunden.")  # Standardtext bei leerer Ansicht
+        
+        # Layout zusammenbauen
+        self.scroll_area.setWidget(self.preview_container)  # Container in Scroll-Bereich einsetzen
+        layout.addWidget(self.scroll_area, 1)         # Scroll-Bereich mit Stretch-Faktor 1
+        
+        # Nicht-blockierende Statusmeldung unter der Vorschau (initial versteckt)
+        self.status_toast = QLabel()                  # Label für kurze Rückmeldungen
+        self.status_toast.setAlignment(Qt.AlignCenter)  # Zentrierte Textausrichtung
+        self.status_toast.setWordWrap(True)           # Zeilenumbruch aktivieren
+        self.status_toast.hide()
+        layout.addWidget(self.status_toast)
+        
+        # Timer zum automatischen Ausblenden der Statusmeldung
+        self.toast_timer = QTimer(self)
+        self.toast_timer.setSingleShot(True)
+        self.toast_timer.timeout.connect(self.status_toast.hide)
+        
+        self.setLayout(layout)                        # Layout dem Widget zuweisen
+
+    def _build_preview_container(self):
+        """
+        Erstellt einen neuen, leeren Container mit Grid-Layout für die Vorschaubilder.
+        
+        Der Container wird als Ganzes ausgetauscht, statt die Kacheln einzeln
+        aus dem Layout zu entfernen.
+        """
         self.preview_container = QWidget()             # Container für das Vorschauraster
-        self.preview_container.setStyleSheet("""
-            QWidget {
-                background-color: #e5e5e5;
-            }
-        """)                                          # Grauer Hintergrund für besseren Kontrast
+        self.preview_container.setStyleSheet(THUMB_STYLESHEET)  # Grauer Hintergrund, weiße Kacheln
         
         # Grid-Layout für Bildvorschauen
         self.grid_layout = QGridLayout(self.preview_container)  # Rasteranordnung der Bilder
         self.grid_layout.setSpacing(15)               # Abstand zwischen den Bildern: 15px
         self.grid_layout.setContentsMargins(15, 15, 15, 15)  # Einheitliche Ränder: 15px
         self.grid_layout.setAlignment(Qt.AlignTop)    # Ausrichtung am oberen Rand
+
+    def _toast(self, text, ms=3000, kind="ok"):
+        """
+        Zeigt eine kurze Statusmeldung an, ohne die Ereignisschleife zu blockieren.
         
-        # Initial-Label für Statusanzeige
-        self.initial_label = QLabel("Keine Bilder gefunden.")  # Standardtext bei leerer Ansicht
-        self.initial_label.setAlignment(Qt.AlignCenter)        # Zentrierte Textausrichtung
-        self.grid_layout.addWidget(self.initial_label, 0, 0, 1, 3)  # Über drei Spalten zentriert
+        Args:
+            text (str): Anzuzeigender Text
+            ms (int): Anzeigedauer in Millisekunden
+            kind (str): "ok" für Erfolgs-, "err" für Fehlermeldungen
+        """
+        background = "#dff0d8" if kind == "ok" else "#f2dede"  # Grün bei Erfolg, rot bei Fehler
+        border = "#3c763d" if kind == "ok" else "#a94442"
+        self.status_toast.setStyleSheet(f"""
+            QLabel {{
+                background-color: {background};
+                border: 1px solid {border};
+                border-radius: 3px;
+                padding: 8px;
+            }}
+        """)
+        self.status_toast.setText(text)
+        self.status_toast.show()
+        self.toast_timer.start(ms)                    # Vorherigen Timer ggf. neu starten
+
+    def _show_message(self, text):
+        """
+        Zeigt einen zentrierten Hinweistext im aktuellen Vorschau-Container an.
         
-        # Layout zusammenbauen
-        scroll_area.setWidget(self.preview_container)  # Container in Scroll-Bereich einsetzen
-        layout.addWidget(scroll_area, 1)              # Scroll-Bereich mit Stretch-Faktor 1
-        self.setLayout(layout)                        # Layout dem Widget zuweisen
+        Args:
+            text (str): Anzuzeigender Hinweistext
+        """
+        self.initial_label = QLabel(text)             # Label für Statusanzeige
+        self.initial_label.setAlignment(Qt.AlignCenter)  # Zentrierte Textausrichtung
+        self.grid_layout.addWidget(self.initial_label, 0, 0, 1, 3)  # Über drei Spalten zentriert
 
     def show_preview(self):
         """
         Zeigt eine Vorschau der Bilder aus der aktuellen PDF.
         
-        Extrahiert alle Bilder aus der aktuell geöffneten PDF und zeigt sie
-        in einem Raster an. Die Bilder werden temporär gespeichert und beim
-        Beenden der Anwendung automatisch gelöscht.
-        
-        Raises:
-            Exception: Wenn die Bilder nicht geladen werden können
+        Extrahiert alle Bilder aus der aktuell geöffneten PDF in einem
+        Hintergrund-Thread und fügt sie dem Raster hinzu, sobald sie bereit
+        sind. Die Bilder werden temporär gespeichert und beim Beenden der
+        Anwendung automatisch gelöscht.
         """
         main_window = self.window()                   # Referenz auf Hauptfenster
         pdf_path = main_window.get_current_pdf()      # Pfad der aktuellen PDF
         
+        # Laufende Extraktion einer vorherigen Vorschau abbrechen
+        self._cancel_preview_worker()
+        
+        # Bestehende Vorschaubilder entfernen: alten Container komplett austauschen
+        self.incoming_thumbs.clear()                  # Noch nicht eingefügte Bilder verwerfen
+        self.pending_thumbs.clear()                   # Ausstehende Ladevorgänge verwerfen
+        old_container = self.scroll_area.takeWidget()  # Alten Container aus Scroll-Bereich lösen
+        self._build_preview_container()               # Neuen, leeren Container erstellen
+        self.scroll_area.setWidget(self.preview_container)  # Neuen Container einsetzen
+        if old_container:
+            old_container.deleteLater()               # Alten Container samt Kacheln entfernen
+        
         if not pdf_path:
-            self.initial_label.setText("Keine PDF-Datei geöffnet.")  # Info wenn keine PDF geladen
+            self._show_message("Keine PDF-Datei geöffnet.")  # Info wenn keine PDF geladen
             return
 
+        # Extrahiere Bilder im Hintergrund und zeige sie an, sobald sie bereit sind
+        self.preview_count = 0
+        self.preview_failed = False
+        self.extract_worker = ExtractWorker(pdf_path, self)  # Thread pro Vorschau
+        self.extract_worker.image_ready.connect(self._add_thumb)
+        self.extract_worker.error.connect(self._on_preview_error)
+        self.extract_worker.finished.connect(self._on_preview_finished)
+        self.extract_worker.finished.connect(self.extract_worker.deleteLater)
+        self.extract_worker.start()
+
+    def _cancel_preview_worker(self):
+        """Bricht eine laufende Vorschau-Extraktion ab und trennt ihre Signale."""
+        if not self.extract_worker:
+            return
+        worker = self.extract_worker
+        self.extract_worker = None
+        worker.image_ready.disconnect(self._add_thumb)
+        worker.error.disconnect(self._on_preview_error)
+        worker.finished.disconnect(self._on_preview_finished)
+        worker.stop()                                 # Thread räumt sich selbst auf
+
+    def stop_workers(self):
+        """
+        Bricht Vorschau-Extraktion und Export ab und wartet auf das Ende aller
+        Threads. Wird beim Schließen des Hauptfensters aufgerufen, damit kein
+        Thread mit dem Widget zerstört wird, solange er noch läuft.
+        
+        Bereits zuvor abgebrochene Threads sind vom Widget gelöst, aber noch
+        dessen Kinder; gewartet wird daher auf alle Kind-Threads.
+        """
+        self._cancel_preview_worker()
+        self._on_export_canceled()
+        for worker in self.findChildren(QThread):
+            worker.wait()
+
+    def _add_thumb(self, index, image_path):
+        """
+        Nimmt ein neues Vorschaubild entgegen und plant dessen Einfügen ein.
+        
+        Bilder, die innerhalb eines Durchlaufs der Ereignisschleife eintreffen,
+        werden gesammelt und gemeinsam in das Grid eingefügt.
+        
+        Args:
+            index (int): Laufende Nummer des Bildes (0-basiert)
+            image_path (str): Pfad zum extrahierten Bild
+        """
+        self.incoming_thumbs.append((index, image_path))
+        self.preview_count += 1
+        if len(self.incoming_thumbs) == 1:
+            QTimer.singleShot(0, self._flush_thumbs)  # Einfügen im nächsten Durchlauf
+
+    def _flush_thumbs(self):
+        """Fügt alle gesammelten Vorschaubilder mit nur einem Layout-Durchlauf ein."""
+        if not self.incoming_thumbs:
+            return
+        
+        # Zwischenzeitliche Neuberechnungen und Repaints unterdrücken
+        self.preview_container.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
         try:
-            # Bestehende Vorschaubilder entfernen
-            while self.grid_layout.count():           # Iteriere über alle Widgets
-                item = self.grid_layout.takeAt(0)     # Entferne Widget aus Layout
-                if item.widget():
-                    item.widget().deleteLater()       # Widget aus Speicher entfernen
-
-            # Extrahiere Bilder für die Vorschau
-            images = extract_images_from_pdf(pdf_path, preview_only=True)  # Temporäre Extraktion
-            
-            if images:
-                # Bilder in einem Grid mit 3 Spalten anordnen
-                for index, image_path in enumerate(images):
-                    container = ImageContainer(image_path)  # Container pro Bild
-                    row = index // 3                       # Zeilenindex berechnen
-                    col = index % 3                        # Spaltenindex (0-2)
-                    self.grid_layout.addWidget(container, row, col, Qt.AlignTop)  # Im Grid platzieren
-            else:
-                # Wenn keine Bilder gefunden wurden
-                label = QLabel("Keine Bilder in der PDF gefunden.")  # Info-Label erstellen
-                label.setAlignment(Qt.AlignCenter)                   # Text zentrieren
-                self.grid_layout.addWidget(label, 0, 0, 1, 3)       # Über drei Spalten anzeigen
+            for index, image_path in self.incoming_thumbs:
+                container = ImageContainer(image_path, deferred=True)  # Platzhalter pro Bild
+                row = index // 3                      # Zeilenindex berechnen
+                col = index % 3                       # Spaltenindex (0-2)
+                self.grid_layout.addWidget(container, row, col, Qt.AlignTop)  # Im Grid platzieren
+                self.pending_thumbs.append(container)  # Bild zum Dekodieren einreihen
+        finally:
+            self.incoming_thumbs.clear()
+            self.grid_layout.setEnabled(True)
+            self.preview_container.setUpdatesEnabled(True)
+            self.grid_layout.activate()               # Einmalige Neuberechnung des Layouts
+        
+        self._schedule_thumb_loading()
 
-        except Exception as e:
-            # Fehlerbehandlung
-            error_msg = f"Die Bilder konnten nicht geladen werden:\n{str(e)}"  # Fehlermeldung erstellen
-            QMessageBox.critical(self, "Fehler beim Laden", error_msg)         # Fehlerdialog anzeigen
+    def _schedule_thumb_loading(self):
+        """Plant den nächsten Ladeschritt in der Ereignisschleife ein."""
+        if self.pending_thumbs and not self.thumb_load_scheduled:
+            self.thumb_load_scheduled = True
+            QTimer.singleShot(0, self._load_next_thumb)
+
+    def _load_next_thumb(self):
+        """Dekodiert das nächste ausstehende Vorschaubild."""
+        self.thumb_load_scheduled = False
+        if self.pending_thumbs:
+            self.pending_thumbs.popleft().load()      # Ein Bild pro Durchlauf
+        self._schedule_thumb_loading()
+
+    def _prioritize_visible_thumbs(self):
+        """
+        Sortiert die Warteschlange so um, dass Bilder im sichtbaren Bereich
+        des Scroll-Bereichs zuerst dekodiert werden.
+        """
+        if not self.pending_thumbs:
+            return
+        visible_rect = self.preview_container.visibleRegion().boundingRect()  # Sichtbarer Ausschnitt
+        visible = [c for c in self.pending_thumbs if c.geometry().intersects(visible_rect)]
+        if visible:
+            hidden = [c for c in self.pending_thumbs if not c.geometry().intersects(visible_rect)]
+            self.pending_thumbs = deque(visible + hidden)
+
+    def _on_preview_error(self, error):
+        """Zeigt einen Fehler der Vorschau-Extraktion an."""
+        self.preview_failed = True
+        self._toast(f"Die Bilder konnten nicht geladen werden:\n{error}", 5000, "err")  # Fehlermeldung anzeigen
+
+    def _on_preview_finished(self):
+        """Wird nach Abschluss der Vorschau-Extraktion aufgerufen."""
+        self.extract_worker = None
+        self._flush_thumbs()                          # Restliche Bilder sofort einfügen
+        if self.preview_count == 0 and not self.preview_failed:
+            # Wenn keine Bilder gefunden wurden
+            self._show_message("Keine Bilder in der PDF gefunden.")  # Info-Label anzeigen
 
     def extract_images(self):
         """
@@ -211,10 +463,8 @@ class PDFImageExtractorWidget(QWidget):
         
         Öffnet einen Dialog zur Verzeichnisauswahl und extrahiert alle Bilder
         aus der aktuellen PDF in das gewählte Verzeichnis. Die Bilder werden
-        mit aussagekräftigen Namen versehen.
-        
-        Raises:
-            Exception: Wenn die Bildextraktion fehlschlägt
+        mit aussagekräftigen Namen versehen. Die Extraktion läuft in einem
+        Hintergrund-Thread mit Fortschrittsanzeige.
         """
         main_window = self.window()                   # Referenz auf Hauptfenster
         pdf_path = main_window.get_current_pdf()      # Pfad der aktuellen PDF
@@ -223,11 +473,6 @@ class PDFImageExtractorWidget(QWidget):
             QMessageBox.warning(self, "Fehler", "Bitte öffnen Sie zuerst eine PDF-Datei.")
             return
             
-        # Stelle sicher, dass das export_folder existiert
-        export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "export_folder")
-        if not os.path.exists(export_dir):
-            os.makedirs(export_dir)                   # Erstelle Verzeichnis falls nötig
-            
         # Zeige Verzeichnisauswahl-Dialog
         file_dialog = QFileDialog(self)               # Erstelle Dateidialog
         file_dialog.setWindowTitle("Speicherverzeichnis auswählen")  # Setze Fenstertitel
@@ -239,23 +484,11 @@ class PDFImageExtractorWidget(QWidget):
         file_dialog.setOption(QFileDialog.DontUseNativeDialog, False)
         
         # Setze Standardverzeichnis auf export_folder
-        file_dialog.setDirectory(export_dir)          # Startverzeichnis setzen
+        file_dialog.setDirectory(EXPORT_DIR)          # Startverzeichnis setzen
         
         if file_dialog.exec_() == QFileDialog.Accepted:
             save_dir = file_dialog.selectedFiles()[0]  # Gewähltes Verzeichnis
-            try:
-                # Extrahiere und speichere Bilder
-                extracted_images = extract_images_from_pdf(pdf_path, output_dir=save_dir)  # Extraktion
-                
-                # Zeige Erfolgsmeldung
-                if extracted_images:
-                    QMessageBox.information(self, "Erfolg", f"{len(extracted_images)} Bilder wurden erfolgreich extrahiert.")
-                else:
-                    QMessageBox.information(self, "Keine Bilder", "Es wurden keine Bilder in der PDF gefunden.")
-                    
-            except Exception as e:
-                # Zeige Fehlermeldung
-                QMessageBox.critical(self, "Fehler", f"Fehler beim Extrahieren der Bilder: {str(e)}")
+            self._start_export(pdf_path, output_dir=save_dir)  # Extraktion im Hintergrund
 
     def extract_images_to_zip(self):
         """
@@ -263,10 +496,8 @@ class PDFImageExtractorWidget(QWidget):
         
         Öffnet einen Dialog zur Auswahl des Speicherorts für die ZIP-Datei
         und extrahiert alle Bilder aus der aktuellen PDF. Die Bilder werden
-        mit aussagekräftigen Namen in der ZIP-Datei gespeichert.
-        
-        Raises:
-            Exception: Wenn die Bildextraktion oder ZIP-Erstellung fehlschlägt
+        mit aussagekräftigen Namen in der ZIP-Datei gespeichert. Die Erstellung
+        läuft in einem Hintergrund-Thread mit Fortschrittsanzeige.
         """
         main_window = self.window()                   # Referenz auf Hauptfenster
         pdf_path = main_window.get_current_pdf()      # Pfad der aktuellen PDF
@@ -279,13 +510,8 @@ class PDFImageExtractorWidget(QWidget):
         pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]  # PDF-Name ohne Endung
         default_filename = f"{pdf_name}_Bilder.zip"   # ZIP-Name mit PDF-Name
         
-        # Stelle sicher, dass das export_folder existiert
-        export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "export_folder")
-        if not os.path.exists(export_dir):
-            os.makedirs(export_dir)                   # Erstelle Verzeichnis
-        
         # Erstelle vollständigen Standardpfad
-        default_path = os.path.join(export_dir, default_filename)
+        default_path = os.path.join(EXPORT_DIR, default_filename)  # export_folder wird beim Import angelegt
         
         # Konfiguriere Speichern-Dialog
         file_dialog = QFileDialog(self)               # Erstelle Dialog
@@ -303,29 +529,101 @@ class PDFImageExtractorWidget(QWidget):
         
         if file_dialog.exec_() == QFileDialog.Accepted:
             save_path = file_dialog.selectedFiles()[0]  # Gewählter Speicherort
-            try:
-                # Extrahiere Bilder in temporäres Verzeichnis
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    extracted_images = extract_images_from_pdf(pdf_path, output_dir=temp_dir)
-                    
-                    if not extracted_images:
-                        QMessageBox.information(self, "Keine Bilder", 
-                            "Es wurden keine Bilder in der PDF gefunden.")
-                        return
-                    
-                    # Erstelle ZIP-Datei
-                    with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                        for img_path in extracted_images:
-                            # Füge jedes Bild zur ZIP hinzu
-                            arcname = os.path.basename(img_path)  # Nur Dateiname
-                            zipf.write(img_path, arcname)
-                    
-                    QMessageBox.information(self, "Erfolg", 
-                        f"{len(extracted_images)} Bilder wurden erfolgreich in die ZIP-Datei extrahiert.")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Fehler", 
-                    f"Fehler beim Erstellen der ZIP-Datei: {str(e)}")
+            self._start_export(pdf_path, zip_path=save_path)  # ZIP-Erstellung im Hintergrund
+
+    def _start_export(self, pdf_path, output_dir=None, zip_path=None):
+        """
+        Startet den Export der Bilder in einem Hintergrund-Thread.
+        
+        Während des Exports wird ein modaler Fortschrittsdialog angezeigt,
+        über den der Vorgang abgebrochen werden kann.
+        
+        Args:
+            pdf_path (str): Pfad zur PDF-Datei
+            output_dir (str, optional): Zielverzeichnis für Einzelbilder
+            zip_path (str, optional): Zielpfad für das ZIP-Archiv
+        """
+        self.export_dialog = QProgressDialog(
+            "Bilder werden extrahiert...", "Abbrechen", 0, 0, self
+        )                                             # Unbestimmter Fortschritt bis zum ersten Bild
+        self.export_dialog.setWindowTitle("Bilder extrahieren")
+        self.export_dialog.setWindowModality(Qt.WindowModal)
+        self.export_dialog.setMinimumDuration(0)      # Sofort anzeigen
+        self.export_dialog.setAutoClose(False)        # Schließen erst nach Abschluss
+        self.export_dialog.setAutoReset(False)
+        
+        self.export_worker = ExportWorker(pdf_path, output_dir, zip_path, self)
+        self.export_worker.progress.connect(self._on_export_progress)
+        self.export_worker.done.connect(self._on_export_done)
+        self.export_worker.error.connect(self._on_export_error)
+        self.export_worker.finished.connect(self.export_worker.deleteLater)
+        self.export_dialog.canceled.connect(self._on_export_canceled)
+        self.export_worker.start()
+
+    def _on_export_canceled(self):
+        """
+        Bricht den Export ab. Ein abgebrochener Thread meldet weder done noch
+        error; er wird daher vom Widget gelöst, damit weder sein Fortschritt
+        noch ein bereits zugestelltes Ergebnis den Dialog eines sofort danach
+        gestarteten Exports erreicht.
+        """
+        worker = self._detach_export_worker()
+        if worker is not None:
+            worker.stop()                             # Abbruch anfordern
+
+    def _detach_export_worker(self):
+        """
+        Trennt den laufenden Export-Thread von Widget und Dialog und schließt
+        den Dialog.
+        
+        canceled wird vor dem Schließen getrennt, da QProgressDialog.close()
+        selbst canceled auslöst.
+        
+        Returns:
+            ExportWorker: Der getrennte Thread oder None
+        """
+        worker = self.export_worker
+        if worker is None:
+            return None
+        self.export_worker = None
+        worker.progress.disconnect(self._on_export_progress)
+        worker.done.disconnect(self._on_export_done)
+        worker.error.disconnect(self._on_export_error)
+        self.export_dialog.canceled.disconnect(self._on_export_canceled)
+        self.export_dialog.close()
+        return worker
+
+    def _on_export_progress(self, current, total):
+        """Aktualisiert den Fortschrittsdialog."""
+        if self.sender() is not self.export_worker:
+            return                                    # Bereits zugestellter Fortschritt eines abgebrochenen Exports
+        self.export_dialog.setMaximum(total)
+        self.export_dialog.setValue(current)
+
+    def _on_export_done(self, image_count):
+        """Zeigt das Ergebnis des Exports an."""
+        if self.sender() is not self.export_worker:
+            return                                    # Ergebnis eines abgebrochenen Exports
+        is_zip = bool(self._detach_export_worker().zip_path)
+        
+        if not image_count:
+            self._toast("Es wurden keine Bilder in der PDF gefunden.")
+        elif is_zip:
+            self._toast(f"{image_count} Bilder wurden erfolgreich in die ZIP-Datei extrahiert.")
+        else:
+            self._toast(f"{image_count} Bilder wurden erfolgreich extrahiert.")
+
+    def _on_export_error(self, error):
+        """Zeigt einen Fehler beim Export an."""
+        if self.sender() is not self.export_worker:
+            return                                    # Fehler eines abgebrochenen Exports
+        is_zip = bool(self._detach_export_worker().zip_path)
+        
+        if is_zip:
+            QMessageBox.critical(self, "Fehler", 
+                f"Fehler beim Erstellen der ZIP-Datei: {error}")
+        else:
+            QMessageBox.critical(self, "Fehler", f"Fehler beim Extrahieren der Bilder: {error}")
 
     def add_pdf(self):
         """
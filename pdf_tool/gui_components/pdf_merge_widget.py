@@ -42,16 +42,52 @@ Autor: Team A2-2
 """
 
 import os
+import threading
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QListWidget, QMessageBox, QFileDialog, QScrollArea, QGridLayout
+    QWidget, QVBoxLayout, QLabel, QMessageBox, QFileDialog, QScrollArea,
+    QGridLayout, QProgressDialog
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QImage, QPixmap
-from ..utils.pdf_functions import merge_pdfs, render_page
-import os
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThread, QSize, QPoint, QRect,
+    QTimer, pyqtSignal
+)
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor
+from ..utils.pdf_functions import merge_pdfs, EXPORT_DIR
+from ..utils.render_pool import render_qimage, get_render_thread_pool
+from ..utils.disk_cache import trim_cache_dir
+from ..config import THUMB_CACHE_DIR, THUMB_CACHE_LIMIT
+import hashlib
 from datetime import datetime
 
+class _PreviewSignals(QObject):
+    """Signale eines Vorschau-Jobs (QRunnable kann selbst keine Signale senden)."""
+    finished = pyqtSignal(int, QImage)                # Generation, fertiges Vorschaubild
+
+class _PreviewJob(QRunnable):
+    """
+    Rendert die Vorschau einer PDF im Thread-Pool des Render-Prozesspools.
+    
+    Das Ergebnis wird als QImage über ein Signal in den GUI-Thread geliefert,
+    da QPixmap nur im GUI-Thread erzeugt werden darf. Bei Fehlern wird ein
+    leeres QImage gesendet.
+    """
+    def __init__(self, pdf_path, target_size, generation):
+        super().__init__()
+        self.pdf_path = pdf_path                      # Pfad zur PDF-Datei
+        self.target_size = QSize(target_size)         # Kopie der Zielgröße
+        self.generation = generation                  # Generation der anfragenden Kachel
+        self.signals = _PreviewSignals()              # Signal-Objekt im GUI-Thread
+
+    def run(self):
+        try:
+            image = _cached_image(self.pdf_path, self.target_size)
+        except Exception:
+            image = QImage()                          # Leeres Bild signalisiert Fehler
+        try:
+            self.signals.finished.emit(self.generation, image)
+        except RuntimeError:
+            pass                                      # Signal-Objekt beim Programmende bereits gelöscht
+
 class PDFPreviewTile(QWidget):
     """
     Widget für ein einzelnes PDF-Vorschaubild in einer quadratischen Kachel.
@@ -59,10 +95,16 @@ class PDFPreviewTile(QWidget):
     durch Mausklick. Der Auswahlstatus wird visuell durch einen farbigen Rahmen
     dargestellt.
     """
+    selection_changed = pyqtSignal()                  # Signal bei geändertem Auswahlstatus
+    placeholder = None                                # Gemeinsamer Platzhalter aller Kacheln
+
     def __init__(self, pdf_path, parent=None):
         super().__init__(parent)
         self.pdf_path = pdf_path                      # Pfad zur PDF-Datei
         self.selected = False                         # Auswahlstatus der Kachel
+        self.preview_generation = 0                   # Verwirft veraltete Render-Ergebnisse
+        self.rendered = False                         # Vorschau bereits angefordert?
+        self.preview_signals = None                   # Signale des laufenden Vorschau-Jobs
         
         # Layout erstellen
         layout = QVBoxLayout()                        # Vertikales Layout für Vorschau und Name
@@ -85,7 +127,35 @@ class PDFPreviewTile(QWidget):
         
         self.setLayout(layout)                        # Layout dem Widget zuweisen
         
-        self.load_preview()                           # Vorschaubild laden
+        # Vorschau erst laden, wenn die Kachel sichtbar wird (siehe ensure_rendered)
+        self.preview_container.setPixmap(self.placeholder_pixmap())  # Platzhalter ohne Renderaufwand
+
+    @classmethod
+    def placeholder_pixmap(cls):
+        """
+        Liefert das Platzhalterbild für noch nicht geladene Vorschauen.
+        Es wird einmalig gezeichnet und von allen Kacheln gemeinsam genutzt,
+        statt in jeder Kachel einen eigenen Text zu setzen.
+        """
+        if cls.placeholder is None:
+            pixmap = QPixmap(190, 190)                # Innenmaß des 200px-Containers
+            pixmap.fill(Qt.white)
+            painter = QPainter(pixmap)
+            painter.setPen(QColor("#999999"))         # Dezentes Grau
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, "Lädt…")
+            painter.end()
+            cls.placeholder = pixmap
+        return cls.placeholder
+
+    def ensure_rendered(self):
+        """
+        Lädt die Vorschau, falls dies noch nicht geschehen ist. Wird vom
+        PDFMergeWidget aufgerufen, sobald die Kachel in den sichtbaren
+        Bereich gescrollt wird.
+        """
+        if not self.rendered:
+            self.rendered = True
+            self.load_preview()
 
     def update_style(self):
         """
@@ -111,41 +181,114 @@ class PDFPreviewTile(QWidget):
         if event.button() == Qt.LeftButton:           # Nur Linksklicks verarbeiten
             self.selected = not self.selected         # Auswahlstatus umschalten
             self.update_style()                       # Visuelle Darstellung aktualisieren
-            # Informiere übergeordnetes Widget
-            if isinstance(self.parent(), QWidget):    # Prüfe ob Parent existiert
-                parent = self.parent()                # Hole Parent-Widget
-                while parent and not isinstance(parent, PDFMergeWidget):
-                    parent = parent.parent()          # Suche PDFMergeWidget
-                if parent:
-                    parent.update_delete_button()     # Button-Status aktualisieren
+            self.selection_changed.emit()             # Übergeordnetes Widget informieren
 
     def load_preview(self):
         """
-        Lädt und zeigt die Vorschau der ersten Seite der PDF-Datei.
-        Die Vorschau wird auf die Containergröße skaliert und bei
-        Fehlern wird ein Platzhaltertext angezeigt.
+        Lädt die Vorschau der ersten Seite der PDF-Datei im Hintergrund.
+        Bis das Bild fertig ist, wird das Platzhalterbild angezeigt. Das
+        Rendern (bzw. Laden aus dem Cache) läuft im Render-Thread-Pool,
+        sodass die Oberfläche auch bei vielen PDFs bedienbar bleibt.
         """
+        self.preview_generation += 1                 # Ältere Jobs dieser Kachel ungültig machen
+        self.preview_container.setPixmap(self.placeholder_pixmap())  # Platzhalter anzeigen
+        
+        job = _PreviewJob(self.pdf_path, self.preview_container.size(), self.preview_generation)
+        job.signals.finished.connect(self._on_preview_ready)
+        self.preview_signals = job.signals            # Referenz bis zur Zustellung halten
+        get_render_thread_pool().start(job)
+
+    def _on_preview_ready(self, generation, image):
+        """Zeigt ein fertig gerendertes Vorschaubild an, sofern es noch aktuell ist."""
+        if generation != self.preview_generation:
+            return                                    # Veraltetes Ergebnis verwerfen
+        self.preview_signals = None
+        if image.isNull():
+            self.preview_container.setText("Vorschau\nnicht verfügbar")  # Zeige Fehlertext
+            return
+        self.preview_container.setPixmap(QPixmap.fromImage(image, Qt.NoFormatConversion))  # Zeige Vorschau an
+
+def _render_preview_image(pdf_path, target_size):
+    """
+    Rendert die erste Seite einer PDF passend zur angegebenen Größe.
+    
+    Das Rendern erfolgt im Render-Prozesspool, damit mehrere Vorschauen
+    tatsächlich parallel entstehen. Blockiert bis zum Ergebnis und wird
+    daher aus den Vorschau-Threads aufgerufen.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        target_size (QSize): Verfügbare Größe des Vorschau-Containers
+        
+    Returns:
+        QImage: Die gerenderte Vorschau
+    """
+    # Graustufenbild mit 10px Rand passend zum Container
+    return render_qimage(pdf_path, 0, target_size.width() - 10,
+                         target_size.height() - 10, gray=True)
+
+def _thumb_cache_file(pdf_path, target_size):
+    """
+    Ermittelt den Cache-Dateinamen für eine Vorschau.
+    
+    Der Schlüssel setzt sich aus absolutem Pfad, Änderungszeitpunkt der PDF
+    und Zielgröße zusammen, sodass geänderte Dateien neu gerendert werden.
+    """
+    key = f"{os.path.abspath(pdf_path)}|{os.path.getmtime(pdf_path)}|{target_size.width()}x{target_size.height()}|gray"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(THUMB_CACHE_DIR, f"{digest}.jpg")
+
+def _cached_image(pdf_path, target_size):
+    """
+    Liefert die Vorschau einer PDF aus dem Festplatten-Cache oder rendert sie.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        target_size (QSize): Verfügbare Größe des Vorschau-Containers
+        
+    Returns:
+        QImage: Die Vorschau der ersten Seite
+    """
+    cache_file = _thumb_cache_file(pdf_path, target_size)
+    if os.path.exists(cache_file):
+        image = QImage(cache_file)
+        if not image.isNull():
+            os.utime(cache_file)                  # Als zuletzt genutzt markieren
+            return image
+    
+    image = _render_preview_image(pdf_path, target_size)
+    os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+    if image.save(cache_file, "JPG", 85):                  # JPEG: kleiner und schneller dekodiert als PNG
+        trim_cache_dir(THUMB_CACHE_DIR, THUMB_CACHE_LIMIT)
+    return image
+
+class MergeWorker(QThread):
+    """Thread zum Zusammenführen der PDFs, damit die Oberfläche bedienbar bleibt."""
+    progress = pyqtSignal(int, int)     # Signal mit aktueller PDF und Gesamtanzahl
+    done = pyqtSignal(str)              # Signal mit Pfad der erstellten PDF
+    error = pyqtSignal(str)             # Signal mit Fehlermeldung
+
+    def __init__(self, pdf_paths, output_path, parent=None):
+        """Initialisiert den Merge-Thread."""
+        super().__init__(parent)
+        self.pdf_paths = list(pdf_paths)  # Kopie der PDF-Liste
+        self.output_path = output_path  # Zielpfad der zusammengeführten PDF
+        self.cancel_event = threading.Event()  # Wird beim Abbruch gesetzt
+
+    def stop(self):
+        """Fordert den Abbruch des Zusammenführens an."""
+        self.cancel_event.set()
+
+    def run(self):
+        """Führt die PDFs zusammen und meldet das Ergebnis per Signal."""
         try:
-            # Rendere die erste Seite
-            pix = render_page(self.pdf_path, 0, 1.0)  # Erste Seite mit Zoom 1.0
-            
-            # Berechne optimalen Zoom-Faktor
-            available_size = self.preview_container.size()  # Verfügbare Größe
-            width_ratio = (available_size.width() - 10) / pix.width  # Breitenverhältnis
-            height_ratio = (available_size.height() - 10) / pix.height  # Höhenverhältnis
-            zoom = min(width_ratio, height_ratio)     # Kleineres Verhältnis wählen
-            
-            # Rendere mit optimalem Zoom
-            pix = render_page(self.pdf_path, 0, zoom)  # Neu rendern mit Zoom
-            
-            # Konvertiere zu QPixmap und zeige an
-            img_data = pix.tobytes("ppm")            # Konvertiere zu Bytes
-            qimg = QImage.fromData(img_data)         # Erstelle QImage
-            pixmap = QPixmap.fromImage(qimg)         # Konvertiere zu QPixmap
-            self.preview_container.setPixmap(pixmap)  # Zeige Vorschau an
-            
+            merge_pdfs(self.pdf_paths, self.output_path, progress_cb=self.progress.emit,
+                       cancel_event=self.cancel_event)
+            if not self.cancel_event.is_set():
+                self.done.emit(self.output_path)  # Ergebnis an GUI melden
         except Exception as e:
-            self.preview_container.setText("Vorschau\nnicht verfügbar")  # Zeige Fehlertext
+            if not self.cancel_event.is_set():
+                self.error.emit(str(e))         # Fehler an GUI melden
 
 class PDFMergeWidget(QWidget):
     """
@@ -157,6 +300,8 @@ class PDFMergeWidget(QWidget):
         super().__init__(parent)
         self.stacked_widget = stacked_widget          # Übergeordnetes StackedWidget
         self.preview_tiles = []                       # Liste der Vorschau-Kacheln
+        self.merge_worker = None                      # Laufender Merge-Thread
+        self.merge_dialog = None                      # Fortschrittsdialog des Merges
         
         # Layout erstellen
         layout = QVBoxLayout()                        # Vertikales Hauptlayout
@@ -168,6 +313,8 @@ class PDFMergeWidget(QWidget):
         scroll_area.setWidgetResizable(True)          # Automatische Größenanpassung
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # Horizontale Scrollbar
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)    # Vertikale Scrollbar
+        scroll_area.verticalScrollBar().valueChanged.connect(self._refresh_visible_tiles)  # Sichtbare Kacheln nachladen
+        self.scroll_area = scroll_area                # Für Sichtbarkeitsprüfung merken
         
         # Container für das Grid
         self.preview_container = QWidget()            # Container für Vorschaukacheln
@@ -235,44 +382,83 @@ class PDFMergeWidget(QWidget):
         die Vorschau. Die Dateien werden nur aus der Liste entfernt,
         nicht vom Dateisystem gelöscht.
         """
-        selected_paths = []                           # Liste für ausgewählte Pfade
-        for tile in self.preview_tiles:               # Durchlaufe alle Kacheln
-            if tile.selected:                         # Wenn Kachel ausgewählt
-                selected_paths.append(tile.pdf_path)   # Pfad merken
-        
-        if selected_paths:                            # Wenn Pfade zum Entfernen
-            for path in selected_paths:               # Durchlaufe Pfade
-                self.pdf_paths.remove(path)           # Entferne aus Liste
+        if any(tile.selected for tile in self.preview_tiles):  # Wenn Kacheln zum Entfernen
+            # Liste in einem Durchlauf neu aufbauen; die Kacheln stehen in derselben
+            # Reihenfolge wie pdf_paths, doppelte PDFs bleiben so einzeln entfernbar
+            self.pdf_paths = [tile.pdf_path for tile in self.preview_tiles if not tile.selected]
             self.update_preview()                     # Aktualisiere Vorschau
 
     def update_preview(self):
         """
         Aktualisiert die Vorschaukacheln basierend auf den aktuellen PDF-Pfaden.
-        Löscht alle bestehenden Vorschauen und erstellt neue für alle PDFs
-        in der Liste.
+        Bestehende Kacheln werden wiederverwendet, nur für neue PDFs werden
+        Kacheln erstellt und nicht mehr benötigte entfernt. Anschließend
+        werden alle Kacheln in der Reihenfolge der Liste neu angeordnet.
         """
-        # Lösche bestehende Widgets
-        for i in reversed(range(self.grid_layout.count())):  # Rückwärts durchlaufen
-            self.grid_layout.itemAt(i).widget().setParent(None)  # Widget entfernen
+        # Vorhandene Kacheln nach Pfad gruppieren (Pfade können mehrfach vorkommen)
+        tiles_by_path = {}
+        for tile in self.preview_tiles:
+            tiles_by_path.setdefault(tile.pdf_path, []).append(tile)
         
-        self.preview_tiles = []                       # Liste leeren
+        # Kacheln in Listenreihenfolge zuordnen, fehlende neu erstellen
+        tiles = []
+        for pdf_path in self.pdf_paths:               # Durchlaufe PDFs
+            reusable = tiles_by_path.get(pdf_path)
+            if reusable:
+                tiles.append(reusable.pop(0))         # Bestehende Kachel übernehmen
+            else:
+                tile = PDFPreviewTile(pdf_path)       # Neue Kachel erstellen
+                tile.selection_changed.connect(self.update_delete_button)
+                tiles.append(tile)
         
-        if not self.pdf_paths:                        # Wenn keine PDFs vorhanden
-            self.initial_label = QLabel("Keine PDFs ausgewählt.")  # Info-Label
-            self.initial_label.setAlignment(Qt.AlignCenter)  # Zentriert
-            self.grid_layout.addWidget(self.initial_label, 0, 0, 1, 2)  # Einfügen
-            return
+        # Übrig gebliebene Kacheln entfernen
+        for remaining in tiles_by_path.values():
+            for tile in remaining:
+                self.grid_layout.removeWidget(tile)   # Aus dem Grid nehmen
+                tile.setParent(None)
+                tile.deleteLater()                    # Widget freigeben
         
-        # Füge neue Vorschaukacheln hinzu
-        for index, pdf_path in enumerate(self.pdf_paths):  # Durchlaufe PDFs
-            preview = PDFPreviewTile(pdf_path)        # Erstelle Vorschaukachel
-            self.preview_tiles.append(preview)        # Zur Liste hinzufügen
-            row = index // 2                          # Zeile berechnen
-            col = index % 2                           # Spalte berechnen
-            self.grid_layout.addWidget(preview, row, col)  # Im Grid platzieren
+        self.preview_tiles = tiles                    # Neue Reihenfolge übernehmen
+        
+        if not self.pdf_paths:                        # Wenn keine PDFs vorhanden
+            self.grid_layout.addWidget(self.initial_label, 0, 0, 1, 2)  # Info-Label einfügen
+            self.initial_label.show()
+        else:
+            self.grid_layout.removeWidget(self.initial_label)  # Info-Label ausblenden
+            self.initial_label.hide()
+            
+            # Kacheln neu positionieren (ohne sie neu zu erstellen)
+            for tile in tiles:
+                self.grid_layout.removeWidget(tile)   # Alte Rasterposition lösen
+            for index, tile in enumerate(tiles):
+                row = index // 2                      # Zeile berechnen
+                col = index % 2                       # Spalte berechnen
+                self.grid_layout.addWidget(tile, row, col)  # Im Grid platzieren
+            
+            # Nach dem Layout-Durchlauf sichtbare Kacheln rendern
+            QTimer.singleShot(0, self._refresh_visible_tiles)
         
         self.update_delete_button()                   # Button-Status aktualisieren
 
+    def resizeEvent(self, event):
+        """Lädt nach einer Größenänderung neu sichtbar gewordene Vorschauen."""
+        super().resizeEvent(event)
+        self._refresh_visible_tiles()
+
+    def _refresh_visible_tiles(self):
+        """
+        Fordert die Vorschau aller Kacheln an, die im sichtbaren Bereich des
+        Scroll-Bereichs liegen. Ein Puffer von 400px ober- und unterhalb sorgt
+        dafür, dass beim Scrollen bereits die nächsten Kacheln bereitstehen.
+        """
+        viewport = self.scroll_area.viewport()
+        top_left = self.preview_container.mapFrom(viewport, QPoint(0, 0))
+        visible_rect = QRect(top_left, viewport.size()).adjusted(0, -400, 0, 400)
+        
+        for tile in self.preview_tiles:
+            if not tile.rendered and tile.geometry().intersects(visible_rect):
+                tile.ensure_rendered()
+
     def update_delete_button(self):
         """
         Aktiviert oder deaktiviert den Lösch-Button basierend auf der
@@ -282,13 +468,10 @@ class PDFMergeWidget(QWidget):
         has_selection = any(tile.selected for tile in self.preview_tiles)  # Prüfe Auswahl
         
         main_window = self.window()                   # Hole Hauptfenster
-        if main_window:                               # Wenn Hauptfenster existiert
-            # Suche den Lösch-Button
-            for i in range(main_window.action_buttons_layout.count()):  # Durchsuche Buttons
-                button = main_window.action_buttons_layout.itemAt(i).widget()  # Hole Button
-                if isinstance(button, QPushButton) and button.text() == "Ausgewählte PDF entfernen":
-                    button.setEnabled(has_selection)   # Aktiviere/Deaktiviere
-                    break
+        action_buttons = getattr(main_window, "action_buttons", {})  # Aktuelle Aktions-Buttons
+        button = action_buttons.get("Ausgewählte PDF entfernen")  # Lösch-Button direkt holen
+        if button:
+            button.setEnabled(has_selection)          # Aktiviere/Deaktiviere
 
     def merge_pdfs(self):
         """
@@ -304,11 +487,6 @@ class PDFMergeWidget(QWidget):
         # Erstelle standardisierten Dateinamen
         default_filename = f"Merge_{datetime.now().strftime('%Y-%m-%d')}.pdf"  # Mit Datum
         
-        # Stelle sicher, dass export_folder existiert
-        export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "export_folder")
-        if not os.path.exists(export_dir):
-            os.makedirs(export_dir)                   # Erstelle Verzeichnis
-        
         # Konfiguriere Speichern-Dialog
         file_dialog = QFileDialog(self)               # Erstelle Dialog
         file_dialog.setWindowTitle("Zusammengefügte PDF speichern")  # Setze Titel
@@ -321,17 +499,70 @@ class PDFMergeWidget(QWidget):
         file_dialog.setOption(QFileDialog.DontUseNativeDialog, False)
         
         # Setze Standardpfad
-        default_path = os.path.join(export_dir, default_filename)
+        default_path = os.path.join(EXPORT_DIR, default_filename)  # Verzeichnis existiert bereits
         file_dialog.selectFile(default_path)          # Vorauswahl setzen
         
         if file_dialog.exec_() == QFileDialog.Accepted:
             output_path = file_dialog.selectedFiles()[0]  # Hole Speicherort
-            try:
-                merge_pdfs(self.pdf_paths, output_path)  # Führe PDFs zusammen
-                QMessageBox.information(self, "Erfolg", 
-                    "Die PDF-Dateien wurden erfolgreich zusammengefügt.")
-                self.pdf_paths = []                   # Liste leeren
-                self.update_preview()                 # Vorschau aktualisieren
-            except Exception as e:
-                QMessageBox.critical(self, "Fehler", 
-                    f"Fehler beim Zusammenfügen der PDF-Dateien: {str(e)}") 
\ No newline at end of file
+            self._start_merge(output_path)            # Im Hintergrund zusammenführen
+
+    def _start_merge(self, output_path):
+        """
+        Startet das Zusammenführen in einem Hintergrund-Thread und zeigt
+        währenddessen einen modalen Fortschrittsdialog an.
+        
+        Args:
+            output_path (str): Zielpfad der zusammengeführten PDF
+        """
+        self.merge_dialog = QProgressDialog(
+            "PDF-Dateien werden zusammengefügt...", None, 0, len(self.pdf_paths), self
+        )                                             # Ohne Abbrechen-Button
+        self.merge_dialog.setWindowTitle("PDFs zusammenfügen")
+        self.merge_dialog.setWindowModality(Qt.WindowModal)
+        self.merge_dialog.setMinimumDuration(0)       # Sofort anzeigen
+        self.merge_dialog.setAutoClose(False)         # Schließen erst nach Abschluss
+        self.merge_dialog.setValue(0)
+        
+        self.merge_worker = MergeWorker(self.pdf_paths, output_path, self)
+        self.merge_worker.progress.connect(self._on_merge_progress)
+        self.merge_worker.done.connect(self._on_merge_done)
+        self.merge_worker.error.connect(self._on_merge_error)
+        self.merge_worker.finished.connect(self.merge_worker.deleteLater)
+        self.merge_worker.start()
+
+    def stop_merge(self):
+        """
+        Bricht ein laufendes Zusammenführen ab und wartet auf das Ende des
+        Threads. Wird beim Schließen des Hauptfensters aufgerufen, damit der
+        Thread nicht mit dem Widget zerstört wird, solange er noch läuft.
+        """
+        worker = self.merge_worker
+        if worker is None:
+            return
+        self.merge_worker = None
+        for signal in (worker.progress, worker.done, worker.error):
+            signal.disconnect()                       # Keine Meldungen mehr an das Widget
+        worker.stop()
+        worker.wait()                                 # Aktuelle PDF wird noch eingefügt
+        self.merge_dialog.close()
+
+    def _on_merge_progress(self, current, total):
+        """Aktualisiert den Fortschrittsdialog."""
+        self.merge_dialog.setMaximum(total)
+        self.merge_dialog.setValue(current)
+
+    def _on_merge_done(self, output_path):
+        """Meldet den Erfolg und leert die Liste der PDFs."""
+        self.merge_dialog.close()
+        self.merge_worker = None
+        QMessageBox.information(self, "Erfolg", 
+            "Die PDF-Dateien wurden erfolgreich zusammengefügt.")
+        self.pdf_paths = []                           # Liste leeren
+        self.update_preview()                         # Vorschau aktualisieren
+
+    def _on_merge_error(self, message):
+        """Zeigt einen Fehler beim Zusammenführen an."""
+        self.merge_dialog.close()
+        self.merge_worker = None
+        QMessageBox.critical(self, "Fehler", 
+            f"Fehler beim Zusammenfügen der PDF-Dateien: {message}") 
\ No newline at end of file
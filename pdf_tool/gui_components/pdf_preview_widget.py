@@ -28,6 +28,7 @@ Technische Details:
 - Threadsichere Rendering-Engine
 - Optimierte Speicherverwaltung
 - Cache-System für schnelle Darstellung
+- Sehr große Seiten (hoher Zoom) werden in Kacheln gerendert
 - Fehlerbehandlung und Benutzer-Feedback
 
 Verwendung:
@@ -50,11 +51,248 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog,
     QMessageBox, QScrollArea, QApplication, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QImage, QPixmap
-from ..utils.pdf_functions import load_pdf, render_page, show_pdf_open_dialog
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QPoint, QPointF, QRect
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPixmapCache
+from ..utils.pdf_functions import (
+    render_page, render_page_to_qimage, show_pdf_open_dialog, pixmap_to_qimage, get_page_sizes,
+    release_render_cache, RENDER_DPI
+)
+from ..utils.pdf_cache import get_doc, document_lock
+from ..utils.disk_cache import (
+    file_fingerprint, cache_image_format, load_cached_image, save_cached_image
+)
+from ..config import PAGE_CACHE_DIR, PAGE_CACHE_LIMIT
+from collections import OrderedDict
+import math
 import os
 
+# Speicherbudget des (prozessweiten) QPixmapCache in KB
+PIXMAP_CACHE_LIMIT = 128 * 1024
+
+# Kantenlänge der Kacheln in physischen Pixeln
+TILE_SIZE = 512
+
+# Ab dieser Bildgröße (physische Pixel) wird eine Seite in Kacheln gerendert (~64 MB bei RGB)
+TILED_MIN_PIXELS = 4096 * 4096
+
+# Speicherbudget für gerenderte Kacheln in Bytes
+TILE_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Zoomstufen pro Verdopplung, auf die Cache-Schlüssel gerastert werden (~2,2% Abstand)
+ZOOM_STEPS_PER_OCTAVE = 32
+
+def _quantize_zoom(zoom):
+    """
+    Rastert einen Zoom-Faktor für den Cache-Schlüssel.
+    
+    Das Raster ist relativ (logarithmisch), da die Zoom-Faktoren wegen der
+    hohen Render-Auflösung meist deutlich unter 1 liegen und ein festes
+    Raster dort zu grob wäre.
+    """
+    return round(math.log2(zoom) * ZOOM_STEPS_PER_OCTAVE)
+
+def _render_display_image(document, page, zoom, render_quality, device_pixel_ratio=1.0):
+    """
+    Rendert eine Seite in Anzeigegröße.
+    
+    Die Seite wird in der physischen Auflösung des Bildschirms gerendert
+    (Zoom × devicePixelRatio), sodass Qt sie ohne weiteres Skalieren
+    zeichnet. Ist der Qualitätsfaktor größer als das Pixelverhältnis, wird
+    zusätzlich überabgetastet und geglättet verkleinert. Da nur QImage
+    verwendet wird, ist die Funktion auch in Worker-Threads nutzbar.
+    
+    Args:
+        document (fitz.Document): Das bereits geöffnete Dokument
+        page (int): Seitennummer (0-basiert)
+        zoom (float): Zoom-Faktor der Anzeige
+        render_quality (float): Faktor für höhere Renderqualität
+        device_pixel_ratio (float): Pixelverhältnis des Bildschirms
+        
+    Returns:
+        QImage: Die Seite in Anzeigegröße mit gesetztem Pixelverhältnis
+    """
+    # Auf HiDPI-Bildschirmen deckt die physische Auflösung die Überabtastung bereits ab
+    render_scale = max(render_quality, device_pixel_ratio)
+    
+    # Rendere die Seite mit erhöhter Qualität (ohne die PDF neu zu öffnen)
+    with document_lock:
+        pix = render_page(document, page, zoom * render_scale)
+    
+    # Skaliere auf die physische Anzeigegröße
+    downscale = render_scale / device_pixel_ratio
+    if downscale == 1.0:
+        image = pixmap_to_qimage(pix)
+    else:
+        # Direkt aus dem Sample-Puffer verkleinern, ohne das große Bild zu kopieren
+        image = pixmap_to_qimage(pix, copy=False).scaled(
+            int(pix.width / downscale),
+            int(pix.height / downscale),
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+    image.setDevicePixelRatio(device_pixel_ratio)  # Qt zeichnet 1:1 auf das Pixelraster
+    return image
+
+def _render_tile_image(document, page, zoom, column, row, device_pixel_ratio=1.0):
+    """
+    Rendert eine einzelne Kachel einer Seite in physischer Auflösung.
+    
+    Gerendert wird nur der Ausschnitt der Kachel (clip), sodass auch bei
+    sehr hohem Zoom nie die ganze Seite im Speicher liegt. Eine Überabtastung
+    entfällt, da die Seite in dieser Größe ohnehin fein genug aufgelöst ist.
+    
+    Args:
+        document (fitz.Document): Das bereits geöffnete Dokument
+        page (int): Seitennummer (0-basiert)
+        zoom (float): Zoom-Faktor der Anzeige
+        column (int): Spalte der Kachel
+        row (int): Zeile der Kachel
+        device_pixel_ratio (float): Pixelverhältnis des Bildschirms
+        
+    Returns:
+        QImage: Die Kachel mit gesetztem Pixelverhältnis (am Seitenrand kleiner)
+    """
+    scale = zoom * device_pixel_ratio
+    points = TILE_SIZE / (scale * RENDER_DPI / 72)    # Kantenlänge in Seitenkoordinaten
+    clip = (column * points, row * points, (column + 1) * points, (row + 1) * points)
+    with document_lock:
+        image = render_page_to_qimage(document, page, scale, clip=clip)
+    image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+class _RenderSignals(QObject):
+    """Signale eines Render-Auftrags (QRunnable kann selbst keine Signale senden)."""
+    finished = pyqtSignal(int, str, int, float, QImage)  # Kennung, Pfad, Seite, Zoom, Bild
+    error = pyqtSignal(int, str)                         # Kennung, Fehlermeldung
+
+class _RenderJob(QRunnable):
+    """
+    Rendert eine Seite im globalen Thread-Pool.
+    
+    Das Ergebnis wird als QImage per Signal in den GUI-Thread geliefert,
+    da QPixmap nur dort erzeugt werden darf. Ist die Seite bereits im
+    Festplatten-Cache, wird sie von dort geladen statt gerendert.
+    """
+    def __init__(self, pdf_path, document, page, zoom, render_quality, device_pixel_ratio,
+                 cache_file, token):
+        super().__init__()
+        self.pdf_path = pdf_path                      # Pfad zur PDF-Datei
+        self.document = document                      # Geöffnetes Dokument
+        self.page = page                              # Seitennummer (0-basiert)
+        self.zoom = zoom                              # Zoom-Faktor der Anzeige
+        self.render_quality = render_quality          # Überabtastungsfaktor
+        self.device_pixel_ratio = device_pixel_ratio  # Pixelverhältnis des Bildschirms
+        self.cache_file = cache_file                  # Datei im Seiten-Cache (oder None)
+        self.token = token                            # Kennung des Auftrags
+        self.signals = _RenderSignals()               # Signal-Objekt im GUI-Thread
+
+    def run(self):
+        try:
+            image = load_cached_image(self.cache_file, self.device_pixel_ratio)
+            if image is None:
+                image = _render_display_image(self.document, self.page, self.zoom,
+                                              self.render_quality, self.device_pixel_ratio)
+                save_cached_image(image, self.cache_file, PAGE_CACHE_LIMIT)
+        except Exception as e:
+            image, error = None, str(e)
+        try:
+            if image is not None:
+                self.signals.finished.emit(self.token, self.pdf_path, self.page, self.zoom, image)
+            else:
+                self.signals.error.emit(self.token, error)
+        except RuntimeError:
+            pass                                      # Signal-Objekt beim Programmende bereits gelöscht
+
+class _TileSignals(QObject):
+    """Signale eines Kachel-Auftrags."""
+    finished = pyqtSignal(tuple, QImage)                 # Cache-Schlüssel der Kachel, Bild
+
+class _TileJob(QRunnable):
+    """
+    Rendert eine Kachel im globalen Thread-Pool.
+    
+    Fehler werden nicht gemeldet, sondern als leeres Bild geliefert; die
+    Kachel bleibt dann leer und wird beim nächsten Scrollen erneut
+    angefordert.
+    """
+    def __init__(self, document, key, zoom, device_pixel_ratio):
+        super().__init__()
+        self.document = document                      # Geöffnetes Dokument
+        self.key = key                                # (Pfad, Seite, Zoom, Pixelverhältnis, Spalte, Zeile)
+        self.zoom = zoom                              # Ungerundeter Zoom-Faktor
+        self.device_pixel_ratio = device_pixel_ratio  # Pixelverhältnis des Bildschirms
+        self.signals = _TileSignals()                 # Signal-Objekt im GUI-Thread
+
+    def run(self):
+        _, page, _, _, column, row = self.key
+        try:
+            image = _render_tile_image(self.document, page, self.zoom, column, row,
+                                       self.device_pixel_ratio)
+        except Exception:
+            image = QImage()
+        try:
+            self.signals.finished.emit(self.key, image)
+        except RuntimeError:
+            pass                                      # Signal-Objekt beim Programmende bereits gelöscht
+
+class _PageLabel(QLabel):
+    """
+    Vorschau-Label, das eine Seite wahlweise als Ganzes oder in Kacheln zeichnet.
+    
+    Im Kachelmodus (tiles ist nicht None) werden nur die vorhandenen Kacheln
+    gezeichnet. Wird das Label beim Zoomen bereits vergrößert, bevor neue
+    Kacheln vorliegen, werden die alten passend mitskaliert.
+    
+    Auch eine ganze Seite wird bis zum scharfen Neurendern nur schnell
+    (ohne Glättung) beim Zeichnen skaliert. QLabel würde mit
+    setScaledContents bei jeder Größe eine geglättete Kopie erzeugen und
+    zwischenspeichern.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tiles = None                             # (Spalte, Zeile) -> QPixmap im Kachelmodus
+        self.tile_width = 0                           # Logische Seitenbreite, für die die Kacheln gelten
+        self.tile_step = 0                            # Logische Kantenlänge einer Kachel
+
+    def set_tiled(self, width, height, tile_step):
+        """Wechselt in den Kachelmodus für eine Seite der angegebenen logischen Größe."""
+        self.clear()                                  # Ganze Seite nicht mehr zeichnen
+        self.tiles = {}
+        self.tile_width = width
+        self.tile_step = tile_step
+        self.resize(width, height)
+        self.update()
+
+    def set_untiled(self):
+        """Verlässt den Kachelmodus und gibt die Kacheln frei."""
+        self.tiles = None
+
+    def tile_rect(self, column, row):
+        """Liefert das Rechteck einer Kachel in aktuellen Label-Koordinaten."""
+        ratio = self.width() / self.tile_width
+        step = self.tile_step * ratio
+        return QRect(int(column * step), int(row * step),
+                     int(step) + 2, int(step) + 2)    # Rundung großzügig abdecken
+
+    def paintEvent(self, event):
+        if self.tiles is None:
+            pixmap = self.pixmap()
+            if pixmap is None or pixmap.isNull() or pixmap.size() / pixmap.devicePixelRatio() == self.size():
+                super().paintEvent(event)             # Text oder Seite in Originalgröße
+                return
+            painter = QPainter(self)
+            painter.drawPixmap(self.rect(), pixmap)   # Zwischenanzeige beim Zoomen (ungeglättet)
+            painter.end()
+            return
+        
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), Qt.white)      # Noch fehlende Kacheln
+        ratio = self.width() / self.tile_width
+        painter.scale(ratio, ratio)                   # Zwischenanzeige beim Zoomen
+        for (column, row), pixmap in self.tiles.items():
+            painter.drawPixmap(QPointF(column * self.tile_step, row * self.tile_step), pixmap)
+        painter.end()
+
 class PDFPreviewWidget(QWidget):
     """
     Widget zur Anzeige und Navigation von PDF-Dokumenten.
@@ -92,9 +330,35 @@ class PDFPreviewWidget(QWidget):
         self.current_page = 0                         # Aktuelle Seitennummer (0-basiert)
         self.total_pages = 0                         # Gesamtanzahl der Seiten
         self.pdf_path = None                         # Pfad zur aktuellen PDF
+        self.document = None                         # Geöffnetes Dokument der aktuellen PDF
+        self.pdf_fingerprint = None                  # Schlüssel der PDF im Seiten-Cache
+        self.pdf_mtime = None                        # Änderungszeitpunkt der PDF beim Öffnen
+        self.page_cache_format = cache_image_format()  # Bildformat im Seiten-Cache
+        self.page_sizes = []                         # Seitengrößen bei Zoom 1.0 (ohne Rendern ermittelt)
         self.zoom_factor = 1.0                       # Aktueller Zoom-Faktor (100%)
         self.base_zoom = 1.0                         # Basis-Zoom für 100% Darstellung
         self.render_quality = 2.0  # Faktor für höhere Renderqualität
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_LIMIT))  # Gerenderte Seiten
+        self.render_seq = 0                          # Zähler für Render-Aufträge
+        self.display_token = 0                       # Auftrag, dessen Ergebnis angezeigt wird
+        self.pending_renders = {}                    # Kennung -> (Signale, Cache-Schlüssel) laufender Aufträge
+        self.base_pixmap = None                      # Zuletzt scharf angezeigte Seite
+        self.base_page = -1                          # Seitennummer der base_pixmap
+        self.shown_key = None                        # Cache-Schlüssel der angezeigten Seite (scharf)
+        self.last_status = None                      # Zuletzt angezeigter Status (siehe _update_status)
+        self.tile_cache = OrderedDict()              # LRU-Cache: Kachel-Schlüssel -> QPixmap
+        self.tile_cache_bytes = 0                    # Speicherbedarf der gecachten Kacheln
+        self.pending_tiles = {}                      # Kachel-Schlüssel -> Signale laufender Aufträge
+        
+        # Fasst schnell aufeinanderfolgende Größenänderungen zu einer Anpassung zusammen
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self.fit_to_window)
+        
+        # Rendert nach Zoom-Schritten erst, wenn keine weiteren Klicks folgen
+        self.zoom_timer = QTimer(self)
+        self.zoom_timer.setSingleShot(True)
+        self.zoom_timer.timeout.connect(self.render_current_page)
         
         # Layout erstellen
         layout = QVBoxLayout()                        # Vertikales Hauptlayout
@@ -114,14 +378,18 @@ class PDFPreviewWidget(QWidget):
 
         # Scroll-Bereich für die Vorschau
         self.scroll_area = QScrollArea()              # Scrollbarer Bereich
-        self.scroll_area.setWidgetResizable(True)     # Automatische Größenanpassung
+        self.scroll_area.setWidgetResizable(False)    # Label behält die Größe der Seite
+        self.scroll_area.setAlignment(Qt.AlignCenter) # Seite im sichtbaren Bereich zentrieren
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # Horizontale Scrollbar
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)    # Vertikale Scrollbar
         
         # Vorschaubereich
-        self.preview_label = QLabel()                 # Label für PDF-Vorschau
+        self.preview_label = _PageLabel()             # Label für PDF-Vorschau (ganz oder in Kacheln)
         self.preview_label.setAlignment(Qt.AlignCenter)  # Zentrierte Ausrichtung
         self.scroll_area.setWidget(self.preview_label)  # Label in Scroll-Bereich
+        # Bei großen Seiten beim Scrollen die neu sichtbaren Kacheln anfordern
+        self.scroll_area.horizontalScrollBar().valueChanged.connect(self._request_visible_tiles)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._request_visible_tiles)
         preview_layout.addWidget(self.scroll_area)    # Scroll-Bereich in Container
         
         layout.addWidget(preview_container, 1)        # Container mit Stretch-Faktor 1
@@ -207,20 +475,8 @@ class PDFPreviewWidget(QWidget):
         pdf_path = show_pdf_open_dialog(self)         # Zeige Dateiauswahl-Dialog
         if pdf_path:                                  # Wenn PDF ausgewählt
             try:
-                self.pdf_path = pdf_path              # Speichere PDF-Pfad
-                self.total_pages = load_pdf(pdf_path)  # Lade PDF und hole Seitenzahl
-                self.current_page = 0                 # Starte bei erster Seite
-                
-                # Aktualisiere Combo Box
-                self.page_combo.clear()
-                self.page_combo.addItems([str(i+1) for i in range(self.total_pages)])
-                self.page_combo.setCurrentIndex(0)
-                
-                # Aktiviere Navigation wenn mehrere Seiten
-                self.prev_button.setEnabled(self.total_pages > 1)  # Vorherige-Seite-Button
-                self.next_button.setEnabled(self.total_pages > 1)  # Nächste-Seite-Button
-                
-                self.update_page_display()            # Aktualisiere Seitenanzeige
+                self._load_document(pdf_path)         # Starte bei erster Seite
+                self._update_status()                 # Aktualisiere Seitenanzeige
                 main_window.set_current_pdf(pdf_path)  # Registriere PDF im Hauptfenster
                 
                 # Wechsle zur Vorschau
@@ -242,62 +498,129 @@ class PDFPreviewWidget(QWidget):
                     f"Die PDF konnte nicht geladen werden:\n{str(e)}"
                 )                                     # Zeige Fehlermeldung
 
+    def _load_document(self, pdf_path, page=0):
+        """
+        Öffnet die PDF über den Dokument-Cache und übernimmt Seitenzahl,
+        Seitengrößen und Cache-Schlüssel. Rendert nicht selbst.
+        
+        Args:
+            pdf_path (str): Pfad zur PDF-Datei
+            page (int): Anzuzeigende Seite (0-basiert), wird auf die
+                vorhandenen Seiten begrenzt
+        """
+        self._clear_tiles()
+        self.base_pixmap = None
+        self.shown_key = None
+        self.pdf_path = pdf_path                      # Speichere PDF-Pfad
+        self.pdf_mtime = os.path.getmtime(pdf_path)  # Geänderte Datei: neue Cache-Schlüssel
+        self.document = get_doc(pdf_path)             # Dokument einmalig öffnen
+        with document_lock:                          # Evtl. noch laufende Aufträge derselben PDF
+            self.total_pages = self.document.page_count  # Seitenzahl ohne erneutes Öffnen
+            self.page_sizes = get_page_sizes(self.document)  # Seitengrößen aus den Seitenrechtecken
+        self.pdf_fingerprint = file_fingerprint(pdf_path)  # Für den Seiten-Cache
+        self.current_page = max(0, min(page, self.total_pages - 1))
+        
+        # Aktualisiere Combo Box; ohne Signale, da on_page_selected sonst
+        # mit dem bisherigen Zoom rendert (der Aufrufer rendert danach)
+        self.page_combo.blockSignals(True)
+        self.page_combo.clear()
+        self.page_combo.addItems([str(i+1) for i in range(self.total_pages)])
+        self.page_combo.setCurrentIndex(self.current_page)
+        self.page_combo.blockSignals(False)
+
     def show_previous_page(self):
         """
         Zeigt die vorherige Seite der PDF an, wenn verfügbar.
         """
         if self.current_page > 0:
-            self.current_page -= 1
-            self.page_combo.setCurrentIndex(self.current_page)
-            self.update_zoom_label()  # Verwende update_zoom_label statt update_page_display
-            self.prev_button.setEnabled(self.current_page > 0)
-            self.next_button.setEnabled(self.current_page < self.total_pages - 1)
-            self.render_current_page()
+            # on_page_selected aktualisiert Anzeige und rendert die Seite
+            self.page_combo.setCurrentIndex(self.current_page - 1)
 
     def show_next_page(self):
         """
         Zeigt die nächste Seite der PDF an, wenn verfügbar.
         """
         if self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            self.page_combo.setCurrentIndex(self.current_page)
-            self.update_zoom_label()  # Verwende update_zoom_label statt update_page_display
-            self.prev_button.setEnabled(self.current_page > 0)
-            self.next_button.setEnabled(self.current_page < self.total_pages - 1)
-            self.render_current_page()
+            # on_page_selected aktualisiert Anzeige und rendert die Seite
+            self.page_combo.setCurrentIndex(self.current_page + 1)
 
-    def update_page_display(self):
+    def _update_status(self):
         """
-        Aktualisiert die Anzeige der aktuellen Seitennummer und aktiviert/deaktiviert
-        die Navigationsbuttons je nach Position.
+        Aktualisiert Seitenzahl, Zoom-Anzeige und Navigationsbuttons.
+        Der initiale Zoom (fit_to_window) wird als 100% angezeigt. Labels und
+        Buttons werden nur angefasst, wenn sich ihr Zustand tatsächlich ändert,
+        damit kein unnötiger Layout-Durchlauf ausgelöst wird.
         """
-        self.total_pages_label.setText(str(self.total_pages))
-        self.prev_button.setEnabled(self.current_page > 0)
-        self.next_button.setEnabled(self.current_page < self.total_pages - 1)
+        zoom_percent = int((self.zoom_factor / self.base_zoom) * 100)
+        status = (
+            str(self.total_pages),                    # Gesamtseitenzahl
+            f"Zoom: {zoom_percent}%",                 # Zoom-Anzeige
+            self.current_page > 0,                    # Zurück möglich
+            self.current_page < self.total_pages - 1  # Weiter möglich
+        )
+        last = self.last_status or (None, None, None, None)
+        if status[0] != last[0]:
+            self.total_pages_label.setText(status[0])
+        if status[1] != last[1]:
+            self.zoom_label.setText(status[1])
+        if status[2] != last[2]:
+            self.prev_button.setEnabled(status[2])
+        if status[3] != last[3]:
+            self.next_button.setEnabled(status[3])
+        self.last_status = status
 
     def zoom_in(self):
         """
         Vergrößert die Ansicht um 20%.
         """
         self.zoom_factor = self.zoom_factor * 1.2  # Erhöhe Zoom um 20%
-        self.update_zoom_label()
-        self.render_current_page()
+        self._update_status()
+        self._apply_zoom()
 
     def zoom_out(self):
         """
         Verkleinert die Ansicht um 20%.
         """
         self.zoom_factor = self.zoom_factor * 0.8  # Reduziere Zoom um 20%
-        self.update_zoom_label()
-        self.render_current_page()
+        self._update_status()
+        self._apply_zoom()
 
-    def update_zoom_label(self):
+    def _apply_zoom(self):
         """
-        Aktualisiert die Zoom-Anzeige im Zoom-Label.
-        Der initiale Zoom (fit_to_window) wird als 100% angezeigt.
+        Zeigt die aktuelle Seite im neuen Zoom-Faktor an.
+        
+        Liegt die Seite im neuen Zoom nicht im Cache, wird nur das Label auf
+        die neue Größe gebracht (siehe _show_interim_zoom). Das scharfe
+        Rendern folgt erst, wenn 150ms lang kein weiterer Zoom-Schritt kam.
         """
-        zoom_percent = int((self.zoom_factor / self.base_zoom) * 100)
-        self.zoom_label.setText(f"Zoom: {zoom_percent}%")
+        if not self.pdf_path:
+            return
+        
+        if self._cached_pixmap(self.current_page, self.zoom_factor) is not None:
+            self.zoom_timer.stop()
+            self.render_current_page()                # Sofort aus dem Cache anzeigen
+            return
+        
+        self.display_token = 0                        # Ältere Zoomstufe nicht mehr anzeigen
+        self._show_interim_zoom()
+        self.zoom_timer.start(150)                    # Scharf rendern, sobald Ruhe ist
+
+    def _show_interim_zoom(self):
+        """
+        Bringt die angezeigte Seite sofort auf die Größe des neuen Zooms.
+        
+        Die bisherige Pixmap bzw. die Kacheln werden dabei nur schnell
+        (ungeglättet) beim Zeichnen skaliert; geglättet wird erst die
+        anschließend scharf gerenderte Seite.
+        """
+        showing_page = self.base_pixmap is not None and self.base_page == self.current_page
+        if showing_page or self.preview_label.tiles is not None:
+            self.shown_key = None                     # Anzeige entspricht nicht mehr dem Zoom
+            page_width, page_height = self.page_sizes[self.current_page]
+            self.preview_label.resize(
+                int(page_width * self.zoom_factor),
+                int(page_height * self.zoom_factor)
+            )                                         # Schnelle Zwischenanzeige ohne Kopie
 
     def calculate_fit_zoom_factor(self, page_pixmap):
         """
@@ -325,42 +648,288 @@ class PDFPreviewWidget(QWidget):
         """
         Rendert die aktuelle Seite mit dem aktuellen Zoom-Faktor.
         Verwendet einen höheren Qualitätsfaktor für bessere Darstellung.
+        Bereits gerenderte Seiten werden sofort aus dem Cache angezeigt,
+        alle anderen im Hintergrund gerendert; Ergebnisse zwischenzeitlich
+        überholter Aufträge werden nicht mehr angezeigt. Wird die Seite im
+        selben (gerasterten) Zoom bereits angezeigt oder gerendert, passiert
+        nichts.
         """
         if not self.pdf_path:
             return
         
-        try:
-            # Rendere die Seite mit erhöhter Qualität
-            render_zoom = self.zoom_factor * self.render_quality
-            pix = render_page(self.pdf_path, self.current_page, render_zoom)
-            if not pix:
+        if self.document.is_closed:
+            # Die Datei wurde geändert und woanders neu geöffnet; der Dokument-Cache
+            # hat den alten Stand dabei geschlossen
+            try:
+                self._load_document(self.pdf_path, self.current_page)
+            except Exception as e:
+                self._on_render_error(self.display_token, str(e))
                 return
+            self._update_status()
+        
+        key = self._cache_key(self.current_page, self.zoom_factor)
+        if key == self.shown_key:
+            return                                    # Keine sichtbare Änderung
+        pending = self.pending_renders.get(self.display_token)
+        if pending is not None and pending[1] == key:
+            return                                    # Bereits in Arbeit
+        
+        if self._is_tiled(self.current_page, self.zoom_factor):
+            self._show_tiled_page()                   # Zu groß für ein einzelnes Bild
+            return
+        
+        pixmap = self._cached_pixmap(self.current_page, self.zoom_factor)
+        if pixmap is not None:
+            self.display_token = 0                    # Laufende Aufträge nicht mehr anzeigen
+            self._show_page_pixmap(pixmap, key)       # Zeige die Pixmap
+            QTimer.singleShot(0, self._prefetch_neighbors)  # Nachbarseiten vorrendern
+            return
+        
+        self.display_token = self._start_render_job(self.current_page, self.zoom_factor)
+
+    def _cache_key(self, page, zoom):
+        """
+        Bildet den Cache-Schlüssel einer Seite. Der Zoom-Faktor wird gerastert,
+        damit nahezu gleiche Zoomstufen (z.B. nach kleinen Größenänderungen
+        des Fensters) denselben Eintrag nutzen. Das Pixelverhältnis gehört dazu, da sich die Auflösung
+        beim Verschieben auf einen anderen Bildschirm ändert. Der Änderungszeitpunkt
+        verhindert, dass nach dem Bearbeiten der Datei alte Seiten angezeigt werden.
+        """
+        return (self.pdf_path, self.pdf_mtime, page, _quantize_zoom(zoom), self.devicePixelRatioF())
+
+    def _page_cache_file(self, page, zoom):
+        """
+        Ermittelt die Datei einer Seite im Festplatten-Cache.
+        
+        Der Name setzt sich aus dem Fingerabdruck der PDF, der Seite, dem
+        gerasterten Zoom und dem Pixelverhältnis zusammen. Gespeichert wird
+        als WebP, sofern Qt das Format schreiben kann, sonst als PNG.
+        
+        Returns:
+            str: Pfad der Cache-Datei oder None ohne Fingerabdruck
+        """
+        if not self.pdf_fingerprint:
+            return None
+        name = f"{self.pdf_fingerprint}_{page}_{_quantize_zoom(zoom)}_{self.devicePixelRatioF():g}"
+        return os.path.join(PAGE_CACHE_DIR, f"{name}.{self.page_cache_format}")
+
+    def _pixmap_cache_key(self, page, zoom):
+        """Wandelt den Cache-Schlüssel einer Seite in den Text-Schlüssel des QPixmapCache um."""
+        return "preview|" + "|".join(str(part) for part in self._cache_key(page, zoom))
+
+    def _cached_pixmap(self, page, zoom):
+        """
+        Liefert eine bereits gerenderte Seite aus dem Cache.
+        
+        Args:
+            page (int): Seitennummer (0-basiert)
+            zoom (float): Zoom-Faktor der Anzeige
             
-            # Konvertiere zu QPixmap
-            img_data = pix.tobytes("ppm")
-            qimg = QImage.fromData(img_data)
-            pixmap = QPixmap.fromImage(qimg)
-            
-            # Skaliere auf die tatsächliche Anzeigegröße
-            if self.render_quality != 1.0:
-                display_width = int(pixmap.width() / self.render_quality)
-                display_height = int(pixmap.height() / self.render_quality)
-                pixmap = pixmap.scaled(
-                    display_width, 
-                    display_height,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-            
-            # Zeige die Pixmap
-            self.preview_label.setPixmap(pixmap)
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Fehler beim Rendern",
-                f"Die Seite konnte nicht gerendert werden:\n{str(e)}"
-            )
+        Returns:
+            QPixmap: Die Seite in Anzeigegröße oder None, falls nicht im Cache
+        """
+        pixmap = QPixmapCache.find(self._pixmap_cache_key(page, zoom))
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    def _store_pixmap(self, page, zoom, pixmap):
+        """
+        Legt eine gerenderte Seite im Cache ab. Der QPixmapCache ist nach
+        Speicherbedarf begrenzt (PIXMAP_CACHE_LIMIT) und verdrängt die am
+        längsten nicht genutzten Seiten selbst. Er bleibt über das Schließen
+        der PDF hinaus erhalten, sodass erneutes Öffnen sofort anzeigt.
+        """
+        QPixmapCache.insert(self._pixmap_cache_key(page, zoom), pixmap)
+
+    def _start_render_job(self, page, zoom, priority=1):
+        """
+        Startet das Rendern einer Seite im globalen Thread-Pool.
+        
+        Args:
+            page (int): Seitennummer (0-basiert)
+            zoom (float): Zoom-Faktor der Anzeige
+            priority (int): Priorität im Thread-Pool; die sichtbare Seite
+                hat Vorrang vor vorab geladenen Nachbarseiten
+        
+        Returns:
+            int: Kennung des Auftrags zum Erkennen veralteter Ergebnisse
+        """
+        self.render_seq += 1                          # Neue Auftragskennung
+        job = _RenderJob(self.pdf_path, self.document, page, zoom, self.render_quality,
+                         self.devicePixelRatioF(), self._page_cache_file(page, zoom),
+                         self.render_seq)
+        job.signals.finished.connect(self._on_page_rendered)
+        job.signals.error.connect(self._on_render_error)
+        # Referenz bis zur Zustellung halten
+        self.pending_renders[self.render_seq] = (job.signals, self._cache_key(page, zoom))
+        QThreadPool.globalInstance().start(job, priority)
+        return self.render_seq
+
+    def _prefetch_neighbors(self):
+        """
+        Rendert die Nachbarseiten der aktuellen Seite im Hintergrund vor,
+        damit das Blättern ohne Wartezeit aus dem Cache erfolgen kann.
+        Bereits gecachte oder laufende Seiten werden übersprungen.
+        """
+        if not self.pdf_path:
+            return
+        
+        pending_keys = {key for _, key in self.pending_renders.values()}
+        for page in (self.current_page + 1, self.current_page - 1):
+            if not 0 <= page < self.total_pages:
+                continue                              # Außerhalb des Dokuments
+            key = self._cache_key(page, self.zoom_factor)
+            if key in pending_keys or self._cached_pixmap(page, self.zoom_factor) is not None:
+                continue                              # Bereits vorhanden oder in Arbeit
+            if self._is_tiled(page, self.zoom_factor):
+                continue                              # Kacheln nur für sichtbare Bereiche
+            self._start_render_job(page, self.zoom_factor, priority=0)
+
+    def _on_page_rendered(self, token, pdf_path, page, zoom, image):
+        """
+        Übernimmt eine im Hintergrund gerenderte Seite in den Cache und zeigt
+        sie an, sofern sie zum zuletzt angeforderten Auftrag gehört.
+        """
+        self.pending_renders.pop(token, None)
+        if pdf_path != self.pdf_path:
+            return                                    # PDF wurde inzwischen gewechselt
+        
+        pixmap = QPixmap.fromImage(image)
+        self._store_pixmap(page, zoom, pixmap)
+        if token == self.display_token:
+            self._show_page_pixmap(pixmap, self._cache_key(page, zoom))  # Zeige die Pixmap
+            QTimer.singleShot(0, self._prefetch_neighbors)  # Nachbarseiten vorrendern
+
+    def _show_page_pixmap(self, pixmap, key):
+        """Zeigt eine scharf gerenderte Seite an und merkt sie als Basis für Zoom-Vorschauen."""
+        self.preview_label.set_untiled()
+        self.preview_label.setPixmap(pixmap)
+        self.preview_label.resize(pixmap.size() / pixmap.devicePixelRatio())  # Logische Seitengröße
+        self.base_pixmap = pixmap
+        self.base_page = self.current_page
+        self.shown_key = key
+
+    def _is_tiled(self, page, zoom):
+        """
+        Prüft, ob eine Seite im angegebenen Zoom in Kacheln gerendert wird.
+        
+        Das ist der Fall, sobald das Bild der ganzen Seite in physischen
+        Pixeln TILED_MIN_PIXELS überschreiten würde.
+        """
+        page_width, page_height = self.page_sizes[page]
+        scale = zoom * self.devicePixelRatioF()
+        return page_width * scale * page_height * scale > TILED_MIN_PIXELS
+
+    def _show_tiled_page(self):
+        """
+        Zeigt die aktuelle Seite im Kachelmodus an.
+        
+        Das Label erhält die volle logische Seitengröße, gezeichnet und
+        gerendert werden aber nur die Kacheln im sichtbaren Bereich.
+        """
+        self.display_token = 0                        # Laufende Seitenaufträge nicht mehr anzeigen
+        self.base_pixmap = None                       # Keine ganze Seite als Zoom-Basis
+        page_width, page_height = self.page_sizes[self.current_page]
+        self.preview_label.set_tiled(
+            int(page_width * self.zoom_factor),
+            int(page_height * self.zoom_factor),
+            TILE_SIZE / self.devicePixelRatioF()      # Logische Kantenlänge
+        )
+        self.shown_key = self._cache_key(self.current_page, self.zoom_factor)
+        self._request_visible_tiles()
+
+    def _tile_key(self, column, row):
+        """
+        Bildet den Cache-Schlüssel einer Kachel der aktuellen Seite.
+        
+        Anders als bei ganzen Seiten wird der Zoom nicht gerastert: Kacheln
+        leicht abweichender Zoomstufen würden an den Rändern versetzt
+        aneinanderstoßen.
+        """
+        return (self.pdf_path, self.current_page, round(self.zoom_factor, 6),
+                self.devicePixelRatioF(), column, row)
+
+    def _request_visible_tiles(self):
+        """
+        Zeigt die sichtbaren Kacheln an und rendert fehlende im Hintergrund.
+        
+        Während eines Zoom-Vorgangs (Label noch nicht neu aufgebaut) wird
+        nichts angefordert; das übernimmt der anschließende Kachelaufbau.
+        """
+        label = self.preview_label
+        if not self.pdf_path or label.tiles is None or label.width() != label.tile_width:
+            return
+        
+        # Sichtbarer Bereich in Label-Koordinaten
+        viewport = self.scroll_area.viewport()
+        visible = QRect(label.mapFrom(viewport, QPoint(0, 0)), viewport.size()) & label.rect()
+        if visible.isEmpty():
+            return
+        
+        step = label.tile_step
+        device_pixel_ratio = self.devicePixelRatioF()
+        for row in range(int(visible.top() // step), int(visible.bottom() // step) + 1):
+            for column in range(int(visible.left() // step), int(visible.right() // step) + 1):
+                if (column, row) in label.tiles:
+                    continue                          # Bereits angezeigt
+                key = self._tile_key(column, row)
+                pixmap = self.tile_cache.get(key)
+                if pixmap is not None:
+                    self.tile_cache.move_to_end(key)  # Als zuletzt genutzt markieren
+                    label.tiles[(column, row)] = pixmap
+                    label.update(label.tile_rect(column, row))
+                elif key not in self.pending_tiles:
+                    job = _TileJob(self.document, key, self.zoom_factor, device_pixel_ratio)
+                    job.signals.finished.connect(self._on_tile_rendered)
+                    self.pending_tiles[key] = job.signals  # Referenz bis zur Zustellung halten
+                    QThreadPool.globalInstance().start(job, 1)
+
+    def _on_tile_rendered(self, key, image):
+        """
+        Übernimmt eine gerenderte Kachel in den Cache und zeigt sie an,
+        sofern sie noch zur angezeigten Seite und Zoomstufe gehört.
+        """
+        self.pending_tiles.pop(key, None)
+        if image.isNull() or key[0] != self.pdf_path:
+            return                                    # Fehler oder PDF gewechselt
+        
+        pixmap = QPixmap.fromImage(image)
+        self._store_tile(key, pixmap)
+        label = self.preview_label
+        column, row = key[-2:]
+        if label.tiles is not None and key == self._tile_key(column, row):
+            label.tiles[(column, row)] = pixmap
+            label.update(label.tile_rect(column, row))
+
+    def _store_tile(self, key, pixmap):
+        """
+        Legt eine Kachel im Cache ab. Übersteigt der Speicherbedarf
+        TILE_CACHE_BUDGET, werden die am längsten nicht genutzten Kacheln
+        verdrängt.
+        """
+        self.tile_cache[key] = pixmap
+        self.tile_cache_bytes += pixmap.width() * pixmap.height() * 4
+        while self.tile_cache_bytes > TILE_CACHE_BUDGET and len(self.tile_cache) > 1:
+            _, old = self.tile_cache.popitem(last=False)  # Älteste Kachel verdrängen
+            self.tile_cache_bytes -= old.width() * old.height() * 4
+
+    def _clear_tiles(self):
+        """Verwirft alle Kacheln und verlässt den Kachelmodus."""
+        self.tile_cache.clear()
+        self.tile_cache_bytes = 0
+        self.preview_label.set_untiled()
+
+    def _on_render_error(self, token, message):
+        """Zeigt einen Renderfehler an, sofern er die angezeigte Seite betrifft."""
+        self.pending_renders.pop(token, None)
+        if token != self.display_token:
+            return                                    # Veralteten Auftrag ignorieren
+        QMessageBox.critical(
+            self,
+            "Fehler beim Rendern",
+            f"Die Seite konnte nicht gerendert werden:\n{message}"
+        )
 
     def return_to_home(self):
         """
@@ -373,22 +942,32 @@ class PDFPreviewWidget(QWidget):
         
         # Setze Vorschau zurück
         self.pdf_path = None                          # Lösche PDF-Pfad
+        self.document = None                          # Dokument freigeben
+        self.pdf_fingerprint = None
+        self.pdf_mtime = None
+        with document_lock:
+            release_render_cache()                    # Von MuPDF gehaltene Ressourcen freigeben
         self.current_page = 0                         # Setze Seite zurück
         self.total_pages = 0                          # Setze Seitenzahl zurück
+        self.page_sizes = []                          # Seitengrößen verwerfen
         self.zoom_factor = 1.0                        # Setze Zoom zurück
+        self._clear_tiles()                           # Kacheln freigeben
+        self.base_pixmap = None
+        self.shown_key = None
         self.preview_label.clear()                    # Lösche Vorschau
-        self.update_page_display()                    # Aktualisiere Anzeige
+        self._update_status()                         # Aktualisiere Anzeige
         self.page_combo.clear()
 
     def resizeEvent(self, event):
         """
         Wird bei Änderung der Fenstergröße aufgerufen.
-        Passt die PDF-Vorschau automatisch an die neue Größe an.
+        Passt die PDF-Vorschau automatisch an die neue Größe an, sobald
+        für 80ms keine weitere Größenänderung erfolgt ist.
         """
         super().resizeEvent(event)                    # Rufe Basis-Implementation auf
         
         if self.pdf_path:                            # Wenn PDF geladen
-            self.fit_to_window()                      # Passe an neue Größe an
+            self.resize_timer.start(80)               # Anpassung verzögern (Timer neu starten)
 
     def fit_to_window(self):
         """
@@ -399,29 +978,28 @@ class PDFPreviewWidget(QWidget):
             return
         
         try:
-            # Rendere die Seite zunächst mit Zoom 1.0
-            pix = render_page(self.pdf_path, self.current_page, 1.0)
-            if not pix:
-                return
-            
-            # Konvertiere zu QPixmap für Größenberechnung
-            img_data = pix.tobytes("ppm")
-            qimg = QImage.fromData(img_data)
-            pixmap = QPixmap.fromImage(qimg)
+            # Seitengröße bei Zoom 1.0 (beim Laden ermittelt, kein Probe-Rendering)
+            page_width, page_height = self.page_sizes[self.current_page]
             
             # Berechne verfügbaren Platz (Viewport-Größe)
             available_width = self.scroll_area.viewport().width() - 20
             available_height = self.scroll_area.viewport().height() - 20
             
             # Berechne Skalierungsfaktoren
-            width_ratio = available_width / pixmap.width()
-            height_ratio = available_height / pixmap.height()
+            width_ratio = available_width / page_width
+            height_ratio = available_height / page_height
             
             # Wähle kleineren Faktor für proportionale Skalierung
-            self.base_zoom = min(width_ratio, height_ratio)  # Setze dies als 100%
-            self.zoom_factor = self.base_zoom  # Initialer Zoom ist 100%
+            fit_zoom = min(width_ratio, height_ratio)
             
-            self.update_zoom_label()
+            # Bei 100% ändern Abweichungen unter 1% (z.B. Scrollbar ein/aus) nichts sichtbar
+            at_fit = self.zoom_factor == self.base_zoom
+            if not (at_fit and abs(fit_zoom / self.base_zoom - 1) < 0.01):
+                self.base_zoom = fit_zoom             # Setze dies als 100%
+                self.zoom_factor = self.base_zoom     # Initialer Zoom ist 100%
+                self._update_status()
+                if self._cached_pixmap(self.current_page, self.zoom_factor) is None:
+                    self._show_interim_zoom()         # Bis zum Rendern grob mitskalieren
             self.render_current_page()
             
         except Exception as e:
@@ -437,6 +1015,6 @@ class PDFPreviewWidget(QWidget):
         """
         if index >= 0:  # Verhindere negative Indizes
             self.current_page = index
-            self.update_page_display()  # Aktualisiere Buttons und Anzeige
+            self._update_status()  # Aktualisiere Buttons und Anzeige
             self.render_current_page()
  
\ No newline at end of file
@@ -43,14 +43,46 @@ Autor: Team A2-2
 """
 
 import os
+import threading
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QProgressBar,
     QMessageBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 
-from pdf_tool.utils import split_pdf_into_pages, show_directory_dialog
+from pdf_tool.utils import split_pdf_into_pages_parallel, show_directory_dialog
+
+class SplitWorker(QThread):
+    """Thread zum Trennen der PDF, damit die Oberfläche bedienbar bleibt."""
+    progress = pyqtSignal(int, int)     # Signal mit aktueller Seite und Gesamtanzahl
+    done = pyqtSignal(list, str)        # Signal mit erstellten Dateien und Ausgabeverzeichnis
+    error = pyqtSignal(str)             # Signal mit Fehlermeldung
+
+    def __init__(self, pdf_path, output_dir, workers=None, parent=None):
+        """Initialisiert den Split-Thread."""
+        super().__init__(parent)
+        self.pdf_path = pdf_path        # Pfad zur Eingabe-PDF
+        self.output_dir = output_dir    # Basisverzeichnis für die Ausgabe
+        self.workers = workers          # Anzahl der Prozesse (None: Standard)
+        self.cancel_event = threading.Event()  # Wird beim Abbruch gesetzt
+
+    def stop(self):
+        """Fordert den Abbruch der Aufteilung an."""
+        self.cancel_event.set()
+
+    def run(self):
+        """Trennt die PDF und meldet das Ergebnis per Signal."""
+        try:
+            page_files = split_pdf_into_pages_parallel(self.pdf_path, self.output_dir,
+                                                       workers=self.workers,
+                                                       progress_cb=self.progress.emit,
+                                                       cancel_event=self.cancel_event)
+            if not self.cancel_event.is_set():
+                self.done.emit(page_files, self.output_dir)  # Ergebnis an GUI melden
+        except Exception as e:
+            if not self.cancel_event.is_set():
+                self.error.emit(str(e))         # Fehler an GUI melden
 
 class PDFSplitWidget(QWidget):
     """
@@ -82,6 +114,7 @@ class PDFSplitWidget(QWidget):
         super().__init__(parent)
         self.stacked_widget = stacked_widget          # Übergeordnetes StackedWidget
         self.is_processing = False                    # Flag für laufende Verarbeitung
+        self.split_worker = None                      # Laufender Split-Thread
         
         # Layout erstellen
         layout = QVBoxLayout()                        # Vertikales Hauptlayout
@@ -121,9 +154,9 @@ class PDFSplitWidget(QWidget):
     def split_pdf(self):
         """
         Teilt die aktuelle PDF in einzelne Seiten auf.
-        Zeigt einen Dialog zur Auswahl des Zielverzeichnisses, führt die Aufteilung
-        durch und speichert die einzelnen Seiten als separate PDF-Dateien.
-        Aktualisiert die Benutzeroberfläche während des Prozesses.
+        Zeigt einen Dialog zur Auswahl des Zielverzeichnisses und startet die
+        Aufteilung in einem Hintergrund-Thread, der die einzelnen Seiten als
+        separate PDF-Dateien speichert. Der Fortschritt wird seitenweise angezeigt.
         """
         if self.is_processing:                        # Wenn bereits Verarbeitung läuft
             return
@@ -150,37 +183,70 @@ class PDFSplitWidget(QWidget):
         if not output_dir:                           # Wenn kein Verzeichnis gewählt
             return
             
-        try:
-            self.is_processing = True                 # Setze Verarbeitungs-Flag
-            self.status_label.setText("Trenne PDF in Einzelseiten...")  # Update Status
-            self.progress_bar.setVisible(True)        # Zeige Fortschrittsbalken
-            self.progress_bar.setRange(0, 0)          # Unbestimmter Fortschritt
-            
-            # Trenne die PDF
-            page_files = split_pdf_into_pages(pdf_path, output_dir)  # Führe Trennung durch
-            
-            # Zeige Erfolgsmeldung
-            timestamp = os.path.basename(os.path.dirname(page_files[0]))  # Hole Zeitstempel
-            output_path = os.path.join(output_dir, timestamp)  # Erstelle Ausgabepfad
-            
-            self.status_label.setText("PDF erfolgreich getrennt!")  # Update Status
-            self.output_label.setText(f"Die einzelnen Seiten wurden gespeichert unter:\n{output_path}")  # Zeige Pfad
-            
-            QMessageBox.information(
-                self,
-                "PDF getrennt",
-                f"Die PDF wurde erfolgreich in {len(page_files)} Einzelseiten aufgeteilt.\n\n"
-                f"Die Dateien wurden gespeichert unter:\n{output_path}"
-            )                                         # Zeige Erfolgsmeldung
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Fehler",
-                f"Fehler beim Trennen der PDF:\n{str(e)}"
-            )                                         # Zeige Fehlermeldung
-            self.status_label.setText("Fehler beim Trennen der PDF")  # Update Status
-            
-        finally:
-            self.is_processing = False                # Setze Verarbeitungs-Flag zurück
-            self.progress_bar.setVisible(False)       # Verstecke Fortschrittsbalken 
\ No newline at end of file
+        self.is_processing = True                     # Setze Verarbeitungs-Flag
+        self.status_label.setText("Trenne PDF in Einzelseiten...")  # Update Status
+        self.output_label.clear()                     # Alten Ausgabepfad entfernen
+        self.progress_bar.setRange(0, 0)              # Bis zur ersten Seite unbestimmt
+        self.progress_bar.setVisible(True)            # Zeige Fortschrittsbalken
+        
+        # Trenne die PDF im Hintergrund
+        self.split_worker = SplitWorker(pdf_path, output_dir, parent=self)
+        self.split_worker.progress.connect(self._on_split_progress)
+        self.split_worker.done.connect(self._on_split_done)
+        self.split_worker.error.connect(self._on_split_error)
+        self.split_worker.finished.connect(self.split_worker.deleteLater)
+        self.split_worker.start()
+
+    def _on_split_progress(self, current, total):
+        """Aktualisiert den Fortschrittsbalken."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(current)
+
+    def _on_split_done(self, page_files, output_dir):
+        """Meldet den Erfolg und zeigt den Ausgabepfad an."""
+        self._finish_split()
+        
+        # Zeige Erfolgsmeldung
+        timestamp = os.path.basename(os.path.dirname(page_files[0]))  # Hole Zeitstempel
+        output_path = os.path.join(output_dir, timestamp)  # Erstelle Ausgabepfad
+        
+        self.status_label.setText("PDF erfolgreich getrennt!")  # Update Status
+        self.output_label.setText(f"Die einzelnen Seiten wurden gespeichert unter:\n{output_path}")  # Zeige Pfad
+        
+        QMessageBox.information(
+            self,
+            "PDF getrennt",
+            f"Die PDF wurde erfolgreich in {len(page_files)} Einzelseiten aufgeteilt.\n\n"
+            f"Die Dateien wurden gespeichert unter:\n{output_path}"
+        )                                             # Zeige Erfolgsmeldung
+
+    def _on_split_error(self, message):
+        """Zeigt einen Fehler beim Trennen an."""
+        self._finish_split()
+        QMessageBox.critical(
+            self,
+            "Fehler",
+            f"Fehler beim Trennen der PDF:\n{message}"
+        )                                             # Zeige Fehlermeldung
+        self.status_label.setText("Fehler beim Trennen der PDF")  # Update Status
+
+    def stop_split(self):
+        """
+        Bricht eine laufende Aufteilung ab und wartet auf das Ende des Threads.
+        Wird beim Schließen des Hauptfensters aufgerufen, damit der Thread
+        nicht mit dem Widget zerstört wird, solange er noch läuft.
+        """
+        worker = self.split_worker
+        if worker is None:
+            return
+        for signal in (worker.progress, worker.done, worker.error):
+            signal.disconnect()                       # Keine Meldungen mehr an das Widget
+        worker.stop()
+        worker.wait()                                 # Aktueller Block wird noch abgeschlossen
+        self._finish_split()
+
+    def _finish_split(self):
+        """Setzt den Verarbeitungszustand nach Ende des Split-Threads zurück."""
+        self.split_worker = None
+        self.is_processing = False                    # Setze Verarbeitungs-Flag zurück
+        self.progress_bar.setVisible(False)           # Verstecke Fortschrittsbalken
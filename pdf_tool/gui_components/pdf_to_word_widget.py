@@ -43,102 +43,357 @@ Autor: Team A2-2
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog,
-    QMessageBox, QScrollArea, QApplication
+    QMessageBox, QScrollArea
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QImage, QPixmap
-from ..utils.pdf_functions import render_page, show_save_dialog
-from pdf2docx import Converter
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+from ..utils.pdf_functions import (
+    render_page_to_qimage, get_page_size, show_save_dialog,
+    release_render_cache, pdf_to_word
+)
+from ..utils.pdf_cache import get_doc, document_lock
+from ..utils.disk_cache import (
+    file_fingerprint, cache_image_format, load_cached_image, save_cached_image
+)
+from ..utils.render_pool import render_qimage, get_render_thread_pool
+from ..config import PAGE_CACHE_DIR, PAGE_CACHE_LIMIT
+from collections import deque
+import multiprocessing
+import threading
+import math
 import os
 
-class ConversionThread(QThread):
-    """Thread für die separate Ausführung der PDF zu DOCX Konvertierung."""
-    finished = pyqtSignal(bool, str)  # Signal für Konvertierungsstatus und Fehlermeldung
-    timeout = 15  # Maximale Ausführungszeit in Sekunden
+# Zoomstufen pro Verdopplung für die Vorschau (~4,4% Abstand); gleichartige
+# Fenstergrößen treffen so dieselbe zwischengespeicherte Vorschau
+PREVIEW_ZOOM_STEPS = 16
 
-    def __init__(self, pdf_path, output_path):
-        """Initialisiert den Konvertierungs-Thread."""
+# Anzahl und Größe (logische Pixel) der Miniaturen unter der Vorschau
+THUMBNAIL_PAGES = 5
+THUMBNAIL_WIDTH = 90
+THUMBNAIL_HEIGHT = 120
+
+class _PreviewSignals(QObject):
+    """Signale eines Vorschau-Auftrags (QRunnable kann selbst keine Signale senden)."""
+    thumbnail = pyqtSignal(int, QImage)       # Kennung, Bild in halber Auflösung
+    finished = pyqtSignal(int, str, QImage)   # Kennung, Cache-Schlüssel, Bild
+    error = pyqtSignal(int, str)              # Kennung, Fehlermeldung
+
+class _PreviewJob(QRunnable):
+    """
+    Rendert die Vorschauseite im globalen Thread-Pool aus dem bereits
+    geöffneten (und mit der Vorschau geteilten) Dokument.
+    
+    Zuerst wird eine Vorschau in halber Auflösung (ein Viertel der Pixel)
+    geliefert, die sofort angezeigt werden kann, danach die scharfe Seite.
+    Die Ergebnisse werden als QImage per Signal in den GUI-Thread geliefert,
+    da QPixmap nur dort erzeugt werden darf. Liegt die Vorschau bereits im
+    Festplatten-Cache (auch aus einer früheren Sitzung), wird sie von dort
+    geladen statt gerendert.
+    """
+    def __init__(self, document, pdf_path, zoom, zoom_step, device_pixel_ratio, cache_format,
+                 cache_key, token):
         super().__init__()
-        self.pdf_path = pdf_path        # Pfad zur Eingabe-PDF
-        self.output_path = output_path  # Pfad für die Ausgabe-DOCX
-        self._is_running = True         # Flag für laufende Konvertierung
-        self.cv = None                  # Converter-Instanz
+        self.document = document                # Geöffnetes Dokument (aus dem Dokument-Cache)
+        self.pdf_path = pdf_path                # Pfad zur PDF-Datei (für den Fingerabdruck)
+        self.zoom = zoom                        # Zoom-Faktor der Vorschau (logische Pixel)
+        self.zoom_step = zoom_step              # Gerasterte Zoomstufe (Teil des Dateinamens)
+        self.device_pixel_ratio = device_pixel_ratio  # Pixelverhältnis des Bildschirms
+        self.cache_format = cache_format        # Bildformat im Festplatten-Cache
+        self.cache_key = cache_key              # Schlüssel im QPixmapCache
+        self.token = token                      # Kennung des Auftrags
+        self.signals = _PreviewSignals()        # Signal-Objekt im GUI-Thread
 
-    def stop(self):
-        """Stoppt den Konvertierungsprozess sicher."""
-        self._is_running = False                # Setze Stopp-Flag
-        if self.cv:
+    def run(self):
+        try:
+            self._render()
+        except RuntimeError:
+            pass                                # Signal-Objekt beim Programmende bereits gelöscht
+
+    def _render(self):
+        """Lädt oder rendert die Vorschau und meldet die Stufen per Signal."""
+        try:
+            # Fingerabdruck statt Pfad: bleibt nach Umbenennen gültig, ändert sich mit dem Inhalt
+            dpr = self.device_pixel_ratio
+            name = f"word_{file_fingerprint(self.pdf_path)}_{self.zoom_step}_{dpr:g}.{self.cache_format}"
+            cache_file = os.path.join(PAGE_CACHE_DIR, name)
+            image = load_cached_image(cache_file, dpr)
+            if image is not None:
+                self.signals.finished.emit(self.token, self.cache_key, image)
+                return
+            
+            # In physischen Pixeln rendern, damit Qt auf HiDPI-Bildschirmen nicht hochskaliert
+            with document_lock:
+                image = render_page_to_qimage(self.document, 0, self.zoom * dpr / 2)  # Schnelle Vorschau
+            image.setDevicePixelRatio(dpr / 2)  # Qt streckt sie beim Zeichnen auf volle Größe
+            self.signals.thumbnail.emit(self.token, image)
+            
+            with document_lock:
+                # Rendere in angepasster Größe, direkt aus dem Sample-Puffer (ohne PPM-Umweg)
+                image = render_page_to_qimage(self.document, 0, self.zoom * dpr)
+            image.setDevicePixelRatio(dpr)
+            self.signals.finished.emit(self.token, self.cache_key, image)
+            
             try:
-                self.cv.close()                 # Schließe Converter falls vorhanden
-            except:
-                pass
-        self.terminate()                        # Erzwinge Thread-Beendigung
+                save_cached_image(image, cache_file, PAGE_CACHE_LIMIT)
+            except OSError:
+                pass                            # Ohne Cache weiterarbeiten (Vorschau ist schon da)
+        except Exception as e:
+            self.signals.error.emit(self.token, str(e))
+
+class _ThumbnailSignals(QObject):
+    """Signale eines Miniatur-Auftrags."""
+    finished = pyqtSignal(str, int, QImage)   # Cache-Schlüssel, Seite, Bild
+
+class _ThumbnailJob(QRunnable):
+    """
+    Rendert die Miniatur einer Seite im Render-Prozesspool.
+    
+    PyMuPDF gibt den GIL beim Rendern nicht frei; erst die Prozesse lassen
+    die Miniaturen tatsächlich parallel entstehen. Der Thread wartet nur
+    auf das Ergebnis. Fehler werden als leeres Bild geliefert.
+    """
+    def __init__(self, pdf_path, page, device_pixel_ratio, cache_key):
+        super().__init__()
+        self.pdf_path = pdf_path                # Pfad zur PDF-Datei
+        self.page = page                        # Seitennummer (0-basiert)
+        self.device_pixel_ratio = device_pixel_ratio  # Pixelverhältnis des Bildschirms
+        self.cache_key = cache_key              # Schlüssel im QPixmapCache
+        self.signals = _ThumbnailSignals()      # Signal-Objekt im GUI-Thread
+
+    def run(self):
+        try:
+            image = render_qimage(self.pdf_path, self.page,
+                                  int(THUMBNAIL_WIDTH * self.device_pixel_ratio),
+                                  int(THUMBNAIL_HEIGHT * self.device_pixel_ratio))
+            image.setDevicePixelRatio(self.device_pixel_ratio)
+        except Exception:
+            image = QImage()                    # Miniatur bleibt leer
+        try:
+            self.signals.finished.emit(self.cache_key, self.page, image)
+        except RuntimeError:
+            pass                                # Signal-Objekt beim Programmende bereits gelöscht
+
+def _run_conversion(pdf_path, output_path, conn):
+    """
+    Führt die Konvertierung im Kindprozess aus.
+    
+    Meldet über die Pipe einen leeren Text bei Erfolg, sonst die Fehlermeldung.
+    """
+    try:
+        pdf_to_word(pdf_path, output_path)
+        conn.send("")
+    except Exception as e:
+        conn.send(str(e))
+    finally:
+        conn.close()
+
+class ConversionWorker(QThread):
+    """
+    Thread, der Konvertierungsaufträge nacheinander abarbeitet.
+    
+    Aufträge kommen über add_job in eine Warteschlange, sodass weitere
+    Konvertierungen angestoßen werden können, während eine läuft. Ist die
+    Warteschlange leer, endet der Thread und wird beim nächsten Auftrag
+    neu gestartet.
+    
+    Jede Konvertierung läuft in einem eigenen Prozess, den der Thread
+    überwacht. Nur so lässt sie sich bei Zeitüberschreitung oder Abbruch
+    zuverlässig beenden: pdf2docx prüft keine Abbruch-Flags, und ein Thread
+    darf nicht mitten in einer C-Erweiterung abgebrochen werden.
+    """
+    job_started = pyqtSignal(int)               # Kennung des begonnenen Auftrags
+    job_finished = pyqtSignal(int, bool, str)   # Kennung, Erfolg, Fehlermeldung
+    timeout = 15  # Maximale Ausführungszeit pro Seite in Sekunden
+    kill_grace = 5  # Wartezeit nach terminate() bis zum harten Beenden in Sekunden
+
+    def __init__(self, parent=None):
+        """Initialisiert den Konvertierungs-Thread."""
+        super().__init__(parent)
+        self.jobs = deque()             # Wartende Aufträge (Kennung, PDF, Ausgabe-DOCX)
+        self.last_job_id = 0            # Zuletzt vergebene Auftragskennung
+        self._lock = threading.Lock()   # Schützt Warteschlange und Zustand
+        self._idle = True               # Thread arbeitet gerade keine Aufträge ab
+        self._is_running = True         # Flag für den laufenden Auftrag
+        self.process = None             # Prozess der laufenden Konvertierung
+
+    def add_job(self, pdf_path, output_path):
+        """
+        Stellt eine Konvertierung in die Warteschlange (Aufruf im GUI-Thread).
+        
+        Args:
+            pdf_path (str): Pfad zur Eingabe-PDF
+            output_path (str): Pfad für die Ausgabe-DOCX
+            
+        Returns:
+            int: Kennung des Auftrags in job_started/job_finished
+        """
+        self.last_job_id += 1
+        with self._lock:
+            self.jobs.append((self.last_job_id, pdf_path, output_path))
+            start = self._idle
+            self._idle = False
+        if start:
+            self.wait()                         # Vorheriger Durchlauf verlässt gerade run()
+            self.start()
+        return self.last_job_id
+
+    def stop(self):
+        """Bricht die laufende Konvertierung ab und verwirft wartende Aufträge."""
+        with self._lock:
+            dropped = [job_id for job_id, _, _ in self.jobs]
+            self.jobs.clear()
+            self._is_running = False            # Setze Stopp-Flag
+            process = self.process
+        if process is not None and process.is_alive():
+            process.terminate()                 # Beende den Kindprozess (run wartet darauf)
+        for job_id in dropped:
+            self.job_finished.emit(job_id, False, "Die Konvertierung wurde abgebrochen.")
 
     def run(self):
-        """Führt die eigentliche Konvertierung durch."""
+        """Arbeitet die Warteschlange ab, bis sie leer ist."""
+        while True:
+            with self._lock:
+                if not self.jobs:
+                    self._idle = True
+                    return
+                job_id, pdf_path, output_path = self.jobs.popleft()
+                self._is_running = True
+            self.job_started.emit(job_id)
+            self._convert(job_id, pdf_path, output_path)
+
+    def _convert(self, job_id, pdf_path, output_path):
+        """Führt einen Auftrag im Kindprozess aus und meldet das Ergebnis."""
         try:
-            # Starte Watchdog-Timer für Timeout-Überwachung
-            watchdog = QTimer()                 # Timer für Timeout-Überwachung
-            watchdog.setSingleShot(True)        # Timer läuft nur einmal
-            watchdog.timeout.connect(self.stop) # Verbinde mit Stopp-Funktion
-            watchdog.start(self.timeout * 1000) # Starte Timer mit Timeout in ms
+            # Zeitlimit nach Seitenzahl, da die Dauer mit dem Umfang wächst; die Seitenzahl
+            # stammt aus dem (von der Vorschau bereits geöffneten) Dokument-Cache
+            document = get_doc(pdf_path)
+            with document_lock:
+                page_count = document.page_count
+            time_limit = self.timeout * max(1, page_count)
             
-            # Führe Konvertierung durch
-            self.cv = Converter(self.pdf_path)  # Erstelle Converter-Instanz
-            if not self._is_running:            # Prüfe auf vorzeitigen Abbruch
-                raise Exception("Timeout")
-                
-            self.cv.convert(self.output_path)   # Starte Konvertierung
-            self.cv.close()                     # Schließe Converter
+            # Starte die Konvertierung im Kindprozess ("spawn": Fork des Qt-Prozesses ist unsicher)
+            context = multiprocessing.get_context("spawn")
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_run_conversion,
+                args=(pdf_path, output_path, sender)
+            )                                   # Nicht als Daemon: pdf2docx startet selbst Prozesse
+            with self._lock:
+                self.process = process
+            process.start()
+            sender.close()                      # Nur der Kindprozess schreibt
+            if not self._is_running:
+                process.terminate()             # Abbruch kam vor dem Start des Prozesses
             
-            if self._is_running:
-                self.finished.emit(True, "")     # Signalisiere erfolgreiche Konvertierung
-            else:
-                # Lösche unvollständige Ausgabedatei bei Abbruch
+            # Warte auf das Ergebnis oder die Zeitüberschreitung
+            error = None
+            if receiver.poll(time_limit):
                 try:
-                    if os.path.exists(self.output_path):
-                        os.remove(self.output_path)  # Entferne unvollständige Datei
-                except:
-                    pass
-                self.finished.emit(False, "Konvertierung nicht möglich: Die PDF enthält möglicherweise komplexe Vektorgrafiken oder andere nicht unterstützte Elemente.")
+                    error = receiver.recv()     # "" bei Erfolg
+                except EOFError:
+                    pass                        # Prozess wurde beendet (Abbruch)
+            else:
+                self._is_running = False        # Zeitüberschreitung
+            receiver.close()
+            if process.is_alive():
+                process.terminate()
+            process.join(self.kill_grace)
+            if process.is_alive():
+                process.kill()                  # SIGTERM ignoriert (z.B. in C-Code blockiert)
+                process.join()
+            with self._lock:
+                self.process = None
+            
+            if self._is_running and error == "":
+                self.job_finished.emit(job_id, True, "")  # Signalisiere erfolgreiche Konvertierung
+                return
+            if self._is_running:
+                raise RuntimeError(error or "Die Konvertierung wurde unerwartet beendet.")
+            
+            # Lösche unvollständige Ausgabedatei bei Abbruch
+            try:
+                if os.path.exists(output_path):
+                    os.remove(output_path)      # Entferne unvollständige Datei
+            except:
+                pass
+            self.job_finished.emit(job_id, False, "Konvertierung nicht möglich: Die PDF enthält möglicherweise komplexe Vektorgrafiken oder andere nicht unterstützte Elemente.")
 
         except Exception as e:
             # Fehlerbehandlung bei Konvertierungsproblemen
             try:
-                if os.path.exists(self.output_path):
-                    os.remove(self.output_path)  # Entferne fehlerhafte Ausgabedatei
+                if os.path.exists(output_path):
+                    os.remove(output_path)      # Entferne fehlerhafte Ausgabedatei
             except:
                 pass
             
-            if not self._is_running:
-                self.finished.emit(False, "Konvertierung nicht möglich: Die PDF enthält möglicherweise komplexe Vektorgrafiken oder andere nicht unterstützte Elemente.")
-            else:
-                self.finished.emit(False, str(e))  # Gebe Original-Fehlermeldung zurück
+            self.job_finished.emit(job_id, False, str(e))  # Gebe Original-Fehlermeldung zurück
 
 class ConversionDialog(QMessageBox):
-    """Dialog zur Anzeige des Konvertierungsfortschritts mit Animation."""
-    def __init__(self, parent=None):
-        """Initialisiert den Konvertierungsdialog."""
+    """
+    Dialog zur Anzeige des Konvertierungsfortschritts mit Animation.
+    
+    Die animierten Punkte stehen in einem eigenen Label fester Größe neben
+    dem statischen Text. Qt muss so beim Animieren nur dieses Label neu
+    zeichnen, statt bei jedem setText das ganze Dialog-Layout neu zu berechnen.
+    """
+    def __init__(self, parent=None, queued=False):
+        """
+        Initialisiert den Konvertierungsdialog.
+        
+        Args:
+            parent (QWidget, optional): Übergeordnetes Widget
+            queued (bool): Auftrag wartet noch auf eine vorherige Konvertierung;
+                die Animation startet dann erst mit conversion_started
+        """
         super().__init__(parent)
         self.setIcon(QMessageBox.Information)    # Setze Info-Icon
         self.setWindowTitle("Konvertierung")     # Setze Fenstertitel
-        self.setText("Konvertierung des PDF-Dokumentes\nnach DOCX")  # Setze Anfangstext
+        if queued:
+            self.setText("Konvertierung des PDF-Dokumentes\nnach DOCX - wartet")  # Wartetext
+        else:
+            self.setText("Konvertierung des PDF-Dokumentes\nnach DOCX")  # Setze Anfangstext
         self.setStandardButtons(QMessageBox.NoButton)  # Keine Buttons initial
         
+        # Label für die Punkte direkt rechts neben dem Text
+        self.dots_label = None                   # Label für die Animations-Punkte
+        text_label = self.findChild(QLabel, "qt_msgbox_label")  # Textlabel der QMessageBox
+        layout = self.layout()
+        if text_label is not None and layout is not None and layout.indexOf(text_label) >= 0:
+            row, column, _, _ = layout.getItemPosition(layout.indexOf(text_label))
+            self.dots_label = QLabel(self)
+            metrics = self.dots_label.fontMetrics()
+            # Feste Größe: Textänderungen lösen keine Neuberechnung des Layouts aus
+            self.dots_label.setFixedSize(metrics.horizontalAdvance("..."), metrics.height())
+            layout.addWidget(self.dots_label, row, column + 1, Qt.AlignLeft | Qt.AlignBottom)
+        
         # Initialisiere Animation
         self.dots = ""                           # Punkte für Animation
         self.timer = QTimer(self)                # Timer für Animation
         self.timer.timeout.connect(self.update_animation)  # Verbinde mit Update-Funktion
-        self.timer.start(500)                    # Starte Timer (500ms Intervall)
+        if not queued:
+            self.timer.start(500)                # Starte Timer (500ms Intervall)
+        
+    def conversion_started(self):
+        """Wechselt von der Warteanzeige zur laufenden Konvertierung."""
+        if not self.timer.isActive():
+            self.setText("Konvertierung des PDF-Dokumentes\nnach DOCX")
+            self.timer.start(500)
         
     def update_animation(self):
-        """Aktualisiert die animierten Punkte im Dialog."""
+        """Aktualisiert die animierten Punkte im Dialog (nur solange er sichtbar ist)."""
+        if not self.isVisible():
+            return                               # Verborgen: nichts neu zeichnen
         self.dots = "." * ((len(self.dots) + 1) % 4)  # Aktualisiere Animations-Punkte
-        self.setText(f"Konvertierung des PDF-Dokumentes\nnach DOCX{self.dots}")  # Aktualisiere Text
+        if self.dots_label is not None:
+            self.dots_label.setText(self.dots)   # Nur die Punkte neu zeichnen
+        else:
+            self.setText(f"Konvertierung des PDF-Dokumentes\nnach DOCX{self.dots}")  # Aktualisiere Text
         
     def conversion_finished(self, success, error_msg=None):
         """Zeigt das Ergebnis der Konvertierung an."""
         self.timer.stop()                        # Stoppe Animation
+        if self.dots_label is not None:
+            self.dots_label.hide()               # Punkte gehören nicht zum Ergebnistext
         if success:
             self.setText("Konvertierung des PDF-Dokumentes\nnach DOCX - Erfolg!")  # Erfolgstext
             self.setStandardButtons(QMessageBox.Ok)  # Zeige OK-Button
@@ -153,7 +408,26 @@ class PDFToWordWidget(QWidget):
         """Initialisiert das PDF zu Word Konvertierungs-Widget."""
         super().__init__(parent)
         self.stacked_widget = stacked_widget      # Übergeordnetes Widget
-        self.conversion_thread = None             # Thread für Konvertierung
+        self.conversion_dialogs = {}              # Auftragskennung -> Dialog offener Konvertierungen
+        
+        # Ein Thread arbeitet alle Konvertierungen der Reihe nach ab; das Ergebnis
+        # ausdrücklich über die Ereignisschleife, damit es immer im GUI-Thread ankommt
+        self.conversion_worker = ConversionWorker(self)
+        self.conversion_worker.job_started.connect(self._on_conversion_started, Qt.QueuedConnection)
+        self.conversion_worker.job_finished.connect(self.conversion_finished, Qt.QueuedConnection)
+        self.current_pdf = None                   # Aktuelle PDF (vom Hauptfenster über pdf_changed)
+        self.pending_preview = None               # PDF, deren Vorschau noch aussteht
+        self.preview_seq = 0                      # Kennung des zuletzt gestarteten Vorschau-Auftrags
+        self.preview_signals = {}                 # Kennung -> Signale laufender Aufträge
+        self.rendered_since_release = False       # Seit dem letzten Freigeben des MuPDF-Speichers gerendert
+        self.pending_thumbnails = {}              # Cache-Schlüssel -> Signale laufender Miniatur-Aufträge
+        self.thumbnail_keys = [None] * THUMBNAIL_PAGES  # Angeforderter Cache-Schlüssel je Miniatur
+        self.preview_cache_format = cache_image_format()  # Bildformat im Festplatten-Cache
+        
+        # Fasst schnell aufeinanderfolgende Anzeige-Ereignisse zu einer Vorschau zusammen
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self._show_pending_preview)
         
         # Erstelle Layout
         layout = QVBoxLayout()
@@ -186,46 +460,222 @@ class PDFToWordWidget(QWidget):
         preview_layout.addWidget(scroll_area)            # Füge Scroll-Bereich hinzu
         
         layout.addWidget(preview_container, 1)           # Füge Container hinzu
+        
+        # Miniaturen der ersten Seiten unter der Vorschau
+        thumbnail_strip = QHBoxLayout()
+        thumbnail_strip.setSpacing(10)                   # Abstand zwischen Miniaturen
+        self.thumbnail_labels = []                       # Label je Miniatur
+        for _ in range(THUMBNAIL_PAGES):
+            label = QLabel()
+            label.setFixedSize(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+            label.setAlignment(Qt.AlignCenter)           # Zentriere Inhalt
+            label.hide()                                 # Erst mit einer PDF anzeigen
+            thumbnail_strip.addWidget(label)
+            self.thumbnail_labels.append(label)
+        thumbnail_strip.addStretch()                     # Miniaturen linksbündig
+        layout.addLayout(thumbnail_strip)
 
         self.setLayout(layout)                          # Setze Layout
 
+    def set_current_pdf(self, pdf_path):
+        """
+        Übernimmt die im Hauptfenster geöffnete PDF (Slot für pdf_changed).
+        
+        Args:
+            pdf_path (str): Pfad zur PDF oder "" nach dem Schließen
+        """
+        self.current_pdf = pdf_path or None
+        if self.isVisible():
+            self._update_preview()
+
     def showEvent(self, event):
         """Wird beim Anzeigen des Widgets aufgerufen."""
         super().showEvent(event)
-        main_window = self.window()                     # Hole Hauptfenster
-        pdf_path = main_window.get_current_pdf()        # Hole aktuelle PDF
-        
-        if pdf_path:
-            self.show_preview(pdf_path)                 # Zeige Vorschau
+        self._update_preview()
+
+    def _update_preview(self):
+        """Zeigt die Vorschau der aktuellen PDF bzw. einen Hinweis ohne PDF an."""
+        if self.current_pdf:
+            self._schedule_preview(self.current_pdf)    # Vorschau verzögert anzeigen
         else:
+            self.preview_timer.stop()
+            self.pending_preview = None
+            self.preview_seq += 1                       # Laufende Aufträge nicht mehr anzeigen
             self.preview_label.clear()                  # Lösche Vorschau
             self.preview_label.setText("Keine PDF-Datei geöffnet")  # Zeige Info-Text
+            for page, label in enumerate(self.thumbnail_labels):
+                self.thumbnail_keys[page] = None
+                label.clear()
+                label.hide()
+
+    def hideEvent(self, event):
+        """
+        Verwirft eine noch ausstehende Vorschau, wenn das Widget verborgen wird,
+        und gibt die angezeigte frei. Sie bleibt nur im (begrenzten) QPixmapCache
+        und wird beim nächsten Anzeigen von dort geholt.
+        
+        Der MuPDF-Speicher wird nur geleert, wenn seit dem letzten Mal
+        tatsächlich gerendert wurde und die Seitenvorschau das Dokument nicht
+        mehr verwendet; sonst müsste sie ihre Ressourcen erneut laden.
+        """
+        super().hideEvent(event)
+        self.preview_timer.stop()
+        self.pending_preview = None
+        self.preview_seq += 1                           # Laufende Aufträge nicht mehr anzeigen
+        self.preview_label.clear()                      # Pixmap-Referenz des Labels freigeben
+        if self.rendered_since_release and not self._document_in_page_preview():
+            self.rendered_since_release = False
+            with document_lock:
+                release_render_cache()                  # Von MuPDF gehaltene Ressourcen freigeben
+
+    def _document_in_page_preview(self):
+        """Prüft, ob die Seitenvorschau des Hauptfensters dieselbe PDF geöffnet hat."""
+        page_preview = getattr(self.window(), "page_pdf_preview", None)
+        return (page_preview is not None and page_preview.document is not None
+                and page_preview.pdf_path == self.current_pdf)
+
+    def resizeEvent(self, event):
+        """
+        Passt die Vorschau nach einer Größenänderung an. Beim Ziehen von
+        Fenster oder Splitter kommen viele Ereignisse kurz nacheinander;
+        gerendert wird erst für die endgültige Größe.
+        """
+        super().resizeEvent(event)
+        if self.isVisible() and self.current_pdf:       # Sonst übernimmt showEvent das Anzeigen
+            self._schedule_preview(self.current_pdf)
+
+    def _schedule_preview(self, pdf_path):
+        """Merkt die PDF für die Vorschau vor und startet den Entprell-Timer neu."""
+        self.pending_preview = pdf_path
+        self.preview_timer.start(80)
+
+    def _show_pending_preview(self):
+        """Zeigt die Vorschau an, sobald 80ms lang kein weiteres Anzeige-Ereignis kam."""
+        if self.pending_preview:
+            self.show_preview(self.pending_preview)
+            self.pending_preview = None
 
     def show_preview(self, pdf_path):
-        """Zeigt eine Vorschau der ersten PDF-Seite."""
+        """
+        Zeigt eine Vorschau der ersten PDF-Seite.
+        Bereits gerenderte Vorschauen kommen aus dem Cache, alle anderen werden
+        im Hintergrund gerendert; Ergebnisse überholter Aufträge werden verworfen.
+        """
+        self.preview_seq += 1                           # Ältere Aufträge nicht mehr anzeigen
         try:
-            # Rendere erste Seite
-            pix = render_page(pdf_path, 0, 1.0)        # Rendere in Originalgröße
+            # Dokument mit der Vorschau teilen statt erneut zu parsen
+            document = get_doc(pdf_path)
+            
+            # Seitengröße bei Zoom 1.0 ohne Probe-Rendering ermitteln
+            with document_lock:
+                page_width, page_height = get_page_size(document, 0)
+                page_count = document.page_count
+            self._show_thumbnails(pdf_path, page_count)
             
             # Berechne optimalen Zoom
             visible_width = self.preview_label.parent().width() - 40   # Verfügbare Breite
             visible_height = self.preview_label.parent().height() - 40  # Verfügbare Höhe
-            width_ratio = visible_width / pix.width      # Breiten-Verhältnis
-            height_ratio = visible_height / pix.height   # Höhen-Verhältnis
+            width_ratio = visible_width / page_width     # Breiten-Verhältnis
+            height_ratio = visible_height / page_height  # Höhen-Verhältnis
             zoom = min(width_ratio, height_ratio)        # Optimaler Zoom-Faktor
+            if zoom <= 0:
+                return                                  # Noch kein Platz für die Vorschau
             
-            # Rendere mit Zoom
-            pix = render_page(pdf_path, 0, zoom)         # Rendere in angepasster Größe
+            # Auf die nächstkleinere Zoomstufe abrunden, damit die Seite weiterhin passt
+            zoom_step = math.floor(math.log2(zoom) * PREVIEW_ZOOM_STEPS)
+            zoom = 2 ** (zoom_step / PREVIEW_ZOOM_STEPS)
             
-            # Konvertiere und zeige an
-            img_data = pix.tobytes("ppm")               # Konvertiere zu Bilddaten
-            qimg = QImage.fromData(img_data)            # Erstelle QImage
-            pixmap = QPixmap.fromImage(qimg)            # Konvertiere zu Pixmap
-            self.preview_label.setPixmap(pixmap)        # Zeige Vorschau
+            # Beim erneuten Anzeigen (z.B. Wechsel zwischen Funktionen) aus dem Cache;
+            # der Änderungszeitpunkt im Schlüssel verwirft veraltete Vorschauen
+            dpr = self.preview_label.devicePixelRatioF()
+            cache_key = f"word|{pdf_path}|{os.path.getmtime(pdf_path)}|{zoom_step}|{dpr:g}"
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is not None and not pixmap.isNull():
+                self.preview_label.setPixmap(pixmap)    # Zeige Vorschau
+                return
+            
+            # Platzhalter, bis die erste Stufe fertig ist (eine vorhandene Vorschau bleibt stehen)
+            current = self.preview_label.pixmap()
+            if current is None or current.isNull():
+                self.preview_label.setText("Lade Vorschau …")
+            
+            # Rendere einmalig im passenden Zoom im Hintergrund
+            job = _PreviewJob(document, pdf_path, zoom, zoom_step, dpr,
+                              self.preview_cache_format, cache_key, self.preview_seq)
+            job.signals.thumbnail.connect(self._on_preview_thumbnail)
+            job.signals.finished.connect(self._on_preview_rendered)
+            job.signals.error.connect(self._on_preview_error)
+            self.preview_signals[self.preview_seq] = job.signals  # Referenz bis zur Zustellung halten
+            QThreadPool.globalInstance().start(job)
             
         except Exception as e:
-            self.preview_label.clear()                  # Lösche Vorschau
-            self.preview_label.setText(f"Fehler beim Laden der Vorschau:\n{str(e)}")  # Zeige Fehler
+            self._on_preview_error(self.preview_seq, str(e))
+
+    def _show_thumbnails(self, pdf_path, page_count):
+        """
+        Zeigt die Miniaturen der ersten Seiten an. Fehlende werden parallel
+        im Render-Prozesspool erzeugt, bereits gerenderte kommen aus dem Cache.
+        Für Miniaturen, die noch gerendert werden, wird kein weiterer Auftrag
+        gestartet (z.B. bei mehreren Größenänderungen hintereinander).
+        """
+        dpr = self.devicePixelRatioF()
+        mtime = os.path.getmtime(pdf_path)
+        for page, label in enumerate(self.thumbnail_labels):
+            if page >= page_count:
+                self.thumbnail_keys[page] = None
+                label.clear()
+                label.hide()                            # PDF hat weniger Seiten
+                continue
+            label.show()
+            cache_key = f"wordthumb|{pdf_path}|{mtime}|{page}|{dpr:g}"
+            if cache_key == self.thumbnail_keys[page] and cache_key in self.pending_thumbnails:
+                continue                                # Wird bereits gerendert
+            self.thumbnail_keys[page] = cache_key
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is not None and not pixmap.isNull():
+                label.setPixmap(pixmap)
+                continue
+            label.clear()
+            if cache_key in self.pending_thumbnails:
+                continue                                # Ergebnis des laufenden Auftrags abwarten
+            job = _ThumbnailJob(pdf_path, page, dpr, cache_key)
+            job.signals.finished.connect(self._on_thumbnail_rendered)
+            self.pending_thumbnails[cache_key] = job.signals  # Referenz bis zur Zustellung halten
+            get_render_thread_pool().start(job)
+
+    def _on_thumbnail_rendered(self, cache_key, page, image):
+        """Übernimmt eine gerenderte Miniatur, sofern sie noch angefordert ist."""
+        self.pending_thumbnails.pop(cache_key, None)
+        if image.isNull():
+            return                                      # Miniatur bleibt leer
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)          # Für erneutes Anzeigen merken
+        if self.thumbnail_keys[page] == cache_key:
+            self.thumbnail_labels[page].setPixmap(pixmap)
+
+    def _on_preview_thumbnail(self, token, image):
+        """Zeigt die Vorschau in halber Auflösung bis zum Eintreffen der scharfen Seite an."""
+        self.rendered_since_release = True              # Nur gerenderte, nicht geladene Vorschauen
+        if token != self.preview_seq:
+            return                                      # Veralteten Auftrag ignorieren
+        # Das halbe Pixelverhältnis lässt Qt sie beim Zeichnen ungeglättet auf volle Größe strecken
+        self.preview_label.setPixmap(QPixmap.fromImage(image))  # Zeige vorläufige Vorschau
+
+    def _on_preview_rendered(self, token, cache_key, image):
+        """Übernimmt die gerenderte Vorschau und zeigt sie an, sofern sie noch aktuell ist."""
+        self.preview_signals.pop(token, None)
+        pixmap = QPixmap.fromImage(image)               # Konvertiere zu Pixmap
+        QPixmapCache.insert(cache_key, pixmap)          # Für erneutes Anzeigen merken
+        if token == self.preview_seq:
+            self.preview_label.setPixmap(pixmap)        # Zeige Vorschau
+
+    def _on_preview_error(self, token, message):
+        """Zeigt einen Fehler beim Laden der Vorschau an, sofern er noch aktuell ist."""
+        self.preview_signals.pop(token, None)
+        if token != self.preview_seq:
+            return                                      # Veralteten Auftrag ignorieren
+        self.preview_label.clear()                      # Lösche Vorschau
+        self.preview_label.setText(f"Fehler beim Laden der Vorschau:\n{message}")  # Zeige Fehler
 
     def convert_to_word(self):
         """Startet die Konvertierung der PDF in DOCX."""
@@ -252,30 +702,49 @@ class PDFToWordWidget(QWidget):
         )
         
         if output_path:
+            # Läuft bereits eine Konvertierung, wird der Auftrag angehängt
+            progress_dialog = ConversionDialog(self, queued=self.is_converting)  # Erstelle Dialog
+            progress_dialog.show()                     # Zeige Dialog (gezeichnet, sobald die Ereignisschleife wieder läuft)
             try:
-                # Starte Konvertierung
-                self.progress_dialog = ConversionDialog(self)  # Erstelle Dialog
-                self.progress_dialog.show()                    # Zeige Dialog
-                QApplication.processEvents()                   # Aktualisiere UI
-                
-                # Erstelle und starte Thread
-                self.conversion_thread = ConversionThread(pdf_path, output_path)  # Erstelle Thread
-                self.conversion_thread.finished.connect(self.conversion_finished)  # Verbinde Signal
-                self.conversion_thread.start()                                    # Starte Thread
-                
+                job_id = self.conversion_worker.add_job(pdf_path, output_path)  # Auftrag einreihen
+                self.conversion_dialogs[job_id] = progress_dialog
             except Exception as e:
-                if hasattr(self, 'progress_dialog'):
-                    self.progress_dialog.conversion_finished(False, str(e))  # Zeige Fehler
+                progress_dialog.conversion_finished(False, str(e))  # Zeige Fehler
 
-    def conversion_finished(self, success, error_msg):
-        """Wird nach Abschluss der Konvertierung aufgerufen."""
+    def stop_conversions(self):
+        """
+        Bricht die laufende Konvertierung ab, verwirft wartende und wartet auf
+        das Ende des Threads. Aufruf beim Beenden des Programms: sonst würde
+        ein laufender QThread zerstört und der (nicht als Daemon gestartete)
+        Konvertierungsprozess bliebe zurück bzw. hielte das Programmende auf.
+        """
+        self.conversion_worker.stop()
+        self.conversion_worker.wait()
+
+    @property
+    def is_converting(self):
+        """bool: Ob noch Konvertierungen laufen oder warten."""
+        return bool(self.conversion_dialogs)
+
+    def _on_conversion_started(self, job_id):
+        """Zeigt im Dialog eines wartenden Auftrags an, dass er jetzt läuft."""
+        progress_dialog = self.conversion_dialogs.get(job_id)
+        if progress_dialog is not None:
+            progress_dialog.conversion_started()
+
+    def conversion_finished(self, job_id, success, error_msg):
+        """
+        Wird nach Abschluss einer Konvertierung im GUI-Thread aufgerufen.
+        
+        Args:
+            job_id (int): Kennung des Auftrags
+            success (bool): Ob die Konvertierung erfolgreich war
+            error_msg (str): Fehlermeldung (leer bei Erfolg)
+        """
         try:
-            if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                self.progress_dialog.conversion_finished(success, error_msg)  # Aktualisiere Dialog
-                
-            if hasattr(self, 'conversion_thread') and self.conversion_thread:
-                self.conversion_thread.wait()    # Warte auf Thread-Ende
-                self.conversion_thread = None    # Lösche Thread-Referenz
+            progress_dialog = self.conversion_dialogs.pop(job_id, None)
+            if progress_dialog is not None:
+                progress_dialog.conversion_finished(success, error_msg)  # Aktualisiere Dialog
                 
         except Exception as e:
             QMessageBox.critical(
@@ -37,6 +37,12 @@ from .pdf_functions import (
     # PDF-Grundfunktionen
     load_pdf,           # Laden einer PDF-Datei
     render_page,        # Rendern einer PDF-Seite
+    get_page_size,      # Seitengröße ohne Rendern ermitteln
+    get_page_sizes,     # Größen aller Seiten ohne Rendern ermitteln
+    release_render_cache,  # MuPDF-Ressourcenspeicher leeren
+    pixmap_to_qpixmap,  # Gerenderte Seite in QPixmap umwandeln
+    pixmap_to_qimage,   # Gerenderte Seite in QImage umwandeln (threadsicher)
+    render_page_to_qimage,  # Seite direkt als QImage rendern
     
     # Dateioperationen
     show_pdf_open_dialog,    # Dialog zum Öffnen einer PDF
@@ -45,9 +51,14 @@ from .pdf_functions import (
     
     # PDF-Verarbeitung
     pdf_to_word,            # PDF zu Word Konvertierung
+    prewarm_pdf_to_word,    # pdf2docx im Hintergrund vorladen
     split_pdf_into_pages,   # PDF in Einzelseiten trennen
+    split_pdf_into_pages_parallel, # PDF parallel in Einzelseiten trennen
     merge_pdfs,            # PDFs zusammenführen
     extract_images_from_pdf, # Bilder aus PDF extrahieren
+    extract_images_iter,    # Bilder schrittweise extrahieren
+    extract_images_from_pdf_parallel, # Bilder parallel extrahieren
+    extract_images_to_zip_stream, # Bilder direkt als ZIP speichern
     extract_zugferd_data,   # ZUGFeRD-Daten extrahieren
     
     # Hilfsfunktionen
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PDF Tool - Festplatten-Cache
+
+Hilfsfunktionen für die zwischen Sitzungen erhaltenen Bild-Caches
+(Vorschaukacheln beim Zusammenführen, gerenderte Seiten der Vorschau).
+
+Technische Details:
+- Größenbegrenzung nach LRU-Prinzip über den Änderungszeitpunkt der Dateien
+- Treffer werden per os.utime als zuletzt genutzt markiert
+- Gerenderte Seiten als WebP, sofern Qt das Format schreiben kann, sonst PNG
+- Fingerabdruck einer PDF aus Dateigröße, Änderungszeitpunkt sowie Anfang
+  und Ende des Inhalts (mit Trailer und Dokument-ID), sodass dieselbe Datei
+  auch nach Umbenennen oder Verschieben wiedererkannt wird, jede Bearbeitung
+  aber einen neuen Fingerabdruck ergibt
+
+Verwendung:
+    from pdf_tool.utils.disk_cache import (
+        trim_cache_dir, file_fingerprint, cache_image_format,
+        load_cached_image, save_cached_image
+    )
+
+    key = file_fingerprint('dokument.pdf')
+    trim_cache_dir(cache_dir, 500 * 1024 * 1024)
+
+    cache_file = os.path.join(cache_dir, f"{key}.{cache_image_format()}")
+    image = load_cached_image(cache_file)
+    if image is None:
+        image = render(...)
+        save_cached_image(image, cache_file, 500 * 1024 * 1024)
+
+Autor: Team A2-2
+"""
+
+import os
+import hashlib
+from PyQt5.QtGui import QImage, QImageWriter
+
+# Anzahl der Bytes vom Dateianfang, die in den Fingerabdruck eingehen
+FINGERPRINT_BYTES = 1024 * 1024
+
+# Anzahl der Bytes vom Dateiende (Trailer, Querverweise, Dokument-ID)
+FINGERPRINT_TAIL_BYTES = 64 * 1024
+
+def file_fingerprint(path):
+    """
+    Berechnet einen kurzen Fingerabdruck einer Datei.
+
+    Args:
+        path (str): Pfad zur Datei
+
+    Returns:
+        str: Hexadezimaler Fingerabdruck (32 Zeichen)
+    """
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    # Änderungszeitpunkt erfasst auch gleich lange Änderungen hinter dem gelesenen Anfang
+    digest.update(f"{stat.st_size}|{stat.st_mtime_ns}".encode("ascii"))
+    with open(path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if stat.st_size > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, stat.st_size - FINGERPRINT_TAIL_BYTES))
+            digest.update(f.read(FINGERPRINT_TAIL_BYTES))
+    return digest.hexdigest()
+
+def cache_image_format():
+    """
+    Wählt das Bildformat für gecachte Seiten.
+
+    WebP ist klein und schnell, benötigt aber das Qt-Plugin für Bildformate.
+
+    Returns:
+        str: Dateiendung "webp" oder ersatzweise "png"
+    """
+    return "webp" if b"webp" in QImageWriter.supportedImageFormats() else "png"
+
+def load_cached_image(cache_file, device_pixel_ratio=1.0):
+    """
+    Lädt ein Bild aus dem Festplatten-Cache und markiert es als zuletzt genutzt.
+
+    Args:
+        cache_file (str): Pfad der Cache-Datei (oder None)
+        device_pixel_ratio (float): Pixelverhältnis, mit dem das Bild
+            gerendert wurde (geht beim Speichern verloren)
+
+    Returns:
+        QImage: Das Bild oder None, falls nicht (lesbar) im Cache
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return None
+    image = QImage(cache_file)
+    if image.isNull():
+        return None
+    os.utime(cache_file)                          # Als zuletzt genutzt markieren
+    image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+def save_cached_image(image, cache_file, limit):
+    """
+    Legt ein Bild im Festplatten-Cache ab und hält dessen Limit ein.
+
+    Das Format ergibt sich aus der Dateiendung (siehe cache_image_format).
+
+    Args:
+        image (QImage): Zu speicherndes Bild
+        cache_file (str): Pfad der Cache-Datei (oder None)
+        limit (int): Maximale Gesamtgröße des Cache-Verzeichnisses in Bytes
+    """
+    if not cache_file:
+        return
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    if image.save(cache_file, None, 85):
+        trim_cache_dir(cache_dir, limit)
+
+def trim_cache_dir(cache_dir, limit):
+    """
+    Löscht die am längsten nicht genutzten Dateien, bis das Limit eingehalten ist.
+
+    Args:
+        cache_dir (str): Cache-Verzeichnis
+        limit (int): Maximale Gesamtgröße in Bytes
+    """
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                pass                                  # Gleichzeitig von anderem Thread gelöscht
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):         # Älteste zuerst
+        if total_size <= limit:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
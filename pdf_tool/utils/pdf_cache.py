@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PDF Tool - Dokument-Cache
+
+Hält geöffnete PyMuPDF-Dokumente für wiederholte Zugriffe bereit, damit
+dieselbe PDF von Seitenvorschau und Word-Vorschau nicht mehrfach geöffnet
+und geparst werden muss.
+
+Technische Details:
+- Schlüssel aus absolutem Pfad und Änderungszeitpunkt, geänderte
+  Dateien werden automatisch neu geöffnet
+- Beim Neuöffnen einer geänderten Datei werden ältere Stände derselben
+  Datei aus dem Cache entfernt und geschlossen
+- LRU-Verdrängung mit fester Obergrenze
+- Per LRU verdrängte Dokumente werden nicht explizit geschlossen, sondern
+  erst freigegeben, wenn kein Aufrufer mehr eine Referenz darauf hält
+- Gemeinsamer Lock für alle Zugriffe auf gecachte Dokumente, da sich
+  mehrere Widgets dasselbe Dokument teilen und PyMuPDF nicht threadsicher ist
+
+Verwendung:
+    from pdf_tool.utils.pdf_cache import get_doc, document_lock
+
+    doc = get_doc('dokument.pdf')
+    with document_lock:
+        page_count = doc.page_count
+
+Autor: Team A2-2
+"""
+
+import os
+import threading
+from collections import OrderedDict
+import fitz  # PyMuPDF
+
+# Maximale Anzahl gleichzeitig gecachter Dokumente
+DOC_CACHE_SIZE = 64
+
+_documents = OrderedDict()                # (Pfad, mtime) -> fitz.Document
+_lock = threading.Lock()                  # Schützt die Cache-Struktur
+
+# Serialisiert Zugriffe (Rendern, Seitengrößen, ...) auf die gecachten Dokumente
+document_lock = threading.Lock()
+
+def get_doc(pdf_path):
+    """
+    Liefert ein geöffnetes PyMuPDF-Dokument aus dem Cache.
+
+    Das Dokument darf vom Aufrufer nicht geschlossen werden. Zugriffe
+    darauf müssen mit document_lock synchronisiert werden, da dasselbe
+    Dokument auch von anderen Threads genutzt werden kann. Wurde die Datei
+    seit dem letzten Öffnen geändert, werden die älteren Stände geschlossen.
+
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+
+    Returns:
+        fitz.Document: Das geöffnete Dokument
+
+    Raises:
+        RuntimeError: Wenn die PDF nicht geöffnet werden kann
+    """
+    try:
+        key = (os.path.abspath(pdf_path), os.path.getmtime(pdf_path))
+        with _lock:
+            doc = _documents.get(key)
+            if doc is not None:
+                _documents.move_to_end(key)      # Als zuletzt genutzt markieren
+                return doc
+
+            doc = fitz.open(pdf_path)
+            # Ältere Stände derselben Datei werden nicht mehr angefordert
+            stale = [_documents.pop(old_key) for old_key in list(_documents)
+                     if old_key[0] == key[0]]
+            _documents[key] = doc
+            while len(_documents) > DOC_CACHE_SIZE:
+                _documents.popitem(last=False)   # Ältesten Eintrag verdrängen
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Öffnen der PDF: {e}")
+
+    # Erst nach laufenden Zugriffen schließen (außerhalb von _lock, damit
+    # Aufrufer, die document_lock halten, nicht auf den Cache warten)
+    if stale:
+        with document_lock:
+            for old_doc in stale:
+                old_doc.close()
+    return doc
@@ -34,6 +34,10 @@ Verwendung:
     # Bilder extrahieren
     images = extract_images_from_pdf('dokument.pdf', 'bilder/')
     
+    # Bilder schrittweise extrahieren
+    for image_path in extract_images_iter('dokument.pdf', 'bilder/'):
+        print(image_path)
+    
     # ZUGFeRD Daten lesen
     xml_data = extract_zugferd_data('rechnung.pdf')
 
@@ -41,15 +45,21 @@ Autor: Team A2-2
 """
 
 import os
+import atexit
+import multiprocessing
+import shutil
 import fitz  # PyMuPDF
 import zipfile
-from docx import Document
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
 from PyQt5.QtWidgets import (
     QFileDialog, QPushButton, QLabel, QLineEdit, QComboBox, 
     QDialogButtonBox, QBoxLayout
 )
 from PyQt5.QtCore import Qt
-from pdf2docx import Converter
+from PyQt5.QtGui import QImage, QPixmap
 import platform
 
 # Konfiguriere Standardpfade
@@ -57,6 +67,27 @@ SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__f
 SAMPLE_PDF_DIR = os.path.join(SCRIPT_DIR, "sample_pdf")
 EXPORT_DIR = os.path.join(SCRIPT_DIR, "export_folder")
 
+# Auflösung, mit der render_page bei Zoom 1.0 rendert
+# 300 DPI ist ein guter Standardwert für hochwertige Darstellung
+RENDER_DPI = 300
+
+# Ab dieser Seitenzahl werden Bildextraktion und Trennen auf mehrere
+# Prozesse verteilt
+PARALLEL_MIN_PAGES = 16
+
+# Anzahl der Threads, die beim Zusammenführen die Eingabedateien einlesen
+MERGE_READ_WORKERS = os.cpu_count() or 4
+
+# Anzahl der Prozesse, auf die pdf2docx große PDFs bei der Konvertierung verteilt
+WORD_WORKERS = 8
+
+# Mindestanzahl Seiten je pdf2docx-Prozess; darunter überwiegt der Startaufwand
+WORD_PAGES_PER_WORKER = 5
+
+# Anzahl der Prozesse beim Trennen (höchstens Anzahl CPU-Kerne); mehr
+# Prozesse bringen kaum Gewinn, da das Schreiben der Dateien dominiert
+SPLIT_WORKERS = 5
+
 # Stelle sicher, dass die Verzeichnisse existieren
 os.makedirs(SAMPLE_PDF_DIR, exist_ok=True)
 os.makedirs(EXPORT_DIR, exist_ok=True)
@@ -93,7 +124,7 @@ def load_pdf(pdf_path):
     except Exception as e:
         raise RuntimeError(f"Fehler beim Laden der PDF: {e}")
 
-def render_page(pdf_path, page_number, zoom_factor=1.0):
+def render_page(pdf_path, page_number, zoom_factor=1.0, alpha=False, colorspace=None, clip=None):
     """
     Rendert eine bestimmte Seite einer PDF mit angegebenem Zoom-Faktor.
     
@@ -102,9 +133,15 @@ def render_page(pdf_path, page_number, zoom_factor=1.0):
     Zoom-Faktor ermöglicht die Skalierung der Ausgabe.
     
     Args:
-        pdf_path (str): Pfad zur PDF-Datei
+        pdf_path (str | fitz.Document): Pfad zur PDF-Datei oder bereits
+            geöffnetes Dokument (wird dann nicht geschlossen)
         page_number (int): Nummer der zu rendernden Seite (0-basiert)
         zoom_factor (float): Zoom-Faktor für die Darstellung (Standard: 1.0)
+        alpha (bool): Ob ein Alphakanal erzeugt werden soll (Standard: False)
+        colorspace (fitz.Colorspace, optional): Farbraum der Ausgabe,
+            z.B. fitz.csGRAY für Graustufen (Standard: RGB)
+        clip (fitz.Rect | tuple, optional): Nur diesen Ausschnitt der Seite
+            rendern, in Seitenkoordinaten (Punkte bei Zoom 1.0)
         
     Returns:
         fitz.Pixmap: Das gerenderte Seitenbild
@@ -113,20 +150,170 @@ def render_page(pdf_path, page_number, zoom_factor=1.0):
         RuntimeError: Wenn die Seite nicht gerendert werden kann
     """
     try:
-        pdf_document = fitz.open(pdf_path)
+        pdf_document = _as_document(pdf_path)
         page = pdf_document[page_number]
-        # Erhöhe die Rendering-Qualität durch Anpassung der DPI
-        # 300 DPI ist ein guter Standardwert für hochwertige Darstellung
-        dpi = 300
         # Berechne die Matrix basierend auf DPI und Zoom-Faktor
-        matrix = fitz.Matrix(zoom_factor * dpi/72, zoom_factor * dpi/72)
+        matrix = fitz.Matrix(zoom_factor * RENDER_DPI/72, zoom_factor * RENDER_DPI/72)
         # Aktiviere Anti-Aliasing und höhere Qualität
-        pix = page.get_pixmap(matrix=matrix, alpha=False, annots=True)
-        pdf_document.close()
+        pix = page.get_pixmap(matrix=matrix, colorspace=colorspace or fitz.csRGB, alpha=alpha, annots=True,
+                              clip=clip)
+        if pdf_document is not pdf_path:
+            pdf_document.close()              # Nur selbst geöffnete Dokumente schließen
         return pix
     except Exception as e:
         raise RuntimeError(f"Fehler beim Rendern der Seite {page_number}: {e}")
 
+def pixmap_to_qpixmap(pix):
+    """
+    Wandelt ein PyMuPDF-Pixmap direkt in ein QPixmap um.
+    
+    Das QImage wird ohne Umweg über ein kodiertes Bildformat (z.B. PPM)
+    direkt auf dem Sample-Puffer erzeugt. Das Format richtet sich nach
+    Farbraum und Alphakanal des Pixmaps.
+    
+    Args:
+        pix (fitz.Pixmap): Das gerenderte Seitenbild
+        
+    Returns:
+        QPixmap: Das Bild für die Anzeige in Qt
+    """
+    samples = pix.samples_mv                # Speicheransicht ohne Kopie; pix bleibt bis fromImage gültig
+    qimg = QImage(samples, pix.width, pix.height, pix.stride, _qimage_format(pix))
+    return QPixmap.fromImage(qimg, Qt.NoFormatConversion)  # Ohne Formatumwandlung übernehmen
+
+def pixmap_to_qimage(pix, copy=True):
+    """
+    Wandelt ein PyMuPDF-Pixmap in ein eigenständiges QImage um.
+    
+    Im Gegensatz zu QPixmap darf ein QImage auch außerhalb des GUI-Threads
+    erzeugt und per Signal übergeben werden. Das Bild besitzt eine eigene
+    Kopie der Daten und bleibt daher auch nach Freigabe des Pixmaps gültig.
+    
+    Args:
+        pix (fitz.Pixmap): Das gerenderte Seitenbild
+        copy (bool): Ohne Kopie (False) liefert die Funktion nur eine Ansicht
+            auf den Sample-Puffer. Sie ist nur gültig, solange das Pixmap
+            lebt, und eignet sich für Bilder, die sofort weiterverarbeitet
+            (z.B. verkleinert) werden.
+        
+    Returns:
+        QImage: Das Bild mit eigenem Datenpuffer bzw. die Ansicht
+    """
+    samples = pix.samples_mv                # Speicheransicht ohne Zwischenkopie als bytes
+    qimg = QImage(samples, pix.width, pix.height, pix.stride, _qimage_format(pix))
+    return qimg.copy() if copy else qimg    # Kopie löst das Bild vom Sample-Puffer
+
+def render_page_to_qimage(pdf_path, page_number, zoom_factor=1.0, alpha=False, colorspace=None, clip=None):
+    """
+    Rendert eine Seite und liefert sie direkt als eigenständiges QImage.
+    
+    Das QImage wird aus dem Sample-Puffer des Pixmaps kopiert, ohne einen
+    zusätzlichen bytes-Puffer (z.B. PPM) anzulegen. Das Pixmap wird sofort
+    danach freigegeben, sodass nur das QImage im Speicher verbleibt.
+    
+    Args:
+        pdf_path (str | fitz.Document): Pfad zur PDF-Datei oder bereits
+            geöffnetes Dokument (wird dann nicht geschlossen)
+        page_number (int): Nummer der zu rendernden Seite (0-basiert)
+        zoom_factor (float): Zoom-Faktor für die Darstellung (Standard: 1.0)
+        alpha (bool): Ob ein Alphakanal erzeugt werden soll (Standard: False)
+        colorspace (fitz.Colorspace, optional): Farbraum der Ausgabe
+        clip (fitz.Rect | tuple, optional): Nur diesen Ausschnitt rendern
+        
+    Returns:
+        QImage: Das gerenderte Seitenbild
+        
+    Raises:
+        RuntimeError: Wenn die Seite nicht gerendert werden kann
+    """
+    pix = render_page(pdf_path, page_number, zoom_factor, alpha, colorspace, clip)
+    image = pixmap_to_qimage(pix)
+    del pix                                 # MuPDF-Puffer vor der Rückgabe freigeben
+    return image
+
+def _qimage_format(pix):
+    """Wählt das passende QImage-Format für Farbraum und Alphakanal eines Pixmaps."""
+    if pix.alpha:
+        # MuPDF liefert vormultiplizierte Farbwerte, Qt muss so nicht konvertieren
+        return QImage.Format_RGBA8888_Premultiplied
+    if pix.n == 1:
+        return QImage.Format_Grayscale8
+    return QImage.Format_RGB888
+
+def release_render_cache():
+    """
+    Gibt die von MuPDF zwischengespeicherten Ressourcen frei.
+    
+    MuPDF hält dekodierte Bilder, Schriften und Seiteninhalte in einem
+    globalen Speicher, der erst bei Erreichen seines Limits aufgeräumt
+    wird. Nach dem Schließen einer Vorschau wird er hiermit vollständig
+    geleert, damit der Speicherverbrauch nicht dauerhaft hoch bleibt.
+    """
+    fitz.TOOLS.store_shrink(100)            # 100% = alle freigebbaren Einträge
+
+def get_page_size(pdf_path, page_number=0):
+    """
+    Ermittelt die Größe einer PDF-Seite, ohne sie zu rendern.
+    
+    Liefert die Größe in Pixeln, die render_page bei Zoom-Faktor 1.0
+    erzeugen würde. Damit lässt sich ein passender Zoom-Faktor berechnen,
+    ohne die Seite vorher probeweise zu rastern.
+    
+    Args:
+        pdf_path (str | fitz.Document): Pfad zur PDF-Datei oder bereits
+            geöffnetes Dokument (wird dann nicht geschlossen)
+        page_number (int): Nummer der Seite (0-basiert)
+        
+    Returns:
+        tuple: (Breite, Höhe) in Pixeln bei Zoom 1.0
+        
+    Raises:
+        RuntimeError: Wenn die Seitengröße nicht ermittelt werden kann
+    """
+    try:
+        pdf_document = _as_document(pdf_path)
+        rect = pdf_document[page_number].rect
+        if pdf_document is not pdf_path:
+            pdf_document.close()              # Nur selbst geöffnete Dokumente schließen
+        return rect.width * RENDER_DPI / 72, rect.height * RENDER_DPI / 72
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Lesen der Seitengröße {page_number}: {e}")
+
+def get_page_sizes(pdf_path):
+    """
+    Ermittelt die Größen aller Seiten einer PDF, ohne sie zu rendern.
+    
+    Die Werte entsprechen get_page_size, das Dokument wird jedoch nur
+    einmal geöffnet.
+    
+    Args:
+        pdf_path (str | fitz.Document): Pfad zur PDF-Datei oder bereits
+            geöffnetes Dokument (wird dann nicht geschlossen)
+        
+    Returns:
+        list: Liste von (Breite, Höhe) in Pixeln bei Zoom 1.0 je Seite
+        
+    Raises:
+        RuntimeError: Wenn die Seitengrößen nicht ermittelt werden können
+    """
+    try:
+        pdf_document = _as_document(pdf_path)
+        sizes = [
+            (page.rect.width * RENDER_DPI / 72, page.rect.height * RENDER_DPI / 72)
+            for page in pdf_document
+        ]
+        if pdf_document is not pdf_path:
+            pdf_document.close()              # Nur selbst geöffnete Dokumente schließen
+        return sizes
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Lesen der Seitengrößen: {e}")
+
+def _as_document(pdf):
+    """Öffnet einen PDF-Pfad oder gibt ein bereits geöffnetes Dokument unverändert zurück."""
+    if isinstance(pdf, fitz.Document):
+        return pdf
+    return fitz.open(pdf)
+
 def show_pdf_open_dialog(parent, title="PDF auswählen"):
     """
     Zeigt einen nativen Dialog zum Öffnen von PDF-Dateien.
@@ -176,7 +363,7 @@ def clean_text(text):
     # Entferne NULL-Bytes und Steuerzeichen, behalte aber Zeilenumbrüche und Tabulatoren
     return ''.join(char for char in text if char in '\n\t\r' or (ord(char) >= 32 and ord(char) != 127))
 
-def pdf_to_word(pdf_path, output_path):
+def pdf_to_word(pdf_path, output_path, workers=None, pages=None):
     """
     Konvertiert eine PDF-Datei in ein Word-Dokument.
     
@@ -184,22 +371,86 @@ def pdf_to_word(pdf_path, output_path):
     Layout, Formatierung und eingebettete Elemente bestmöglich erhält. Die
     Funktion ist optimiert für komplexe PDF-Dokumente.
     
+    Größere PDFs werden von pdf2docx in zusammenhängende Seitenbereiche
+    aufgeteilt und in mehreren Prozessen analysiert, mit mindestens
+    WORD_PAGES_PER_WORKER Seiten je Prozess. Lassen sich die Prozesse nicht
+    starten (z.B. wenn der aufrufende Prozess keine Kindprozesse starten
+    darf), wird in einem Prozess konvertiert. Fehler der Konvertierung
+    selbst werden dagegen direkt gemeldet.
+    
     Args:
         pdf_path (str): Pfad zur PDF-Datei
         output_path (str): Pfad für das Word-Dokument (inkl. Dateiname)
+        workers (int, optional): Anzahl der Prozesse (Standard: WORD_WORKERS)
+        pages (list, optional): Nur diese Seiten konvertieren (0-basiert);
+            wird immer in einem Prozess konvertiert
         
     Raises:
         RuntimeError: Wenn die Konvertierung fehlschlägt
     """
     try:
+        # pdf2docx erst hier laden: zieht umfangreiche Abhängigkeiten nach sich,
+        # die beim Programmstart ohne Word-Export nicht gebraucht werden
+        from pdf2docx import Converter
+        
         # Konvertiere PDF zu Word mit pdf2docx
         cv = Converter(pdf_path)
-        cv.convert(output_path)
-        cv.close()
+        try:
+            # Seitenzahl aus dem vom Converter geöffneten Dokument (kein zweites Parsen);
+            # Bereichsgröße anpassen, damit jeder Prozess genug zu tun hat
+            page_count = len(cv.fitz_doc)
+            workers = min(workers or WORD_WORKERS, os.cpu_count() or 1,
+                          page_count // WORD_PAGES_PER_WORKER)
+            
+            pool_error = None
+            if pages is None and workers > 1:
+                try:
+                    cv.convert(output_path, multi_processing=True, cpu_count=workers)
+                    return
+                except (OSError, AssertionError) as e:
+                    # Prozesspool ließ sich nicht starten (AssertionError: Daemon-Prozess
+                    # ohne Kindprozesse); nur dann im Einzelprozess wiederholen
+                    pool_error = e
+            try:
+                cv.convert(output_path, pages=pages)
+            except Exception as e:
+                if pool_error is None:
+                    raise
+                raise RuntimeError(f"{e} (zuvor beim Start der Prozesse: {pool_error})")
+        finally:
+            cv.close()
     except Exception as e:
         raise RuntimeError(f"Fehler beim Umwandeln der PDF: {str(e)}")
 
-def split_pdf_into_pages(pdf_path, output_dir):
+def prewarm_pdf_to_word():
+    """
+    Lädt pdf2docx einmal in einem kurzlebigen Hintergrundprozess vor.
+    
+    Die Konvertierung läuft in einem eigenen Prozess, der pdf2docx samt
+    Abhängigkeiten (python-docx, fonttools, OpenCV, ...) jedes Mal neu
+    importiert. Ein Import im GUI-Prozess hilft daher nicht. Der Vorlauf
+    legt aber den Bytecode an und lädt die Bibliotheken in den
+    Dateisystem-Cache des Betriebssystems, sodass die erste Konvertierung
+    deutlich schneller startet.
+    
+    Returns:
+        multiprocessing.Process: Der gestartete Prozess (beendet sich selbst)
+    """
+    process = multiprocessing.get_context("spawn").Process(
+        target=_import_pdf2docx,
+        daemon=True                           # Hält das Programmende nicht auf
+    )
+    process.start()
+    return process
+
+def _import_pdf2docx():
+    """Importiert pdf2docx (Ziel des Vorwärm-Prozesses)."""
+    try:
+        from pdf2docx import Converter      # noqa: F401
+    except Exception:
+        pass                                  # Fehler zeigt erst die Konvertierung an
+
+def split_pdf_into_pages(pdf_path, output_dir, progress_cb=None, cancel_event=None):
     """
     Teilt eine PDF-Datei in einzelne Seiten auf.
     
@@ -210,6 +461,10 @@ def split_pdf_into_pages(pdf_path, output_dir):
     Args:
         pdf_path (str): Pfad zur PDF-Datei
         output_dir (str): Basisverzeichnis für die Ausgabe
+        progress_cb (callable, optional): Wird nach jeder gespeicherten Seite
+            mit (aktuell, gesamt) aufgerufen
+        cancel_event (threading.Event, optional): Bricht die Aufteilung ab,
+            sobald das Event gesetzt ist
         
     Returns:
         list: Liste der Pfade zu den erstellten Einzelseiten-PDFs
@@ -218,26 +473,119 @@ def split_pdf_into_pages(pdf_path, output_dir):
         RuntimeError: Wenn die Aufteilung fehlschlägt
     """
     try:
-        # Erstelle Zeitstempel-Verzeichnis
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_subdir = os.path.join(output_dir, timestamp)
-        os.makedirs(output_subdir, exist_ok=True)
-        
-        pdf_document = fitz.open(pdf_path)
-        total_pages = len(pdf_document)
-        page_files = []
+        output_subdir = _make_split_dir(output_dir)
+        return _split_page_range(pdf_path, output_subdir, 0, None, progress_cb, cancel_event)
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Trennen der PDF: {e}")
+
+def _make_split_dir(output_dir):
+    """Erstellt das Zeitstempel-Verzeichnis für die Einzelseiten."""
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output_subdir = os.path.join(output_dir, timestamp)
+    os.makedirs(output_subdir, exist_ok=True)
+    return output_subdir
+
+def _split_page_range(pdf_path, output_subdir, start, end, progress_cb=None, cancel_event=None):
+    """
+    Speichert die Seiten start bis end (exklusive) als einzelne PDF-Dateien.
+    
+    Wird auch in Worker-Prozessen von split_pdf_into_pages_parallel
+    ausgeführt; jeder Aufruf öffnet die Quelle daher selbst.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        output_subdir (str): Zielverzeichnis für die Einzelseiten
+        start (int): Erste Seite (0-basiert)
+        end (int | None): Seite nach der letzten, None für bis zum Ende
+        progress_cb (callable, optional): Wird nach jeder gespeicherten Seite
+            mit (aktuell, gesamt) aufgerufen
+        cancel_event (threading.Event, optional): Bricht nach der aktuellen
+            Seite ab, sobald das Event gesetzt ist (nur im selben Prozess)
         
-        for page_num in range(total_pages):
-            single_page_pdf = fitz.open()
-            single_page_pdf.insert_pdf(pdf_document, from_page=page_num, to_page=page_num)
+    Returns:
+        list: Liste der Pfade zu den erstellten Einzelseiten-PDFs
+    """
+    page_files = []
+    # Quelle nur einmal öffnen und parsen; beide Dokumente werden auch im Fehlerfall geschlossen
+    with fitz.open(pdf_path) as pdf_document:
+        end = len(pdf_document) if end is None else end
+        for page_num in range(start, end):
+            if cancel_event is not None and cancel_event.is_set():
+                break                           # Abbruch angefordert
             page_file = os.path.join(output_subdir, f"page_{page_num+1}.pdf")
-            single_page_pdf.save(page_file)
-            single_page_pdf.close()
+            with fitz.open() as single_page_pdf:
+                single_page_pdf.insert_pdf(pdf_document, from_page=page_num, to_page=page_num)
+                # Kopierte Objekte sind bereits minimal, kein Aufräumen nötig
+                data = single_page_pdf.tobytes(garbage=0, clean=False)
+            with open(page_file, "wb") as f:
+                f.write(data)                         # Ein Schreibaufruf statt vieler kleiner
             page_files.append(page_file)
-            
-        pdf_document.close()
-        return page_files
+            if progress_cb:
+                progress_cb(page_num + 1 - start, end - start)
+    return page_files
+
+def split_pdf_into_pages_parallel(pdf_path, output_dir, workers=None, progress_cb=None, cancel_event=None):
+    """
+    Teilt eine PDF-Datei parallel in mehreren Prozessen in einzelne Seiten auf.
+    
+    Die Seiten werden in zusammenhängenden Blöcken auf einen Prozess-Pool
+    verteilt; jeder Prozess öffnet die Quelle selbst, da PyMuPDF-Dokumente
+    nicht zwischen Threads oder Prozessen geteilt werden können. Ergebnis
+    und Benennung entsprechen split_pdf_into_pages. Für kleine PDFs (unter
+    PARALLEL_MIN_PAGES Seiten) wird die sequentielle Variante genutzt.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        output_dir (str): Basisverzeichnis für die Ausgabe
+        workers (int, optional): Anzahl der Prozesse (Standard: SPLIT_WORKERS)
+        progress_cb (callable, optional): Wird nach jedem Block mit
+            (fertige Seiten, Gesamtanzahl) aufgerufen
+        cancel_event (threading.Event, optional): Verhindert den Start weiterer
+            Blöcke, sobald das Event gesetzt ist
+        
+    Returns:
+        list: Liste der Pfade zu den erstellten Einzelseiten-PDFs
+        
+    Raises:
+        RuntimeError: Wenn die Aufteilung fehlschlägt
+    """
+    try:
+        with fitz.open(pdf_path) as pdf_document:
+            total_pages = len(pdf_document)
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Trennen der PDF: {e}")
+    
+    workers = min(workers or SPLIT_WORKERS, os.cpu_count() or 1)
+    if total_pages < PARALLEL_MIN_PAGES or workers < 2:
+        return split_pdf_into_pages(pdf_path, output_dir, progress_cb=progress_cb,
+                                    cancel_event=cancel_event)
+    
+    chunk = max(1, total_pages // (workers * 4))  # Mehrere Blöcke pro Prozess für gleichmäßige Last
+    ranges = [(start, min(start + chunk, total_pages)) for start in range(0, total_pages, chunk)]
+    
+    try:
+        output_subdir = _make_split_dir(output_dir)
+        results = {}
+        done_pages = 0
+        # "spawn", da ein Fork des laufenden Qt-Prozesses unsicher ist
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                executor.submit(_split_page_range, pdf_path, output_subdir, start, end): start
+                for start, end in ranges
+            }
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()        # Noch nicht gestartete Blöcke verwerfen
+                    break
+                results[futures[future]] = future.result()
+                done_pages += len(results[futures[future]])
+                if progress_cb:
+                    progress_cb(done_pages, total_pages)
+        
+        # Ergebnisse in der Seitenreihenfolge zusammenführen
+        return [path for start in sorted(results) for path in results[start]]
         
     except Exception as e:
         raise RuntimeError(f"Fehler beim Trennen der PDF: {e}")
@@ -265,27 +613,31 @@ def create_zip_from_files(file_list, zip_path):
     except Exception as e:
         raise RuntimeError(f"Fehler beim Erstellen des ZIP-Archivs: {e}")
 
-def extract_images_from_pdf(pdf_path, output_dir=None, preview_only=False):
+def extract_images_iter(pdf_path, output_dir=None, preview_only=False, progress_cb=None, cancel_event=None):
     """
-    Extrahiert Bilder aus einer PDF-Datei.
+    Extrahiert Bilder aus einer PDF-Datei schrittweise.
     
-    Identifiziert und extrahiert alle eingebetteten Bilder aus der PDF.
-    Die Bilder werden mit aussagekräftigen Namen versehen und optional
-    nur als Vorschau erstellt.
+    Arbeitet wie extract_images_from_pdf, liefert die Pfade aber als Generator
+    einzeln zurück, sobald das jeweilige Bild gespeichert wurde. Dadurch kann
+    die Vorschau bereits gefüllt werden, während die Extraktion noch läuft.
+    Mehrfach verwendete Bilder (gleiche xref, z.B. ein Logo auf jeder Seite)
+    werden nur beim ersten Auftreten extrahiert.
     
     Args:
         pdf_path (str): Pfad zur PDF-Datei
         output_dir (str, optional): Zielverzeichnis für die Bilder
         preview_only (bool): Wenn True, werden nur temporäre Vorschaubilder erstellt
+        progress_cb (callable, optional): Wird nach jedem Bild mit
+            (aktuelles Bild, Gesamtanzahl) aufgerufen
+        cancel_event (threading.Event, optional): Bricht die Extraktion ab,
+            sobald das Event gesetzt ist
         
-    Returns:
-        list: Liste der Pfade zu den extrahierten Bildern
+    Yields:
+        str: Pfad zum jeweils extrahierten Bild
         
     Raises:
         RuntimeError: Wenn die Bildextraktion fehlschlägt
     """
-    extracted_images = []
-    
     # Erstelle pdf_tool/temp Verzeichnis falls es nicht existiert
     base_temp_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "pdf_tool", "temp")
     if not os.path.exists(base_temp_dir):
@@ -299,40 +651,232 @@ def extract_images_from_pdf(pdf_path, output_dir=None, preview_only=False):
     
     try:
         doc = fitz.open(pdf_path)
-        
-        # Zähle zuerst die Gesamtanzahl der Bilder
-        total_images = sum(len(page.get_images(full=True)) for page in doc)
-        current_image = 0
-        
-        for page_num, page in enumerate(doc):
-            page_images = page.get_images(full=True)
-            for img_index, img in enumerate(page_images):
-                current_image += 1
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                image_ext = base_image["ext"]
-                
-                # Neues Benennungsschema
-                image_name = f"Bild_{current_image:02d}_von_{total_images:02d}_(S._{page_num + 1:02d}).{image_ext}"
-                image_path = os.path.join(temp_dir, image_name)
-                
-                with open(image_path, "wb") as img_file:
-                    img_file.write(image_bytes)
-                
-                extracted_images.append(image_path)
-                
-        doc.close()
-        return extracted_images
+        try:
+            # Zähle zuerst die Gesamtanzahl der (eindeutigen) Bilder
+            total_images = len({img[0] for page in doc for img in page.get_images(full=True)})
+            current_image = 0
+            seen_xrefs = set()                  # Bereits extrahierte Bildobjekte
+            
+            for page_num, page in enumerate(doc):
+                page_images = page.get_images(full=True)
+                for img_index, img in enumerate(page_images):
+                    if cancel_event is not None and cancel_event.is_set():
+                        return                  # Abbruch angefordert
+                    xref = img[0]
+                    if xref in seen_xrefs:      # Mehrfach verwendetes Bild überspringen
+                        continue
+                    seen_xrefs.add(xref)
+                    current_image += 1
+                    base_image = doc.extract_image(xref)
+                    image_bytes = base_image["image"]
+                    image_ext = base_image["ext"]
+                    
+                    # Neues Benennungsschema
+                    image_name = f"Bild_{current_image:02d}_von_{total_images:02d}_(S._{page_num + 1:02d}).{image_ext}"
+                    image_path = os.path.join(temp_dir, image_name)
+                    
+                    with open(image_path, "wb") as img_file:
+                        img_file.write(image_bytes)
+                    
+                    if progress_cb:
+                        progress_cb(current_image, total_images)
+                    yield image_path
+        finally:
+            doc.close()
         
     except Exception as e:
         raise RuntimeError(f"Fehler beim Extrahieren der Bilder: {e}")
     finally:
         if preview_only:
-            import atexit
-            import shutil
             atexit.register(lambda: shutil.rmtree(temp_dir, ignore_errors=True))
 
+def extract_images_from_pdf(pdf_path, output_dir=None, preview_only=False, progress_cb=None, cancel_event=None):
+    """
+    Extrahiert Bilder aus einer PDF-Datei.
+    
+    Identifiziert und extrahiert alle eingebetteten Bilder aus der PDF.
+    Die Bilder werden mit aussagekräftigen Namen versehen und optional
+    nur als Vorschau erstellt. Bilder, die auf mehreren Seiten verwendet
+    werden, werden nur einmal extrahiert; die Seitenangabe im Namen bezieht
+    sich auf das erste Vorkommen.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        output_dir (str, optional): Zielverzeichnis für die Bilder
+        preview_only (bool): Wenn True, werden nur temporäre Vorschaubilder erstellt
+        progress_cb (callable, optional): Wird nach jedem Bild mit
+            (aktuelles Bild, Gesamtanzahl) aufgerufen
+        cancel_event (threading.Event, optional): Bricht die Extraktion ab,
+            sobald das Event gesetzt ist
+        
+    Returns:
+        list: Liste der Pfade zu den extrahierten Bildern
+        
+    Raises:
+        RuntimeError: Wenn die Bildextraktion fehlschlägt
+    """
+    return list(extract_images_iter(pdf_path, output_dir, preview_only, progress_cb, cancel_event))
+
+def _extract_image_refs(pdf_path, image_refs, output_dir, total_images):
+    """
+    Extrahiert eine Teilmenge von Bildern in einem Worker-Prozess.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        image_refs (list): Liste von (Bildnummer, Seitennummer, xref)
+        output_dir (str): Zielverzeichnis für die Bilder
+        total_images (int): Gesamtanzahl der Bilder (für die Benennung)
+        
+    Returns:
+        list: Liste der Pfade zu den extrahierten Bildern
+    """
+    extracted_images = []
+    with fitz.open(pdf_path) as doc:            # Jeder Prozess öffnet die PDF selbst
+        for current_image, page_num, xref in image_refs:
+            base_image = doc.extract_image(xref)
+            image_name = f"Bild_{current_image:02d}_von_{total_images:02d}_(S._{page_num + 1:02d}).{base_image['ext']}"
+            image_path = os.path.join(output_dir, image_name)
+            with open(image_path, "wb") as img_file:
+                img_file.write(base_image["image"])
+            extracted_images.append(image_path)
+    return extracted_images
+
+def extract_images_from_pdf_parallel(pdf_path, output_dir, workers=None, progress_cb=None, cancel_event=None):
+    """
+    Extrahiert Bilder aus einer PDF-Datei parallel in mehreren Prozessen.
+    
+    Die eindeutigen Bildobjekte werden zunächst ohne Dekodierung gesammelt
+    und anschließend in Blöcken auf einen Prozess-Pool verteilt. Benennung
+    und Reihenfolge entsprechen extract_images_from_pdf. Für kleine PDFs
+    (unter PARALLEL_MIN_PAGES Seiten) wird die sequentielle Variante genutzt,
+    da sich der Start der Prozesse dort nicht lohnt.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        output_dir (str): Zielverzeichnis für die Bilder
+        workers (int, optional): Anzahl der Prozesse (Standard und Obergrenze:
+            Anzahl CPU-Kerne)
+        progress_cb (callable, optional): Wird nach jedem Block mit
+            (fertige Bilder, Gesamtanzahl) aufgerufen
+        cancel_event (threading.Event, optional): Verhindert den Start weiterer
+            Blöcke, sobald das Event gesetzt ist
+        
+    Returns:
+        list: Liste der Pfade zu den extrahierten Bildern
+        
+    Raises:
+        RuntimeError: Wenn die Bildextraktion fehlschlägt
+    """
+    try:
+        # Sammle alle eindeutigen Bildreferenzen
+        image_refs = []
+        seen_xrefs = set()
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+            for page_num, page in enumerate(doc):
+                for img in page.get_images(full=True):
+                    xref = img[0]
+                    if xref in seen_xrefs:
+                        continue
+                    seen_xrefs.add(xref)
+                    image_refs.append((len(image_refs) + 1, page_num, xref))
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Extrahieren der Bilder: {e}")
+    
+    workers = min(workers or os.cpu_count() or 1, os.cpu_count() or 1)
+    if page_count < PARALLEL_MIN_PAGES or len(image_refs) < 2 or workers < 2:
+        return extract_images_from_pdf(pdf_path, output_dir=output_dir,
+                                       progress_cb=progress_cb, cancel_event=cancel_event)
+    
+    total_images = len(image_refs)
+    chunk = max(1, total_images // (workers * 4))  # Mehrere Blöcke pro Prozess für gleichmäßige Last
+    chunks = [image_refs[i:i + chunk] for i in range(0, total_images, chunk)]
+    
+    try:
+        results = {}
+        done_images = 0
+        # "spawn", da ein Fork des laufenden Qt-Prozesses unsicher ist
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                executor.submit(_extract_image_refs, pdf_path, refs, output_dir, total_images): index
+                for index, refs in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()        # Noch nicht gestartete Blöcke verwerfen
+                    break
+                results[futures[future]] = future.result()
+                done_images += len(results[futures[future]])
+                if progress_cb:
+                    progress_cb(done_images, total_images)
+        
+        # Ergebnisse in der ursprünglichen Reihenfolge zusammenführen
+        return [path for index in sorted(results) for path in results[index]]
+        
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Extrahieren der Bilder: {e}")
+
+def extract_images_to_zip_stream(pdf_path, zip_path, progress_cb=None, cancel_event=None):
+    """
+    Schreibt alle Bilder einer PDF-Datei direkt in ein ZIP-Archiv.
+    
+    Die kodierten Bilddaten werden unverändert aus PyMuPDF in das Archiv
+    übernommen, ohne Umweg über temporäre Dateien. Da JPEG- und PNG-Daten
+    bereits komprimiert sind, werden sie ohne erneute Kompression gespeichert.
+    Mehrfach verwendete Bilder (gleiche xref) werden nur einmal abgelegt.
+    
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        zip_path (str): Pfad für das ZIP-Archiv
+        progress_cb (callable, optional): Wird nach jedem Bild mit
+            (aktuelles Bild, Gesamtanzahl) aufgerufen
+        cancel_event (threading.Event, optional): Bricht die Erstellung ab,
+            sobald das Event gesetzt ist; das unvollständige Archiv wird gelöscht
+        
+    Returns:
+        int: Anzahl der gespeicherten Bilder (0 = kein Archiv erstellt)
+        
+    Raises:
+        RuntimeError: Wenn die Bildextraktion oder ZIP-Erstellung fehlschlägt
+    """
+    try:
+        with fitz.open(pdf_path) as doc:
+            # Sammle zuerst alle Bildreferenzen, damit die Gesamtanzahl feststeht
+            image_refs = []
+            seen_xrefs = set()
+            for page_num, page in enumerate(doc):
+                for img in page.get_images(full=True):
+                    xref = img[0]
+                    if xref in seen_xrefs:
+                        continue
+                    seen_xrefs.add(xref)
+                    image_refs.append((page_num, xref))
+            
+            if not image_refs:
+                return 0
+            
+            total_images = len(image_refs)
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+                for current_image, (page_num, xref) in enumerate(image_refs, start=1):
+                    if cancel_event is not None and cancel_event.is_set():
+                        break                   # Abbruch angefordert
+                    base_image = doc.extract_image(xref)
+                    image_name = f"Bild_{current_image:02d}_von_{total_images:02d}_(S._{page_num + 1:02d}).{base_image['ext']}"
+                    zipf.writestr(image_name, base_image["image"])
+                    if progress_cb:
+                        progress_cb(current_image, total_images)
+            
+            if cancel_event is not None and cancel_event.is_set():
+                os.remove(zip_path)             # Unvollständiges Archiv entfernen
+                return 0
+            
+            return total_images
+            
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Erstellen des ZIP-Archivs: {e}")
+
 def extract_zugferd_data(pdf_path):
     """
     Extrahiert ZUGFeRD XML-Daten aus einer PDF/A-3 Datei.
@@ -380,7 +924,6 @@ def extract_zugferd_data(pdf_path):
                     
                 xml_found = True
                 
-                import xml.etree.ElementTree as ET
                 root = ET.fromstring(xml_string)
                 
                 # ZUGFeRD-Version ermitteln
@@ -487,7 +1030,7 @@ def extract_zugferd_data(pdf_path):
             except:
                 pass
 
-def merge_pdfs(pdf_paths, output_path):
+def merge_pdfs(pdf_paths, output_path, progress_cb=None, cancel_event=None):
     """
     Fügt mehrere PDF-Dateien zu einem Dokument zusammen.
     
@@ -495,23 +1038,58 @@ def merge_pdfs(pdf_paths, output_path):
     einer einzigen PDF-Datei. Die Funktion behält die Qualität der
     ursprünglichen PDFs bei.
     
+    Die Dateien werden von mehreren Threads parallel eingelesen, während
+    ein einzelner Schreiber sie in der ursprünglichen Reihenfolge in das
+    Zieldokument einfügt. PyMuPDF selbst wird so nur aus einem Thread
+    verwendet. Es werden höchstens so viele Dateien vorausgelesen, wie
+    Lese-Threads laufen, damit nicht alle Eingaben gleichzeitig im
+    Speicher liegen.
+    
     Args:
         pdf_paths (list): Liste der Pfade zu den PDF-Dateien
         output_path (str): Pfad für die zusammengefügte PDF
+        progress_cb (callable, optional): Wird nach jeder eingefügten PDF mit
+            (aktuell, gesamt) aufgerufen
+        cancel_event (threading.Event, optional): Bricht vor der nächsten PDF
+            ab, sobald das Event gesetzt ist; die Zieldatei wird dann nicht
+            geschrieben
         
     Raises:
         RuntimeError: Wenn das Zusammenfügen fehlschlägt
     """
     try:
         merged_pdf = fitz.open()
-        for pdf_path in pdf_paths:
-            with fitz.open(pdf_path) as pdf:
-                merged_pdf.insert_pdf(pdf)
-        merged_pdf.save(output_path)
+        total = len(pdf_paths)
+        workers = min(MERGE_READ_WORKERS, max(1, total))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Dateiinhalte parallel vorauslesen (Datei-I/O gibt den GIL frei),
+            # aber nur für die nächsten `workers` Dateien
+            reads = deque(executor.submit(_read_file, path) for path in pdf_paths[:workers])
+            for index in range(total):
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending in reads:
+                        pending.cancel()        # Noch nicht gestartete Lesevorgänge verwerfen
+                    merged_pdf.close()
+                    return
+                data = reads.popleft().result()
+                if index + workers < total:     # Nächste Datei nachladen
+                    reads.append(executor.submit(_read_file, pdf_paths[index + workers]))
+                with fitz.open(stream=data, filetype="pdf") as pdf:
+                    merged_pdf.insert_pdf(pdf)
+                del data                        # Eingelesene Datei sofort freigeben
+                if progress_cb:
+                    progress_cb(index + 1, total)
+        # Unbenutzte und doppelte Objekte entfernen, unkomprimierte Streams packen
+        merged_pdf.save(output_path, garbage=3, deflate=True)
         merged_pdf.close()
     except Exception as e:
         raise RuntimeError(f"Fehler beim Zusammenfügen der PDFs: {e}") 
 
+def _read_file(path):
+    """Liest eine Datei vollständig in den Speicher."""
+    with open(path, "rb") as f:
+        return f.read()
+
 def show_save_dialog(parent, title="Speicherort auswählen", default_name=None, file_type=None, use_export_dir=False):
     """
     Zeigt einen nativen Dialog zum Speichern von Dateien.
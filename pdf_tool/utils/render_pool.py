@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PDF Tool - Render-Prozesspool
+
+Rendert PDF-Seiten in separaten Prozessen. PyMuPDF gibt den GIL während
+des Renderns nicht frei, sodass mehrere Threads im GUI-Prozess sich
+gegenseitig blockieren würden. Die Worker-Prozesse liefern nur die rohen
+Pixeldaten zurück; das QImage wird im aufrufenden Prozess erzeugt.
+
+Technische Details:
+- Der Pool wird beim ersten Aufruf gestartet und beim Programmende beendet
+- Startmethode "spawn", da ein Fork des laufenden Qt-Prozesses unsicher ist
+- Jeder Worker hält seine geöffneten Dokumente im Dokument-Cache
+- Aufträge, die auf render_qimage warten, laufen in einem eigenen
+  Thread-Pool statt im globalen QThreadPool
+
+Verwendung:
+    from pdf_tool.utils.render_pool import render_qimage, get_render_thread_pool
+
+    # Blockiert bis zum Ergebnis, daher nicht im GUI-Thread aufrufen
+    image = render_qimage('dokument.pdf', 0, 190, 190)
+
+    # QRunnables, die render_qimage aufrufen
+    get_render_thread_pool().start(job)
+
+Autor: Team A2-2
+"""
+
+import os
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import fitz  # PyMuPDF
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtGui import QImage
+from .pdf_cache import get_doc
+from .pdf_functions import render_page, get_page_size
+
+_pool = None                              # Gemeinsamer Prozesspool
+_pool_lock = threading.Lock()             # Schützt die Erzeugung des Pools
+_thread_pool = None                       # Thread-Pool für wartende Aufträge
+
+def get_render_pool():
+    """
+    Liefert den gemeinsamen Prozesspool und startet ihn bei Bedarf.
+
+    Returns:
+        ProcessPoolExecutor: Der Pool mit einem Prozess pro CPU-Kern
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+def get_render_thread_pool():
+    """
+    Liefert den Thread-Pool für Aufträge, die render_qimage aufrufen.
+
+    Diese Threads warten während des Renderns nur auf den Prozesspool. In
+    einem eigenen Pool belegen sie keine Threads des globalen QThreadPool,
+    den z.B. die Seitenvorschau für ihre Render-Aufträge nutzt. Mehr
+    Threads als Worker-Prozesse würden nur in der Warteschlange des
+    Prozesspools stehen.
+
+    Returns:
+        QThreadPool: Der Pool mit einem Thread pro CPU-Kern
+    """
+    global _thread_pool
+    with _pool_lock:
+        if _thread_pool is None:
+            _thread_pool = QThreadPool()
+            _thread_pool.setMaxThreadCount(os.cpu_count() or 1)
+        return _thread_pool
+
+def render_rgb(pdf_path, page_number, max_width, max_height, gray=False):
+    """
+    Rendert eine Seite passend zur angegebenen Größe (im Worker-Prozess).
+
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        page_number (int): Nummer der Seite (0-basiert)
+        max_width (int): Maximale Breite des Bildes in Pixeln
+        max_height (int): Maximale Höhe des Bildes in Pixeln
+        gray (bool): Als Graustufenbild rendern (Standard: RGB)
+
+    Returns:
+        tuple: (Pixeldaten, Breite, Höhe, Zeilenlänge, Kanäle)
+    """
+    doc = get_doc(pdf_path)               # Dokument im Worker wiederverwenden
+    page_width, page_height = get_page_size(doc, page_number)  # Größe bei Zoom 1.0
+    zoom = min(max_width / page_width, max_height / page_height)
+    pix = render_page(doc, page_number, zoom, alpha=False,
+                      colorspace=fitz.csGRAY if gray else fitz.csRGB)
+    return bytes(pix.samples), pix.width, pix.height, pix.stride, pix.n
+
+def render_qimage(pdf_path, page_number, max_width, max_height, gray=False):
+    """
+    Rendert eine Seite im Prozesspool und wandelt sie in ein QImage um.
+
+    Blockiert bis das Ergebnis vorliegt und ist daher für Aufträge im Pool
+    von get_render_thread_pool gedacht. Das QImage besitzt eine eigene Kopie der Daten und kann per
+    Signal an den GUI-Thread übergeben werden.
+
+    Args:
+        pdf_path (str): Pfad zur PDF-Datei
+        page_number (int): Nummer der Seite (0-basiert)
+        max_width (int): Maximale Breite des Bildes in Pixeln
+        max_height (int): Maximale Höhe des Bildes in Pixeln
+        gray (bool): Als Graustufenbild rendern (Standard: RGB)
+
+    Returns:
+        QImage: Das gerenderte Seitenbild
+    """
+    future = get_render_pool().submit(render_rgb, pdf_path, page_number,
+                                      max_width, max_height, gray)
+    samples, width, height, stride, channels = future.result()
+    image_format = QImage.Format_Grayscale8 if channels == 1 else QImage.Format_RGB888
+    return QImage(samples, width, height, stride, image_format).copy()